@@ -8,10 +8,15 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.graph_objects as go
 import plotly.express as px
-from scripts import analysis
-from scripts import team_analysis
-from scripts import season_analysis
-from scripts import player_analysis
+from scripts import cache
+from scripts import filters
+
+# Query results are memoized across reruns (see scripts/cache.py). The modules are imported on the first
+# page that reads from them, so Home and Brief Description render without loading any data.
+analysis = cache.lazy_module('analysis')
+team_analysis = cache.lazy_module('team_analysis')
+season_analysis = cache.lazy_module('season_analysis')
+player_analysis = cache.lazy_module('player_analysis')
 
 st.set_page_config(layout="wide") 
 
@@ -581,7 +586,7 @@ elif selection1 == 'Team-wise Insights':
 
         col_left, col_right = st.columns(2)
         with col_left:
-            selected_team = st.selectbox("Select Team", options = analysis.total_teams)
+            selected_team = st.selectbox("Select Team", options = team_analysis.total_teams)
             st.write(f"You've selected: {selected_team}")
             if not selected_team:
                 st.warning("⚠️ Please select at least one option!")
@@ -606,9 +611,10 @@ elif selection1 == 'Team-wise Insights':
         st.markdown(f"<h3> Season(s): {selected_season} </h3>", unsafe_allow_html=True)
 
         # Fetch team highlights while handling missing data gracefully
-        batsman_stats = team_analysis.team_highlights_batsman(selected_team, selected_season)
-        bowler_stats = team_analysis.team_highlights_bowler(selected_team, selected_season)
-        general_stats = team_analysis.team_highlights_general(selected_team, selected_season)
+        highlights = team_analysis.team_highlights(selected_team, selected_season)
+        batsman_stats = highlights['batsman']
+        bowler_stats = highlights['bowler']
+        general_stats = highlights['general']
 
         # If any function returns None due to missing data, display a message instead of crashing
         # Check if all values in stats are zero
@@ -646,39 +652,48 @@ elif selection1 == 'Team-wise Insights':
             col1, col2, col3 = st.columns(3)
             with col1:
                 st.markdown('<h2 style="font-size:24px;">🏅 Most Player of the Match </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{team_analysis.pom(selected_team, selected_season).head(1)['Player of Match'][0]} ({team_analysis.pom(selected_team, selected_season).head(1)['Count'][0]})"), label_visibility = 'hidden')             
+                pom_df = highlights['pom'].head(1)
+                st.metric(label="12", value=(f"{pom_df['Player of Match'][0]} ({pom_df['Count'][0]})"), label_visibility = 'hidden')             
             with col2:
                 st.markdown('<h2 style="font-size:24px;">🏏 Leading Run Scorer </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{team_analysis.leading_run_scorer(selected_team, selected_season).head(1)['Batsman'][0]} ({team_analysis.leading_run_scorer(selected_team, selected_season).head(1)['Runs'][0]})"), label_visibility = 'hidden')
+                run_scorer_df = highlights['leading_run_scorer'].head(1)
+                st.metric(label="12", value=(f"{run_scorer_df['Batsman'][0]} ({run_scorer_df['Runs'][0]})"), label_visibility = 'hidden')
             with col3:
                 st.markdown('<h2 style="font-size:24px;">🎯 Leading Wicket Taker </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{team_analysis.leading_wicket_taker(selected_team, selected_season).head(1)['Bowler'][0]} ({team_analysis.leading_wicket_taker(selected_team, selected_season).head(1)['Wickets'][0]})"), label_visibility = 'hidden')
+                wicket_taker_df = highlights['leading_wicket_taker'].head(1)
+                st.metric(label="12", value=(f"{wicket_taker_df['Bowler'][0]} ({wicket_taker_df['Wickets'][0]})"), label_visibility = 'hidden')
 
             st.write('-------------------------------------')
 
             col1, col2, col3 = st.columns(3)
             with col1:
                 st.markdown('<h2 style="font-size:24px;">🏆 Highest Team Score </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{team_analysis.individual_team_score(selected_team, selected_season).head(1)['Runs'][0]} (Season- {team_analysis.individual_team_score(selected_team, selected_season).head(1)['Season'][0]})"), label_visibility = 'hidden')
+                team_score_df = highlights['individual_team_score'].head(1)
+                st.metric(label="12", value=(f"{team_score_df['Runs'][0]} (Season- {team_score_df['Season'][0]})"), label_visibility = 'hidden')
             with col2:
                 st.markdown('<h2 style="font-size:24px;">💥 Highest Individual Score </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{team_analysis.individual_score(selected_team, selected_season).head(1)['Runs'][0]} ({team_analysis.individual_score(selected_team, selected_season).head(1)['Batsman'][0]})"), label_visibility = 'hidden')
+                score_df = highlights['individual_score'].head(1)
+                st.metric(label="12", value=(f"{score_df['Runs'][0]} ({score_df['Batsman'][0]})"), label_visibility = 'hidden')
             with col3:
                 st.markdown('<h2 style="font-size:24px;">⚡ Best Bowling Figure </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{team_analysis.best_bowling_figure(selected_team, selected_season).head(1)['Wickets'][0]} - {team_analysis.best_bowling_figure(selected_team, selected_season).head(1)['Runs'][0]} ({team_analysis.best_bowling_figure(selected_team, selected_season).head(1)['Bowler'][0]})"), label_visibility = 'hidden')
+                bowling_figure_df = highlights['best_bowling_figure'].head(1)
+                st.metric(label="12", value=(f"{bowling_figure_df['Wickets'][0]} - {bowling_figure_df['Runs'][0]} ({bowling_figure_df['Bowler'][0]})"), label_visibility = 'hidden')
 
             st.write('-------------------------------------')
 
             col1, col2, col3 = st.columns(3)
             with col1:
                 st.markdown('<h2 style="font-size:24px;">🚀 Most Boundaries </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{team_analysis.boundaries(team_name=selected_team, boundary = None, seasons = selected_season).head(1)['Count'][0]} ({team_analysis.boundaries(team_name=selected_team, boundary = None, seasons = selected_season).head(1)['Batsman'][0]})"), label_visibility = 'hidden')
+                boundaries_df = highlights['boundaries'].head(1)
+                st.metric(label="12", value=(f"{boundaries_df['Count'][0]} ({boundaries_df['Batsman'][0]})"), label_visibility = 'hidden')
             with col2:
                 st.markdown('<h2 style="font-size:24px;">6️⃣ Most Sixes </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{team_analysis.boundaries(team_name=selected_team, boundary = 6, seasons = selected_season).head(1)['Count'][0]} ({team_analysis.boundaries(team_name=selected_team, boundary = 6, seasons = selected_season).head(1)['Batsman'][0]})"), label_visibility = 'hidden')
+                sixes_df = highlights['sixes'].head(1)
+                st.metric(label="12", value=(f"{sixes_df['Count'][0]} ({sixes_df['Batsman'][0]})"), label_visibility = 'hidden')
             with col3:
                 st.markdown('<h2 style="font-size:24px;">4️⃣ Most Fours </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{team_analysis.boundaries(team_name=selected_team, boundary = 4, seasons = selected_season).head(1)['Count'][0]} ({team_analysis.boundaries(team_name=selected_team, boundary = 4, seasons = selected_season).head(1)['Batsman'][0]})"), label_visibility = 'hidden')
+                fours_df = highlights['fours'].head(1)
+                st.metric(label="12", value=(f"{fours_df['Count'][0]} ({fours_df['Batsman'][0]})"), label_visibility = 'hidden')
 
             st.write('-------------------------------------')
 
@@ -686,7 +701,7 @@ elif selection1 == 'Team-wise Insights':
 
             with col1:
                 st.markdown('<h2 style="font-size:24px;"> 🤲 Most Catches </h2>', unsafe_allow_html=True)
-                catches_df = team_analysis.catches(team_name=selected_team, seasons=selected_season)
+                catches_df = highlights['catches']
                 if not catches_df.empty:
                     value = f"{catches_df.head(1)['Count'][0]} ({catches_df.head(1)['Fielder'][0]})"
                 else:
@@ -694,7 +709,7 @@ elif selection1 == 'Team-wise Insights':
                 st.metric(label="12", value=value, label_visibility='hidden')
             with col2:
                 st.markdown('<h2 style="font-size:24px;">🧤 Most Stumpings </h2>', unsafe_allow_html=True)
-                stumpings_df = team_analysis.stumpings(team_name=selected_team, seasons=selected_season)
+                stumpings_df = highlights['stumpings']
                 if not stumpings_df.empty:
                     value = f"{stumpings_df.head(1)['Count'][0]} ({stumpings_df.head(1)['Fielder'][0]})"
                 else:
@@ -702,7 +717,7 @@ elif selection1 == 'Team-wise Insights':
                 st.metric(label="12", value=value, label_visibility='hidden')
             with col3:
                 st.markdown('<h2 style="font-size:24px;">🔄 Most Run Outs </h2>', unsafe_allow_html=True)
-                runouts_df = team_analysis.runouts(team_name=selected_team, seasons=selected_season)
+                runouts_df = highlights['runouts']
                 if not runouts_df.empty:
                     value = f"{runouts_df.head(1)['Count'][0]} ({runouts_df.head(1)['Fielder'][0]})"
                 else:
@@ -713,7 +728,7 @@ elif selection1 == 'Team-wise Insights':
         
     if selection7 == 'Visualizations':
         st.markdown("<h3 style='text-align: center;'>IPL Season 2008-2024 Data</h3>", unsafe_allow_html=True)
-        insight_team = st.selectbox("Select Team", options = analysis.total_teams)
+        insight_team = st.selectbox("Select Team", options = team_analysis.total_teams)
         insight_type = st.radio("Select Option", ['General', 'Players', 'Rival Teams'], horizontal = True)
 
         if insight_type == 'General':
@@ -782,14 +797,14 @@ elif selection1 == 'Team-wise Insights':
             
             st.markdown(f"#### • Batsman Performance")
             df = team_analysis.team_batsman_performance(insight_team)
-            df = df.query("Matches >= 5")
+            df = df[df['Matches'] >= 5]
             fig93 = px.scatter(df, x = 'Batting Average', y = 'Strike Rate', color = 'Batsman', hover_data = ['Runs', 'Balls', 'Not Outs'])
             fig93.update_traces(marker = {'size': 18, 'opacity': 0.7})
             st.plotly_chart(fig93, key = 'chart93')
 
             st.markdown(f"#### • Bowler Performance")
             df = team_analysis.team_bowler_performance(insight_team)
-            df = df.query("Matches >= 5")
+            df = df[df['Matches'] >= 5]
             fig94 = px.scatter(df, x = 'Economy Rate', y = 'Bowling Average', color = 'Bowler', hover_data = ['Matches', 'Wickets', 'Balls', 'Runs Conceded'])
             fig94.update_traces(marker = {'size': 18, 'opacity': 0.7})
             st.plotly_chart(fig94, key = 'chart94')
@@ -845,7 +860,7 @@ elif selection1 == 'Team-wise Insights':
             st.table(team_analysis.team_rival_matches(insight_team, insight_season2))
 
             st.markdown(f"#### • Performance against Rival Teams by Match Type - Success Rate")
-            selected_rival_team = st.selectbox("Select Rival Team", options = analysis.total_teams)
+            selected_rival_team = st.selectbox("Select Rival Team", options = team_analysis.total_teams)
             st.table(team_analysis.team_rival_matchtype(insight_team, selected_rival_team, insight_season2))
             st.markdown(f"#### • Performance against Rival Teams - Summary")
             st.table(team_analysis.team_rival_performance(insight_team, selected_rival_team, insight_season2))
@@ -874,24 +889,27 @@ elif selection1 == 'Season-wise Insights':
         
         st.markdown(f"<h3> Season(s) - {selected_season1} </h3>", unsafe_allow_html=True)
 
-        st.markdown(f"### 🔥 **<span style='color:red;'>{season_analysis.season_total_matches(selected_season1)} matches</span> played for selected season(s)!** 🔥", unsafe_allow_html=True)
+        highlights1 = season_analysis.season_highlights(selected_season1)
+
+        st.markdown(f"### 🔥 **<span style='color:red;'>{highlights1['total_matches']} matches</span> played for selected season(s)!** 🔥", unsafe_allow_html=True)
 
-        log_value1 = np.log1p(season_analysis.season_match_type(selected_season1)['Matches'])
-        fig34 = px.bar(season_analysis.season_match_type(selected_season1), y='Match Type', x=log_value1, text='Matches', 
+        log_value1 = np.log1p(highlights1['match_type']['Matches'])
+        fig34 = px.bar(highlights1['match_type'], y='Match Type', x=log_value1, text='Matches', 
                     title="IPL Matches by Type", labels={'season_match_type': 'Number of Matches'},
                     color='Match Type', orientation = 'h')
         fig34.update_layout(xaxis = {'title': 'Match Count', 'showticklabels': False})
         st.plotly_chart(fig34, key="chart34")
 
-        st.markdown(f'<h1 style="font-size:32px; color:Red;">🏆 Participated Teams: {season_analysis.season_teams(selected_season1).nunique().values[0]}</h1>', unsafe_allow_html=True)
+        season_teams_df = highlights1['teams']
+        st.markdown(f'<h1 style="font-size:32px; color:Red;">🏆 Participated Teams: {season_teams_df.nunique().values[0]}</h1>', unsafe_allow_html=True)
 
-        st.table(season_analysis.season_teams(selected_season1))
+        st.table(season_teams_df)
 
         st.markdown("<h3> • Metrics </h3>", unsafe_allow_html=True)
 
-        batsman_stats1 = season_analysis.season_highlights_batsman(selected_season1)
-        bowler_stats1 = season_analysis.season_highlights_bowler(selected_season1)
-        general_stats1 = season_analysis.season_highlights_general(selected_season1)
+        batsman_stats1 = highlights1['batsman']
+        bowler_stats1 = highlights1['bowler']
+        general_stats1 = highlights1['general']
 
         if all(value == 0 for value in batsman_stats1) and all(value == 0 for value in bowler_stats1) and all(value == 0 for value in general_stats1):
             st.error(f"⚠️ No meaningful data available for {selected_season1} in season(s): {selected_season1}. All values are zero.")
@@ -923,43 +941,52 @@ elif selection1 == 'Season-wise Insights':
             st.write('-------------------------------------')
 
             col1, col2, col3 = st.columns(3)
-            pom_count = season_analysis.pom(selected_season1)['Count'].max()
-            pom_names = season_analysis.pom(selected_season1)['Player of Match'].values[0]
+            pom_df = highlights1['pom']
+            pom_count = pom_df['Count'].max()
+            pom_names = pom_df['Player of Match'].values[0]
             with col1:
                 st.markdown('<h2 style="font-size:24px;">🏅 Most Player of the Match </h2>', unsafe_allow_html=True)
                 st.metric(label="12", value=(f"{pom_names} ({pom_count})"), label_visibility = 'hidden')             
             with col2:
                 st.markdown('<h2 style="font-size:24px;">🏏 Leading Run Scorer </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{season_analysis.leading_run_scorer(selected_season1).head(1)['Batsman'][0]} ({season_analysis.leading_run_scorer(selected_season1).head(1)['Runs'][0]})"), label_visibility = 'hidden')
+                run_scorer_df = highlights1['leading_run_scorer'].head(1)
+                st.metric(label="12", value=(f"{run_scorer_df['Batsman'][0]} ({run_scorer_df['Runs'][0]})"), label_visibility = 'hidden')
             with col3:
                 st.markdown('<h2 style="font-size:24px;">🎯 Leading Wicket Taker </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{season_analysis.leading_wicket_taker(selected_season1).head(1)['Bowler'][0]} ({season_analysis.leading_wicket_taker(selected_season1).head(1)['Wickets'][0]})"), label_visibility = 'hidden')
+                wicket_taker_df = highlights1['leading_wicket_taker'].head(1)
+                st.metric(label="12", value=(f"{wicket_taker_df['Bowler'][0]} ({wicket_taker_df['Wickets'][0]})"), label_visibility = 'hidden')
 
             st.write('-------------------------------------')
 
             col1, col2, col3 = st.columns(3)
             with col1:
                 st.markdown('<h2 style="font-size:24px;">🏆 Highest Team Score </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{season_analysis.individual_team_score(selected_season1).head(1)['Runs'][0]} (Season- {season_analysis.individual_team_score(selected_season1).head(1)['Season'][0]})"), label_visibility = 'hidden')
+                team_score_df = highlights1['individual_team_score'].head(1)
+                st.metric(label="12", value=(f"{team_score_df['Runs'][0]} (Season- {team_score_df['Season'][0]})"), label_visibility = 'hidden')
             with col2:
                 st.markdown('<h2 style="font-size:24px;">💥 Highest Individual Score </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{season_analysis.individual_score(selected_season1).head(1)['Runs'][0]} ({season_analysis.individual_score(selected_season1).head(1)['Batsman'][0]})"), label_visibility = 'hidden')
+                score_df = highlights1['individual_score'].head(1)
+                st.metric(label="12", value=(f"{score_df['Runs'][0]} ({score_df['Batsman'][0]})"), label_visibility = 'hidden')
             with col3:
                 st.markdown('<h2 style="font-size:24px;">⚡ Best Bowling Figure </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{season_analysis.best_bowling_figure(selected_season1).head(1)['Wickets'][0]} - {season_analysis.best_bowling_figure(selected_season1).head(1)['Runs'][0]} ({season_analysis.best_bowling_figure(selected_season1).head(1)['Bowler'][0]})"), label_visibility = 'hidden')
+                bowling_figure_df = highlights1['best_bowling_figure'].head(1)
+                st.metric(label="12", value=(f"{bowling_figure_df['Wickets'][0]} - {bowling_figure_df['Runs'][0]} ({bowling_figure_df['Bowler'][0]})"), label_visibility = 'hidden')
 
             st.write('-------------------------------------')
 
             col1, col2, col3 = st.columns(3)
             with col1:
                 st.markdown('<h2 style="font-size:24px;">🚀 Most Boundaries </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{season_analysis.boundaries(boundary = None, seasons = selected_season1).head(1)['Count'][0]} ({season_analysis.boundaries(boundary = None, seasons = selected_season1).head(1)['Batsman'][0]})"), label_visibility = 'hidden')
+                boundaries_df = highlights1['boundaries'].head(1)
+                st.metric(label="12", value=(f"{boundaries_df['Count'][0]} ({boundaries_df['Batsman'][0]})"), label_visibility = 'hidden')
             with col2:
                 st.markdown('<h2 style="font-size:24px;">6️⃣ Most Sixes </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{season_analysis.boundaries(boundary = 6, seasons = selected_season1).head(1)['Count'][0]} ({season_analysis.boundaries(boundary = 6, seasons = selected_season1).head(1)['Batsman'][0]})"), label_visibility = 'hidden')
+                sixes_df = highlights1['sixes'].head(1)
+                st.metric(label="12", value=(f"{sixes_df['Count'][0]} ({sixes_df['Batsman'][0]})"), label_visibility = 'hidden')
             with col3:
                 st.markdown('<h2 style="font-size:24px;">4️⃣ Most Fours </h2>', unsafe_allow_html=True)
-                st.metric(label="12", value=(f"{season_analysis.boundaries(boundary = 4, seasons = selected_season1).head(1)['Count'][0]} ({season_analysis.boundaries(boundary = 4, seasons = selected_season1).head(1)['Batsman'][0]})"), label_visibility = 'hidden')
+                fours_df = highlights1['fours'].head(1)
+                st.metric(label="12", value=(f"{fours_df['Count'][0]} ({fours_df['Batsman'][0]})"), label_visibility = 'hidden')
 
             st.write('-------------------------------------')
 
@@ -967,7 +994,7 @@ elif selection1 == 'Season-wise Insights':
 
             with col1:
                 st.markdown('<h2 style="font-size:24px;"> 🤲 Most Catches </h2>', unsafe_allow_html=True)
-                catches_df = season_analysis.catches(seasons=selected_season1)
+                catches_df = highlights1['catches']
                 if not catches_df.empty:
                     value = f"{catches_df.head(1)['Count'][0]} ({catches_df.head(1)['Fielder'][0]})"
                 else:
@@ -975,7 +1002,7 @@ elif selection1 == 'Season-wise Insights':
                 st.metric(label="12", value=value, label_visibility='hidden')
             with col2:
                 st.markdown('<h2 style="font-size:24px;">🧤 Most Stumpings </h2>', unsafe_allow_html=True)
-                stumpings_df = season_analysis.stumpings(seasons=selected_season1)
+                stumpings_df = highlights1['stumpings']
                 if not stumpings_df.empty:
                     value = f"{stumpings_df.head(1)['Count'][0]} ({stumpings_df.head(1)['Fielder'][0]})"
                 else:
@@ -983,7 +1010,7 @@ elif selection1 == 'Season-wise Insights':
                 st.metric(label="12", value=value, label_visibility='hidden')
             with col3:
                 st.markdown('<h2 style="font-size:24px;">🔄 Most Run Outs </h2>', unsafe_allow_html=True)
-                runouts_df = season_analysis.runouts(seasons=selected_season1)
+                runouts_df = highlights1['runouts']
                 if not runouts_df.empty:
                     value = f"{runouts_df.head(1)['Count'][0]} ({runouts_df.head(1)['Fielder'][0]})"
                 else:
@@ -1258,8 +1285,8 @@ elif selection1 == 'Player-wise Insights':
 
     if selection9 == 'Batsman':
         st.markdown(f"### Batsman List:")
-        st.write(analysis.total_batsman_list)
-        player_selection = st.selectbox("Select Player", analysis.total_batsman_list)
+        st.write(player_analysis.total_batsman_list)
+        player_selection = st.selectbox("Select Player", player_analysis.total_batsman_list)
 
         stats_selection = st.radio("Select Option", ['Overall Performance', 'Season on Season', 'Performance against Teams', 'Bowler Face off'], horizontal = True)
 
@@ -1269,9 +1296,11 @@ elif selection1 == 'Player-wise Insights':
             st.table(player_analysis.player_teams(player_selection))
 
             st.markdown(f"#### • Overall Stats")
+            centuries = player_analysis.player_century(player_selection)['Runs'].count()
+            half_centuries = player_analysis.player_half_century(player_selection)['Runs'].count()
             player_df = player_analysis.batsman_overall_df[player_analysis.batsman_overall_df['Batsman'] == player_selection]
-            player_df['Centuries'] = player_analysis.player_century(player_selection)['Runs'].count()
-            player_df['Half Centuries'] = player_analysis.player_half_century(player_selection)['Runs'].count()
+            player_df['Centuries'] = centuries
+            player_df['Half Centuries'] = half_centuries
             player_df = player_df[['Batsman', 'Innings', 'Runs', 'Balls', 'Centuries', 'Half Centuries', 'Sixes', 'Fours', 'Threes', 'Twos', 'Ones', 'Dots', 'Dismissals', 'Not Outs', 'Strike Rate', 'Batting Average', 'Boundary Dominance', 'Dot Ball Reliance']]
             player_df.index = range(1, len(player_df)+1)
             st.table(player_df)
@@ -1282,7 +1311,8 @@ elif selection1 == 'Player-wise Insights':
             st.table(df)
 
             st.markdown(f"#### • Runs Scored by Match")
-            df = player_analysis.match_runs(player_selection)
+            match_runs_df = player_analysis.match_runs(player_selection)
+            df = match_runs_df.copy(deep = False)
             df['Match #'] = range(1, len(df) + 1) 
             fig59 = px.line(df, x = 'Match #', y = 'Runs', markers = True, hover_data = ['Balls', 'Batsman', 'Team', 'Season', 'Inning', 'Bowling Team', 'Sixes', 'Fours', 'Threes', 'Twos', 'Ones', 'Dots'])
             fig59.update_traces(marker = {'color': 'red'})
@@ -1291,19 +1321,19 @@ elif selection1 == 'Player-wise Insights':
 
             col1, col2, col3 = st.columns(3)
             with col1:
-                df = player_analysis.match_runs(player_selection)
+                df = match_runs_df
                 fig60 = px.histogram(df, x = 'Runs', color = 'Inning', text_auto = True, title = 'Distribution of Runs Scored by Innings')
                 fig60.update_layout(bargap = 0.05, yaxis = {'title': 'Count'})
                 st.plotly_chart(fig60, key = 'chart60')
             
             with col2:
-                df = player_analysis.match_runs(player_selection)
+                df = match_runs_df
                 fig61 = px.histogram(df, x = 'Sixes', color = 'Inning', text_auto = True, title = 'Distribution of Sixes Hit by Innings')
                 fig61.update_layout(bargap = 0.05, yaxis = {'title': 'Count'})
                 st.plotly_chart(fig61, key = 'chart61')
             
             with col3:
-                df = player_analysis.match_runs(player_selection)
+                df = match_runs_df
                 fig62 = px.histogram(df, x = 'Fours', color = 'Inning', text_auto = True, title = 'Distribution of Fours Hit by Innings')
                 fig62.update_layout(bargap = 0.05, yaxis = {'title': 'Count'})
                 st.plotly_chart(fig62, key = 'chart62')
@@ -1322,10 +1352,11 @@ elif selection1 == 'Player-wise Insights':
             col1, col2 = st.columns(2)
             with col1:
                 st.markdown(f"##### 100+ Impact Ratio" )
-                st.write(f"Century Count - {player_analysis.player_century(player_selection)['Runs'].count()}")
-                if player_analysis.player_century(player_selection)['Runs'].count() > 0:
-                    won_matches = player_analysis.century_win_cause(player_selection, century = True)['Won'].sum()
-                    lost_matches = player_analysis.century_win_cause(player_selection, century = True).shape[0] - won_matches
+                st.write(f"Century Count - {centuries}")
+                if centuries > 0:
+                    win_cause_df = player_analysis.century_win_cause(player_selection, century = True)
+                    won_matches = win_cause_df['Won'].sum()
+                    lost_matches = win_cause_df.shape[0] - won_matches
                     fig64 = px.pie(values = [won_matches, lost_matches], names = ['Matches Won', 'Matches Lost'])
                     fig64.update_traces(textinfo='label+percent', hovertemplate='%{label}: %{value} matches<br>Percentage: %{percent}')
                     st.plotly_chart(fig64, key = 'chart64')
@@ -1333,10 +1364,11 @@ elif selection1 == 'Player-wise Insights':
                     st.error("No Centuries by this player")
             with col2:
                 st.markdown(f"##### 50+ Impact Ratio" )
-                st.write(f"Half Century Count - {player_analysis.player_half_century(player_selection)['Runs'].count()}")
-                if player_analysis.player_half_century(player_selection)['Runs'].count() > 0:
-                    won_matches = player_analysis.century_win_cause(player_selection, century = False)['Won'].sum()
-                    lost_matches = player_analysis.century_win_cause(player_selection, century = False).shape[0] - won_matches
+                st.write(f"Half Century Count - {half_centuries}")
+                if half_centuries > 0:
+                    win_cause_df = player_analysis.century_win_cause(player_selection, century = False)
+                    won_matches = win_cause_df['Won'].sum()
+                    lost_matches = win_cause_df.shape[0] - won_matches
                     fig65 = px.pie(values = [won_matches, lost_matches], names = ['Matches Won', 'Matches Lost'])
                     fig65.update_traces(textinfo='label+percent', hovertemplate='%{label}: %{value} matches<br>Percentage: %{percent}')
                     st.plotly_chart(fig65, key = 'chart65')
@@ -1363,7 +1395,7 @@ elif selection1 == 'Player-wise Insights':
             st.markdown(f"#### • Season-wise Runs Scored - Breakdown by Innings")
             df = (
                 player_analysis.match_runs(player_selection)
-                .groupby(by = ['Batsman', 'Season', 'Inning'], as_index = False)
+                .groupby(by = ['Batsman', 'Season', 'Inning'], as_index = False, observed = True)
                 .agg(Runs = ('Runs', 'sum'))
             )
             df['Inning'] = df['Inning'].astype('category')
@@ -1378,10 +1410,11 @@ elif selection1 == 'Player-wise Insights':
 
         elif stats_selection == 'Performance against Teams':
             st.markdown(f"### {player_selection} - {stats_selection}")
+            match_runs_df = player_analysis.match_runs(player_selection)
             st.markdown(f"#### • Runs Scored against Teams")
             df = (
-                player_analysis.match_runs(player_selection)
-                .groupby(by = ['Batsman', 'Bowling Team'], as_index = False)
+                match_runs_df
+                .groupby(by = ['Batsman', 'Bowling Team'], as_index = False, observed = True)
                 .agg(Runs = ('Runs', 'sum'), Innings = ('Match ID', 'nunique'))
             )
             fig70 = px.bar(df, x = 'Bowling Team', y = 'Runs', color = 'Bowling Team', text_auto = True, hover_data = ['Batsman', 'Innings'])
@@ -1389,15 +1422,15 @@ elif selection1 == 'Player-wise Insights':
 
             st.markdown(f"#### • Runs Scored against Teams by Innings")
             df = (
-                player_analysis.match_runs(player_selection)
-                .groupby(by = ['Batsman', 'Bowling Team', 'Inning'], as_index = False)
+                match_runs_df
+                .groupby(by = ['Batsman', 'Bowling Team', 'Inning'], as_index = False, observed = True)
                 .agg(Runs = ('Runs', 'sum'), Innings = ('Match ID', 'nunique'))
             )
             df['Inning'] = df['Inning'].astype('category')
             fig71 = px.bar(df, x = 'Bowling Team', y = 'Runs', color = 'Inning', text_auto = True, hover_data = ['Batsman', 'Innings'])
             st.plotly_chart(fig71, key = 'chart71')
 
-            rival_team_selection1 = st.selectbox("Select team for visualizing player performance against the team", analysis.total_teams['Team'])
+            rival_team_selection1 = st.selectbox("Select team for visualizing player performance against the team", player_analysis.total_teams['Team'])
 
             st.markdown(f"#### • Performance Metrics of {player_selection} against {rival_team_selection1}")
             df = player_analysis.batsman_against_team(player_selection, rival_team_selection1)
@@ -1407,7 +1440,8 @@ elif selection1 == 'Player-wise Insights':
             else:
                 st.table(df)
 
-                df = player_analysis.match_runs(player_selection).query(f"`Bowling Team` == '{rival_team_selection1}'")
+                rival_runs_df = match_runs_df[match_runs_df['Bowling Team'] == rival_team_selection1]
+                df = rival_runs_df.copy(deep = False)
                 df['Match #'] = range(1, len(df) + 1) 
                 st.markdown(f"#### • Match-wise Runs Scored against {rival_team_selection1}")
                 fig72 = px.line(df, x = 'Match #', y = 'Runs', markers = True, hover_data = ['Balls', 'Batsman', 'Team', 'Season', 'Inning', 'Bowling Team', 'Sixes', 'Fours', 'Threes', 'Twos', 'Ones', 'Dots'])
@@ -1416,7 +1450,7 @@ elif selection1 == 'Player-wise Insights':
                 st.plotly_chart(fig72, key = 'chart72')
 
                 col1, col2, col3 = st.columns(3)
-                df = player_analysis.match_runs(player_selection).query(f"`Bowling Team` == '{rival_team_selection1}'")
+                df = rival_runs_df
                 with col1:
                     fig73 = px.histogram(df, x = 'Runs', color = 'Inning', text_auto = True, title = 'Distribution of Runs Scored by Innings')
                     fig73.update_layout(bargap = 0.05, yaxis = {'title': 'Count'})
@@ -1435,7 +1469,7 @@ elif selection1 == 'Player-wise Insights':
         elif stats_selection == 'Bowler Face off':
             st.markdown(f"### {player_selection} - {stats_selection}")
             st.markdown(f"#### • Dismissal Type")
-            edition = st.selectbox("Select season of your choice", ['All'] + sorted(analysis.matches['season'].unique().tolist()))
+            edition = st.selectbox("Select season of your choice", ['All'] + player_analysis.total_seasons_list)
             fig76 = px.bar(player_analysis.player_dismissal_type(player_selection, edition), x = 'Count', y = 'Dismissal Kind', orientation='h', title=f" {player_selection} Dismissal Types", color='Dismissal Kind', text_auto = True)
             st.plotly_chart(fig76, key = 'chart76')
 
@@ -1455,7 +1489,7 @@ elif selection1 == 'Player-wise Insights':
             df.index = range(1, len(df)+1)
             if not df.empty:
             # st.table(df)
-                rival_bowler_df = df.query(f"Bowler == '{rival_bowler}'")
+                rival_bowler_df = filters.select(df, Bowler = rival_bowler)
                 balls = rival_bowler_df['Balls']
                 runs = rival_bowler_df['Runs']
                 dismissals = rival_bowler_df['Dismissals']
@@ -1530,9 +1564,9 @@ elif selection1 == 'Player-wise Insights':
 
     if selection9 == 'Bowler':
         st.markdown(f"### Bowler List:")
-        st.write(analysis.total_bowlers_list)
+        st.write(player_analysis.total_bowlers_list)
 
-        bowler_selection = st.selectbox("Select Player", analysis.total_bowlers_list)
+        bowler_selection = st.selectbox("Select Player", player_analysis.total_bowlers_list)
         stats_selection_bowler = st.radio("Select Option", ['Overall Performance', 'Season on Season', 'Performance against Teams'], horizontal = True)
 
         if stats_selection_bowler == 'Overall Performance':
@@ -1541,7 +1575,7 @@ elif selection1 == 'Player-wise Insights':
             st.table(player_analysis.bowler_teams(bowler_selection))
 
             st.markdown(f"#### • Overall Stats")
-            df = analysis.bowler_stats.query(f"Bowler == '{bowler_selection}'")
+            df = filters.select(analysis.bowler_stats, Bowler = bowler_selection)
             df = df[['Bowler','Matches','Wickets','Balls','Overs','Runs Conceded','Dot Balls','Economy Rate','Bowling Average','Strike Rate','Wicket per Match','Boundary Rate','Dot Ball %','Sixes Conceded','Fours Conceded','Threes Conceded','Twos Conceded','Ones Conceded','Extras Conceded']]
             df['Boundary Rate'] = round(df['Boundary Rate']*100, 4)
             df = df.rename(columns = {'Sixes Conceded': '6s Conceded', 'Fours Conceded': '4s Conceded', 'Threes Conceded': '3s Conceded', 'Twos Conceded': '2s Conceded', 'Ones Conceded': '1s Conceded', 'Extras Conceded': 'Extra Runs', 'Boundary Rate': 'Boundary %'})
@@ -1554,29 +1588,23 @@ elif selection1 == 'Player-wise Insights':
             st.table(df)
 
             st.markdown(f"#### • Wickets by Match")
-            df = player_analysis.bowler_stats_overall.query(f"bowler == '{bowler_selection}'")
+            spells_df = filters.select(player_analysis.bowler_stats_overall, bowler = bowler_selection)
+            df = spells_df.copy(deep = False)
             df['Match #'] = range(1, len(df) + 1) 
             fig79 = px.line(df, x = 'Match #', y = 'wickets', markers = True, hover_data = ['balls', 'bowler', 'bowling_team', 'season', 'inning', 'batting_team', 'runs_conceded', 'economy_rate','bowling_average', 'strike_rate', 'dot_ball_percent'])
             fig79.update_traces(marker = {'color': 'red'})
             fig79.update_layout(xaxis = {'title': 'Matches'}, yaxis = {'title': 'Wickets'})
             st.plotly_chart(fig79, key = 'chart59')
 
-            df = player_analysis.bowler_stats_overall.query(f"bowler == '{bowler_selection}'")
+            df = spells_df
             fig80 = px.histogram(df, x = 'wickets', color = 'inning', text_auto = True, title = 'Distribution of Wickets by Innings')
             fig80.update_layout(bargap = 0.05, yaxis = {'title': 'Count'})
             st.plotly_chart(fig80, key = 'chart80')
 
             st.markdown(f"#### • Top 'N' Performances" )
-            df = player_analysis.bowler_stats_overall.query(f"bowler == '{bowler_selection}'")
-            df = df.sort_values(by = ['wickets', 'runs_conceded'], ascending = [False, True], ignore_index = True)
+            df = spells_df.sort_values(by = ['wickets', 'runs_conceded'], ascending = [False, True], ignore_index = True)
             df.index = range(1, len(df)+1)
-            max_value_wickets = (
-                player_analysis.bowler_stats_overall
-                .groupby(by = 'bowler', as_index = False)
-                .agg(Wickets = ('wickets', 'sum'))
-                .query(f"bowler == '{bowler_selection}'")
-                ['Wickets'].max()
-                )
+            max_value_wickets = spells_df['wickets'].sum()
             slider_top_wickets = st.slider('Slide and select value', min_value = 0, max_value = max_value_wickets)
             fig81 = px.line(df.head(slider_top_wickets), y = 'wickets', markers = True, hover_data = ['runs_conceded'])
             fig81.update_traces(marker = {'color': 'red'})
@@ -1619,10 +1647,10 @@ elif selection1 == 'Player-wise Insights':
             fig86 = px.bar(player_analysis.bowler_stats_teams(bowler_selection), x = 'Rival Team', y = 'Wickets', color='Rival Team', text_auto = True, hover_data = ['Matches', 'Overs', 'Runs Conceded', 'Economy Rate', 'Bowling Average', 'Strike Rate'])
             st.plotly_chart(fig86, key = 'chart86')
 
-            rival_team_choice = st.selectbox("Select any Rival Team", analysis.total_teams['Team'])
+            rival_team_choice = st.selectbox("Select any Rival Team", player_analysis.total_teams['Team'])
 
             st.markdown(f"#### • Performance Metrics of '{bowler_selection}' against '{rival_team_choice}'")
-            df = player_analysis.bowler_stats_teams(bowler_selection).query(f"`Rival Team` == '{rival_team_choice}'")
+            df = filters.select(player_analysis.bowler_stats_teams(bowler_selection), **{'Rival Team': rival_team_choice})
             df.index = range(1, len(df)+1)
             if df.empty:
                 st.warning("No match data available for this player against the selected team.")
@@ -1632,7 +1660,7 @@ elif selection1 == 'Player-wise Insights':
             st.markdown(f"#### • Performance Metrics of '{bowler_selection}' against '{rival_team_choice}' - Breakdown by Season")
             seasons = ['2008', '2009', '2010', '2011', '2012', '2013', '2014', '2015', '2016', '2017', '2018', '2019', '2020', '2021', '2022', '2023', '2024']
             season_choice = st.selectbox("Select any Season", options = seasons)
-            df = player_analysis.bowler_stats_teams_season(bowler_selection, rival_team_choice).query(f"Season == '{season_choice}'")
+            df = filters.select(player_analysis.bowler_stats_teams_season(bowler_selection, rival_team_choice), Season = season_choice)
             df.index = range(1, len(df)+1)
             if df.empty:
                 st.warning("No match data available for this player against the selected team or season.")
@@ -1640,16 +1668,16 @@ elif selection1 == 'Player-wise Insights':
                 st.table(df)
 
             st.markdown(f"#### • Match-wise Wickets taken by '{bowler_selection}' against '{rival_team_choice}'")
-            df = player_analysis.bowler_stats_overall.query(f"bowler == '{bowler_selection}' & batting_team == '{rival_team_choice}'")
-            df.index = range(1, len(df)+1)
+            rival_spells_df = filters.select(player_analysis.bowler_stats_overall, bowler = bowler_selection, batting_team = rival_team_choice)
+            rival_spells_df.index = range(1, len(rival_spells_df)+1)
+            df = rival_spells_df
             fig87 = px.line(df, y = 'wickets', color = 'inning', color_discrete_sequence = ['red', 'skyblue'], markers = True, hover_data = 'season', labels = {'inning': 'Inning'})
             fig87.update_traces(marker = {'size': 8, 'color': 'blue'})
             fig87.update_layout(xaxis = {'title': 'Matches'}, yaxis =  {'title': 'Wickets'})
             st.plotly_chart(fig87, key = 'chart87') 
 
             st.markdown(f"#### • Distribution of Wickets taken by '{bowler_selection}' against '{rival_team_choice}'")
-            df = player_analysis.bowler_stats_overall.query(f"bowler == '{bowler_selection}' & batting_team == '{rival_team_choice}'")
-            df.index = range(1, len(df)+1)
+            df = rival_spells_df
             fig88 = px.histogram(df, x = 'wickets', color = 'inning', text_auto = True, title = 'Distribution of Wickets by Innings')
             fig88.update_layout(bargap = 0.05, yaxis = {'title': 'Count'})
             st.plotly_chart(fig88, key = 'chart88')
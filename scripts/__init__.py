@@ -1,4 +1,10 @@
-from . import analysis
-from . import player_analysis
-from . import team_analysis
-from . import season_analysis
\ No newline at end of file
+import importlib
+
+# Analysis modules load their datasets at import time, so they are only imported on first access.
+# This keeps the data tooling (scripts.ingest, scripts.convert) runnable before any processed data exists.
+_MODULES = ['analysis', 'player_analysis', 'team_analysis', 'season_analysis']
+
+def __getattr__(name):
+    if name in _MODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,167 @@
+import pandas as pd
+from functools import lru_cache
+from scripts import datasets
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Additive aggregates
+# Every measure here can be summed across disjoint sets of matches (a batsman's innings count, for example,
+# is the number of distinct matches batted in). A new match is therefore folded into a stored table by
+# aggregating only its deliveries and adding the result, without touching the seasons already played.
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Run distribution
+# The count of each run value per group is the sum of a boolean indicator column, so the whole distribution
+# comes out of one groupby on the cython path instead of one Python callable per group and run value.
+RUN_VALUES = {'Sixes': 6, 'Fours': 4, 'Threes': 3, 'Twos': 2, 'Ones': 1, 'Dots': 0}
+
+def run_distribution(df, by, column = 'batsman_runs', values = RUN_VALUES, **aggregations):
+    return (
+        df
+        .assign(**{name: df[column] == value for name, value in values.items()})
+        .groupby(by = by, as_index = False, observed = True)
+        .agg(**aggregations, **{name: (name, 'sum') for name in values})
+    )
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+
+def batter_seasons(fact):
+    return run_distribution(
+        fact, ['season', 'batter'],
+        Runs = ('batsman_runs', 'sum'),
+        Balls = ('batsman_runs', 'count'),
+        innings = ('id', 'nunique')
+    )
+
+def dismissal_seasons(fact):
+    return (
+        fact
+        .groupby(by = ['season', 'player_dismissed'], as_index = False, observed = True)
+        .agg(dismissals = ('is_wicket', 'sum'))
+    )
+
+BATTER_INNINGS_KEYS = ['batter', 'id', 'season', 'inning', 'batting_team', 'bowling_team', 'winner']
+
+# One row per batter innings
+def batter_innings(fact):
+    return (
+        run_distribution(
+            fact.assign(Dismissals = lambda df_: df_['player_dismissed'] == df_['batter']),
+            BATTER_INNINGS_KEYS,
+            Runs = ('batsman_runs', 'sum'),
+            Balls = ('batsman_runs', 'count'),
+            Dismissals = ('Dismissals', 'sum')
+        )
+        .astype({'Runs': 'int'})
+    )
+
+BOWLER_SPELL_KEYS = ['bowler', 'season', 'id', 'inning', 'bowling_team', 'batting_team']
+
+# Dismissals credited to the bowler; run outs, retirements and obstructions are not
+BOWLER_DISMISSAL_KINDS = ['bowled', 'lbw', 'stumped', 'caught and bowled', 'caught', 'hit wicket']
+
+CONCEDED_RUN_VALUES = {'count_six_conceded': 6, 'count_four_conceded': 4, 'count_three_conceded': 3,
+                       'count_two_conceded': 2, 'count_one_conceded': 1}
+
+# One row per bowler spell (a bowler's deliveries in one inning of a match)
+def bowler_spells(fact):
+    return (
+        run_distribution(
+            fact.assign(
+                wickets = lambda df_: (df_['is_wicket'] == 1) & df_['dismissal_kind'].isin(BOWLER_DISMISSAL_KINDS),
+                dot_balls = lambda df_: df_['total_runs'] == 0
+            ),
+            BOWLER_SPELL_KEYS, values = CONCEDED_RUN_VALUES,
+            wickets = ('wickets', 'sum'),
+            balls = ('total_runs', 'count'),
+            runs_conceded = ('total_runs', 'sum'),
+            dot_balls = ('dot_balls', 'sum'),
+            count_extra_runs = ('extra_runs', 'sum')
+        )
+        .astype({'runs_conceded': 'int', 'count_extra_runs': 'int'})
+    )
+
+SEASON_CUBE_KEYS = ['season', 'inning', 'batting_team', 'bowling_team', 'batter', 'bowler']
+
+SEASON_CUBE_RUN_VALUES = {'fours': 4, 'sixes': 6, 'dots': 0}
+
+# One row per batter and bowler facing each other in an inning of a season. Selecting a set of seasons and
+# summing over the remaining keys answers the run, boundary and wicket leaderboards of the season and team pages.
+# matches counts the matches of a cell, so it may be summed across seasons but not across players or teams.
+def season_cube(fact):
+    return (
+        run_distribution(
+            fact.assign(
+                wickets = lambda df_: (df_['is_wicket'] == 1) & df_['dismissal_kind'].isin(BOWLER_DISMISSAL_KINDS),
+                dismissals = lambda df_: df_['player_dismissed'] == df_['batter']
+            ),
+            SEASON_CUBE_KEYS, values = SEASON_CUBE_RUN_VALUES,
+            runs = ('batsman_runs', 'sum'),
+            balls = ('batsman_runs', 'count'),
+            extras = ('extra_runs', 'sum'),
+            wickets = ('wickets', 'sum'),
+            dismissals = ('dismissals', 'sum'),
+            matches = ('id', 'nunique')
+        )
+        .astype({'runs': 'int', 'extras': 'int'})
+    )
+
+def team_seasons(matches):
+    return (
+        pd.concat([
+            matches[['season', 'team1', 'id']].rename(columns = {'team1': 'team'}),
+            matches[['season', 'team2', 'id']].rename(columns = {'team2': 'team'})
+        ])
+        .groupby(by = ['team', 'season'], as_index = False, observed = True)
+        .agg(matches = ('id', 'nunique'))
+    )
+
+# name: (builder, source frame, key columns)
+AGGREGATES = {
+    'batter_seasons': (batter_seasons, 'fact', ['season', 'batter']),
+    'dismissal_seasons': (dismissal_seasons, 'fact', ['season', 'player_dismissed']),
+    'batter_innings': (batter_innings, 'fact', BATTER_INNINGS_KEYS),
+    'bowler_spells': (bowler_spells, 'fact', BOWLER_SPELL_KEYS),
+    'season_cube': (season_cube, 'fact', SEASON_CUBE_KEYS),
+    'team_seasons': (team_seasons, 'matches', ['team', 'season'])
+}
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Build and update
+# A match must not be split across two calls of compute, otherwise its distinct counts are added twice.
+def compute(fact = None, matches = None):
+    sources = {'fact': fact, 'matches': matches}
+    return {
+        name: builder(sources[source])
+        for name, (builder, source, keys) in AGGREGATES.items()
+        if sources[source] is not None
+    }
+
+def combine(*parts):
+    combined = {}
+    for name, (builder, source, keys) in AGGREGATES.items():
+        frames = [part[name] for part in parts if name in part]
+        if frames:
+            combined[name] = (
+                pd.concat(frames, ignore_index = True)
+                .groupby(by = keys, as_index = False, observed = True)
+                .sum()
+            )
+    return combined
+
+def write(tables):
+    for name, df in tables.items():
+        datasets.write_arrow(df, name)
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Read-only views
+# Stored tables are kept current by scripts.ingest; without them the aggregates are computed from the fact table.
+@datasets.reloadable
+@lru_cache(maxsize = None)
+def _table(name):
+    if datasets._exists(name):
+        return datasets._load(name)
+    builder, source, keys = AGGREGATES[name]
+    return builder(datasets._fact_table() if source == 'fact' else datasets._matches())
+
+def table(name):
+    return _table(name).copy(deep = False)
@@ -0,0 +1,154 @@
+import importlib
+import inspect
+import pandas as pd
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict
+from functools import wraps
+from scripts import datasets
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Query cache
+# Streamlit reruns the whole app on every widget interaction. The public query functions of the analysis
+# modules are memoized here per process, so a repeated selection is served from memory instead of being
+# recomputed. Entries are keyed by the typed arguments (a team, a player, a season or a list of seasons),
+# evicted least-recently-used beyond MAXSIZE per function or after TTL seconds. Hits return shallow copies, so
+# callers may set an index or add columns.
+# The processed data files are checked at most every VERSION_CHECK_INTERVAL seconds. When they change, e.g. after
+# python -m scripts.ingest --append, every loaded and derived frame is dropped (datasets.invalidate) and the
+# imported analysis modules are reloaded, so the next query is answered from the new data without a restart.
+#   from scripts import cache, team_analysis
+#   team_analysis = cache.cached_module(team_analysis)
+
+MAXSIZE = 128
+
+TTL = None
+
+# The stamp is re-read at most once per interval rather than on every lookup
+VERSION_CHECK_INTERVAL = 5
+
+_version = {'stamp': None, 'checked': 0.0}
+
+_version_lock = threading.RLock()
+
+def _reload():
+    # The module-level frames of the analysis modules are rebuilt by re-running the modules; their views are
+    # rebuilt by lazy_module on next access
+    datasets.invalidate()
+    for name in ['analysis', 'player_analysis', 'team_analysis', 'season_analysis']:
+        module = sys.modules.get(f'scripts.{name}')
+        if module is not None:
+            _views.pop(module.__name__, None)
+            importlib.reload(module)
+
+def _current_version():
+    with _version_lock:
+        now = time.monotonic()
+        if now - _version['checked'] > VERSION_CHECK_INTERVAL:
+            stamp = datasets.version()
+            if _version['stamp'] is not None and stamp != _version['stamp']:
+                _reload()
+            _version.update(stamp = stamp, checked = now)
+        return _version['stamp']
+
+def _key_part(value):
+    # Season lists arrive as lists from the multiselect widgets
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_key_part(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value).__name__, frozenset(_key_part(item) for item in value))
+    return (type(value).__name__, value)
+
+def _key(args, kwargs):
+    return tuple(_key_part(arg) for arg in args), tuple(sorted((name, _key_part(value)) for name, value in kwargs.items()))
+
+def _share(value):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep = False)
+    if isinstance(value, tuple):
+        return tuple(_share(item) for item in value)
+    if isinstance(value, list):
+        return [_share(item) for item in value]
+    if isinstance(value, dict):
+        return {name: _share(item) for name, item in value.items()}
+    return value
+
+def cached(function, maxsize = MAXSIZE, ttl = TTL):
+    entries = OrderedDict()
+    state = {'version': None}
+    lock = threading.Lock()
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        try:
+            key = _key(args, kwargs)
+            hash(key)
+        except TypeError:
+            return function(*args, **kwargs)
+
+        version = _current_version()
+        now = time.monotonic()
+        with lock:
+            if state['version'] != version:
+                entries.clear()
+                state['version'] = version
+            if key in entries:
+                value, created = entries[key]
+                if ttl is None or now - created < ttl:
+                    entries.move_to_end(key)
+                    return _share(value)
+                del entries[key]
+
+        value = function(*args, **kwargs)
+        with lock:
+            entries[key] = (value, now)
+            entries.move_to_end(key)
+            while len(entries) > maxsize:
+                entries.popitem(last = False)
+        return _share(value)
+
+    wrapper.cache_clear = entries.clear
+    return wrapper
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Cached module views
+# The views are built once per process: the app script is re-executed on every rerun, the cache must not be.
+_views = {}
+
+class _ModuleView(types.SimpleNamespace):
+    # Names the module resolves lazily, e.g. the scripts.analysis statistics, are read from the module itself
+    def __getattr__(self, name):
+        return getattr(importlib.import_module(self.__dict__['__name__']), name)
+
+def cached_module(module, maxsize = MAXSIZE, ttl = TTL):
+    if module.__name__ not in _views:
+        namespace = {}
+        for name, value in vars(module).items():
+            if inspect.isfunction(value) and value.__module__ == module.__name__ and not name.startswith('_'):
+                value = cached(value, maxsize, ttl)
+            namespace[name] = value
+        _views[module.__name__] = _ModuleView(**namespace)
+    return _views[module.__name__]
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Lazy module views
+# The analysis modules aggregate their datasets at import time. A lazy view imports its module and builds the
+# cached view only when one of its attributes is first read, so a page that never touches a module never
+# loads its data.
+#   team_analysis = cache.lazy_module('team_analysis')
+class LazyModule:
+    def __init__(self, name, maxsize = MAXSIZE, ttl = TTL):
+        self._name = name
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def __getattr__(self, attribute):
+        # Checked before the import, so a module is never reloaded right after it first loads its data
+        _current_version()
+        module = importlib.import_module(f'scripts.{self._name}')
+        return getattr(cached_module(module, self._maxsize, self._ttl), attribute)
+
+def lazy_module(name, maxsize = MAXSIZE, ttl = TTL):
+    return LazyModule(name, maxsize, ttl)
@@ -0,0 +1,36 @@
+import argparse
+import joblib
+from scripts import aggregates, datasets
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Convert the processed joblib pickles into memory-mappable Arrow IPC files
+#   python -m scripts.convert
+#   python -m scripts.convert --datasets matches deliveries
+# Frames are stored encoded (categoricals become Arrow dictionaries) and the prebuilt fact table and the
+# additive aggregates are written alongside, so no worker has to repeat the encoding, the join or the groupbys.
+
+def convert(names):
+    frames = {}
+    for name in names:
+        frames[name] = datasets.encode(joblib.load(datasets._filepath(name, 'joblib')))
+        datasets.write_arrow(frames[name], name)
+        print(f"{name}: {frames[name].shape[0]} rows -> {datasets._filepath(name, 'arrow')}")
+
+    if {'matches', 'deliveries'} <= set(frames):
+        fact = datasets.build_fact_table(datasets.clean_matches(frames['matches']), frames['deliveries'])
+        datasets.write_arrow(fact, 'fact')
+        print(f"fact: {fact.shape[0]} rows -> {datasets._filepath('fact', 'arrow')}")
+
+        tables = aggregates.compute(fact = fact, matches = frames['matches'])
+        aggregates.write(tables)
+        for name, df in tables.items():
+            print(f"{name}: {df.shape[0]} rows -> {datasets._filepath(name, 'arrow')}")
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Convert processed joblib datasets to Arrow IPC files.')
+    parser.add_argument('--datasets', nargs = '+', choices = datasets.DATASETS, default = datasets.DATASETS)
+    args = parser.parse_args()
+    convert(args.datasets)
+
+if __name__ == '__main__':
+    main()
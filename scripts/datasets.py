@@ -0,0 +1,374 @@
+import numpy as np
+import pandas as pd
+import joblib
+import os
+from functools import lru_cache
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    pa = feather = None
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Shared dataset registry
+# Every processed dataset is deserialized once per process and shared by all the analysis modules.
+# Callers receive shallow copies, so adding or replacing columns on them never leaks into other modules.
+
+DATA_DIR = os.path.abspath('data/processed')
+
+DATASETS = ['matches', 'deliveries', 'deliveries_all']
+
+# Every cache of loaded or derived data registers itself here and datasets.invalidate() empties them all, e.g.
+# when scripts.cache sees the processed files change. Entries are keyed by qualified name, so a module that is
+# reloaded replaces its own.
+_CACHES = {}
+
+def reloadable(function):
+    _CACHES[f'{function.__module__}.{function.__qualname__}'] = function
+    return function
+
+def invalidate():
+    for function in list(_CACHES.values()):
+        function.cache_clear()
+
+def _filepath(name, extension):
+    return os.path.join(DATA_DIR, f'{name}.{extension}')
+
+def _exists(name):
+    arrow = feather is not None and os.path.exists(_filepath(name, 'arrow'))
+    return arrow or os.path.exists(_filepath(name, 'joblib'))
+
+def _files(directory):
+    for entry in os.scandir(directory):
+        if entry.is_dir():
+            yield from _files(entry.path)
+        elif entry.is_file():
+            yield entry
+
+def version():
+    # Changes whenever a processed file or part is written, replaced or removed, e.g. by scripts.ingest or scripts.convert
+    if not os.path.isdir(DATA_DIR):
+        return ()
+    return tuple(sorted(
+        (os.path.relpath(entry.path, DATA_DIR), entry.stat().st_mtime_ns, entry.stat().st_size)
+        for entry in _files(DATA_DIR)
+    ))
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Storage
+# Arrow IPC files are memory-mapped, so numeric columns point straight into the page cache and
+# every server process on a host shares the same pages. The joblib pickles remain the fallback.
+# A projection (a tuple of columns) reads only those columns of an Arrow file; the joblib fallback is
+# deserialized whole once and every projection selects from that one frame.
+# A dataset is its <name>.arrow file followed by the parts scripts.ingest --append writes under <name>/, in
+# order, so an append writes only the new rows. The parts are memory-mapped like the file itself and read
+# back as one table, their dictionaries unified as they are decoded.
+def _part_filepaths(name):
+    directory = os.path.join(DATA_DIR, name)
+    if not os.path.isdir(directory):
+        return []
+    return sorted(entry.path for entry in os.scandir(directory) if entry.name.startswith('part-') and entry.name.endswith('.arrow'))
+
+def _part_filepath(name, number):
+    return os.path.join(DATA_DIR, name, f'part-{number:04d}.arrow')
+
+def _clear_parts(name):
+    for filepath in _part_filepaths(name):
+        os.remove(filepath)
+
+def read_arrow(name, columns = None):
+    columns = None if columns is None else list(columns)
+    tables = [
+        feather.read_table(filepath, columns = columns, memory_map = True)
+        for filepath in [_filepath(name, 'arrow')] + _part_filepaths(name)
+    ]
+    return tables[0] if len(tables) == 1 else pa.concat_tables(tables)
+
+@reloadable
+@lru_cache(maxsize = None)
+def _load_full(name):
+    return encode(joblib.load(_filepath(name, 'joblib')))
+
+@reloadable
+@lru_cache(maxsize = None)
+def _load(name, columns = None):
+    if feather is not None and os.path.exists(_filepath(name, 'arrow')):
+        df = read_arrow(name, columns).to_pandas(split_blocks = True)
+        return encode(df, categories = stored_categories(df))
+    df = _load_full(name)
+    return df if columns is None else df[list(columns)]
+
+def write_arrow(df, name):
+    if feather is None:
+        raise ImportError("pyarrow is required to write Arrow datasets")
+    # Compression would force a decode into private memory on every load, defeating the memory map.
+    # The file is moved into place once complete, so a running app never maps a half-written file.
+    feather.write_feather(df, _filepath(name, 'arrow.tmp'), compression = 'uncompressed')
+    os.replace(_filepath(name, 'arrow.tmp'), _filepath(name, 'arrow'))
+    _clear_parts(name)
+
+def append_arrow(df, name):
+    # The new rows become the next part, typed by the stored file's schema; nothing stored is read or rewritten
+    if feather is None:
+        raise ImportError("pyarrow is required to write Arrow datasets")
+    schema = feather.read_table(_filepath(name, 'arrow'), memory_map = True).schema
+    filepath = _part_filepath(name, len(_part_filepaths(name)) + 1)
+    os.makedirs(os.path.dirname(filepath), exist_ok = True)
+    with pa.ipc.new_file(f'{filepath}.tmp', schema) as writer:
+        writer.write_table(pa.Table.from_pandas(df, schema = schema, preserve_index = False))
+    os.replace(f'{filepath}.tmp', filepath)
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Encoding
+# Player and team names are dictionary-encoded as categoricals. All player columns of a frame share one
+# set of categories (and likewise the team columns), so they can be compared, merged and filled from one
+# another without falling back to object strings. Run columns fit in int8.
+PLAYER_COLUMNS = ['batter', 'non_striker', 'bowler', 'fielder', 'player_dismissed']
+TEAM_COLUMNS = ['batting_team', 'bowling_team']
+CATEGORY_COLUMNS = ['season', 'venue', 'city']
+RUN_COLUMNS = ['batsman_runs', 'extra_runs', 'total_runs', 'is_wicket']
+
+def shared_categories(values):
+    return pd.CategoricalDtype(sorted(pd.Series(values).dropna().unique()))
+
+def stored_categories(df):
+    # Player and team columns read back from Arrow keep their stored dictionaries, so every projection of a
+    # file decodes them to the same categories whichever of its columns are read
+    dtypes = {}
+    for columns in [PLAYER_COLUMNS, TEAM_COLUMNS]:
+        present = [column for column in columns if column in df.columns and isinstance(df[column].dtype, pd.CategoricalDtype)]
+        if present:
+            dtype = shared_categories(pd.concat([df[column].cat.categories.to_series() for column in present], ignore_index = True))
+            dtypes.update({column: dtype for column in present})
+    return dtypes
+
+def encode(df, categories = None):
+    # categories pins the dtype of given columns, e.g. when a frame is encoded chunk by chunk
+    dtypes = dict(categories or {})
+    for columns in [PLAYER_COLUMNS, TEAM_COLUMNS]:
+        present = [column for column in columns if column in df.columns and column not in dtypes]
+        if present:
+            dtype = shared_categories(pd.concat([df[column] for column in present], ignore_index = True))
+            dtypes.update({column: dtype for column in present})
+    dtypes.update({column: 'category' for column in CATEGORY_COLUMNS if column in df.columns and column not in dtypes})
+    dtypes.update({column: 'int8' for column in RUN_COLUMNS if column in df.columns})
+    return df.astype({column: dtype for column, dtype in dtypes.items() if column in df.columns})
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+
+def clean_matches(matches):
+    # matches may be a projection, so winner is only filled when it was read
+    if 'winner' in matches:
+        matches = matches.assign(winner = matches['winner'].fillna('No Result'))
+    return matches.replace({'Elimination Final': 'Eliminator'})
+
+@reloadable
+@lru_cache(maxsize = None)
+def _matches(columns = None):
+    return clean_matches(_load('matches', columns))
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Ball-level fact table (matches joined with deliveries)
+# Only the match attributes read by the team, season and player analysis are carried over to every ball.
+FACT_MATCH_COLUMNS = ['id', 'season', 'city', 'match_type', 'player_of_match', 'venue',
+                      'team1', 'team2', 'winner', 'result', 'super_over']
+
+FACT_DELIVERY_COLUMNS = ['match_id', 'inning', 'batting_team', 'bowling_team', 'over', 'ball',
+                         'batter', 'bowler', 'non_striker', 'batsman_runs', 'extra_runs', 'total_runs',
+                         'is_wicket', 'dismissal_kind', 'player_dismissed', 'fielder']
+
+def build_fact_table(matches, deliveries):
+    return order_fact(
+        matches[FACT_MATCH_COLUMNS]
+        .merge(deliveries[FACT_DELIVERY_COLUMNS], left_on = 'id', right_on = 'match_id', how = 'inner')
+        .drop(columns = 'match_id')
+    )
+
+@reloadable
+@lru_cache(maxsize = None)
+def _fact_table():
+    if _exists('fact'):
+        # Files written before the layout was guaranteed are put in order once per process
+        return order_fact(_load('fact'))
+    return build_fact_table(_matches(), _load('deliveries'))
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Physical layout
+# The fact table is kept sorted by season, match, inning, over and ball, so every season, match and innings is
+# a contiguous run of rows. A run is addressed by its start offset, and per-run totals are np.add.reduceat over
+# those offsets rather than a hash groupby.
+#   datasets.fact_offsets('innings')
+#   datasets.run_totals(df, 'innings', 'total_runs')
+FACT_ORDER = ['season', 'id', 'inning', 'over', 'ball']
+
+# Match ids are unique across seasons, so a match and an innings are identified without the season
+RUN_LEVELS = {
+    'season': ['season'],
+    'match': ['id'],
+    'innings': ['id', 'inning']
+}
+
+def _sort_key(series):
+    # Seasons sort by their label whatever the order of the categories
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        ranks = np.argsort(np.argsort(series.cat.categories.astype(str)))
+        return ranks[series.cat.codes.to_numpy()]
+    return series.to_numpy()
+
+def fact_order(df):
+    # Row positions that put a fact frame in layout order, ties keeping their current order
+    return np.lexsort([_sort_key(df[column]) for column in reversed(FACT_ORDER)])
+
+def is_ordered(df):
+    keys = [_sort_key(df[column]) for column in FACT_ORDER]
+    ascending = np.ones(max(len(df) - 1, 0), dtype = bool)
+    tied = np.ones(max(len(df) - 1, 0), dtype = bool)
+    for key in keys:
+        ascending &= ~tied | (key[1:] >= key[:-1])
+        tied &= key[1:] == key[:-1]
+    return bool(ascending.all())
+
+def order_fact(df):
+    if is_ordered(df):
+        return df
+    return df.iloc[fact_order(df)].reset_index(drop = True)
+
+def run_starts(df, level):
+    # Offset of the first row of every season, match or innings run of a frame in layout order
+    starts = np.zeros(len(df), dtype = bool)
+    starts[:1] = True
+    for column in RUN_LEVELS[level]:
+        key = _sort_key(df[column])
+        starts[1:] |= key[1:] != key[:-1]
+    return np.flatnonzero(starts)
+
+@reloadable
+@lru_cache(maxsize = None)
+def _fact_offsets(level):
+    offsets = run_starts(_fact_table(), level)
+    offsets.flags.writeable = False
+    return offsets
+
+def fact_offsets(level):
+    return _fact_offsets(level)
+
+def run_totals(df, level, column, attributes = (), starts = None):
+    # One row per run with the column summed over it; its keys and the attributes, e.g. the batting team of
+    # an innings, are taken from the first row of the run. starts defaults to the run starts of df.
+    starts = run_starts(df, level) if starts is None else starts
+    values = df[column].to_numpy(dtype = 'int64')
+    totals = np.add.reduceat(values, starts) if len(starts) else values[:0]
+    return (
+        df.iloc[starts][list(dict.fromkeys(['season'] + RUN_LEVELS[level] + list(attributes)))]
+        .reset_index(drop = True)
+        .assign(**{column: totals})
+    )
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Reference tables
+# Hand-maintained metadata kept next to the data rather than in code: one row per franchise with its current
+# name, the ';'-separated cities its home ground is recorded under (e.g. Chandigarh and Mohali) and the
+# ';'-separated names it played under. scripts.ingest merges those former names into the current one.
+REFERENCE_DIR = os.path.abspath('data/reference')
+
+@reloadable
+@lru_cache(maxsize = None)
+def _franchises():
+    return pd.read_csv(os.path.join(REFERENCE_DIR, 'franchises.csv'), dtype = str, keep_default_na = False)
+
+def _franchise_pairs(franchises, column):
+    # One (team, value) row per entry of a ';'-separated column
+    return (
+        franchises
+        .assign(**{column: lambda df_: df_[column].str.split(';')})
+        .explode(column)
+        .loc[lambda df_: df_[column] != '', ['team', column]]
+    )
+
+def franchise_renames():
+    # Former franchise name -> current name
+    pairs = _franchise_pairs(_franchises(), 'former_names')
+    return dict(zip(pairs['former_names'], pairs['team']))
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Team-perspective matches
+# Every match appears once from each side, with the team, its opponent and whether the team won, so a team's
+# record against every rival or in every match type is a selection and a groupby rather than a row-wise swap
+# of team1 and team2. The two sides of a match are adjacent and matches keep their stored order. A match is a
+# home match for the team when it is played in one of the home cities of its franchise.
+def build_team_matches(matches, franchises):
+    home_cities = pd.MultiIndex.from_frame(_franchise_pairs(franchises, 'home_cities'))
+    sides = pd.concat([
+        matches.assign(team = matches['team1'], opponent = matches['team2']),
+        matches.assign(team = matches['team2'], opponent = matches['team1'])
+    ])
+    return (
+        sides
+        .sort_index(kind = 'stable')
+        .reset_index(drop = True)
+        .assign(
+            won = lambda df_: df_['winner'] == df_['team'],
+            home = lambda df_: pd.MultiIndex.from_arrays([
+                df_['team'].to_numpy(dtype = object), df_['city'].to_numpy(dtype = object)
+            ]).isin(home_cities)
+        )
+    )
+
+@reloadable
+@lru_cache(maxsize = None)
+def _team_matches():
+    return build_team_matches(_matches(), _franchises())
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Read-only views
+# columns projects a view onto the columns a module reads, e.g. datasets.deliveries(['batter', 'bowler'])
+def _columns(columns):
+    return None if columns is None else tuple(columns)
+
+def matches(columns = None):
+    return _matches(_columns(columns)).copy(deep = False)
+
+def deliveries(columns = None):
+    return _load('deliveries', _columns(columns)).copy(deep = False)
+
+def deliveries_all(columns = None):
+    return _load('deliveries_all', _columns(columns)).copy(deep = False)
+
+def team_matches(columns = None):
+    if columns is None:
+        return _team_matches().copy(deep = False)
+    return _team_matches()[list(columns)]
+
+def franchises(columns = None):
+    if columns is None:
+        return _franchises().copy(deep = False)
+    return _franchises()[list(columns)]
+
+def fact_table(columns = None):
+    # The fact table is shared whole with scripts.filters, so a projection selects from it rather than re-reading
+    if columns is None:
+        return _fact_table().copy(deep = False)
+    return _fact_table()[list(columns)]
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Demand-driven loading
+# A module declares the datasets it reads, and the columns it reads from each, and loads exactly those, so a
+# dataset nobody declares (or selects through scripts.filters) is never deserialized and an undeclared column
+# of matches, deliveries or deliveries_all is never read. The fact table is the exception: it is loaded whole
+# once and shared with scripts.filters, so a column list only selects from it.
+#   DATASETS = {'matches': ['id', 'season', 'winner'], 'deliveries': ['batter', 'bowler']}
+#   DATASETS = {'matches': ['id', 'season', 'match_type']}     # winner is only cleaned when declared
+#   matches, deliveries = datasets.load(DATASETS)
+VIEWS = {
+    'matches': matches,
+    'deliveries': deliveries,
+    'deliveries_all': deliveries_all,
+    'fact': fact_table,
+    'team_matches': team_matches,
+    'franchises': franchises
+}
+
+def load(declared):
+    # declared maps every dataset to its columns, None reading all of them
+    return [VIEWS[name](columns) for name, columns in declared.items()]
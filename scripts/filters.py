@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+from functools import lru_cache, partial
+from scripts import aggregates, datasets
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Entity row index
+# Every player and team column of the shared frames maps each of its values to the positions of its rows,
+# so selecting one player or team slices those rows directly instead of evaluating a predicate over the
+# whole frame. A column is indexed the first time it is looked up and then shared by all the modules.
+
+FRAMES = {
+    'fact': datasets._fact_table,
+    'deliveries': partial(datasets._load, 'deliveries'),
+    'matches': datasets._matches,
+    'team_matches': datasets._team_matches,
+    'season_cube': partial(aggregates._table, 'season_cube')
+}
+
+INDEXED_COLUMNS = datasets.PLAYER_COLUMNS + datasets.TEAM_COLUMNS + ['team1', 'team2', 'winner', 'toss_winner', 'team', 'opponent']
+
+NO_ROWS = np.array([], dtype = np.intp)
+
+ALL_SEASONS = 'All'
+
+# Selections of several values or columns are cached as row positions, one entry per distinct selection
+SELECTIONS = 256
+
+@datasets.reloadable
+@lru_cache(maxsize = None)
+def _index(frame, column):
+    if column not in INDEXED_COLUMNS:
+        raise ValueError(f"{column!r} is not an indexed column")
+    return FRAMES[frame]().groupby(by = column, observed = True, sort = False).indices
+
+def _values(value):
+    # A scalar selects one value; a list, tuple, set or array selects any of its values
+    if pd.api.types.is_list_like(value):
+        return tuple(value)
+    return (value,)
+
+@datasets.reloadable
+@lru_cache(maxsize = SELECTIONS)
+def _positions(frame, columns, values):
+    selected = np.zeros(len(FRAMES[frame]()), dtype = bool)
+    for column in columns:
+        index = _index(frame, column)
+        for value in values:
+            selected[index.get(value, NO_ROWS)] = True
+    return np.flatnonzero(selected)
+
+def positions(frame, columns, value):
+    # Rows matching the value in any of the columns, in their original order
+    values = _values(value)
+    if isinstance(columns, str) and len(values) == 1:
+        return _index(frame, columns).get(values[0], NO_ROWS)
+    return _positions(frame, (columns,) if isinstance(columns, str) else tuple(columns), values)
+
+def rows(frame, columns, value, seasons = ALL_SEASONS):
+    selected = positions(frame, columns, value)
+    if seasons != ALL_SEASONS:
+        selected = _within_seasons(frame, selected, seasons)
+    return FRAMES[frame]().iloc[selected]
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Season selection
+# Matches are stored in season order, so the rows of one season form a contiguous run of a shared frame. A
+# selection of seasons resolves to a few row ranges, adjacent seasons merging into one, instead of a scan of
+# the season column, and a single range is sliced without copying. Seasons are matched by their label, so
+# 2016 and '2016' select the same season; 'All' selects every row.
+#   filters.season_rows('fact', ['2016', '2017'])
+#   filters.rows('fact', ['team1', 'team2'], team_name, seasons = '2016')
+#   filters.select_seasons(df, seasons)
+
+def _season_labels(seasons):
+    return {str(season) for season in _values(seasons)}
+
+@datasets.reloadable
+@lru_cache(maxsize = None)
+def _season_ranges(frame):
+    # (start, stop) of the rows of every season, or None when the frame is not clustered by season
+    ranges = {}
+    for season, selected in FRAMES[frame]().groupby(by = 'season', observed = True, sort = False).indices.items():
+        if selected[-1] - selected[0] + 1 != len(selected):
+            return None
+        ranges[str(season)] = (selected[0], selected[-1] + 1)
+    return ranges
+
+def season_ranges(frame, seasons):
+    ranges = _season_ranges(frame)
+    if ranges is None:
+        return None
+    merged = []
+    for start, stop in sorted(ranges[season] for season in _season_labels(seasons) if season in ranges):
+        if merged and merged[-1][1] == start:
+            merged[-1] = (merged[-1][0], stop)
+        else:
+            merged.append((start, stop))
+    return merged
+
+def season_positions(frame, seasons):
+    ranges = season_ranges(frame, seasons)
+    if ranges is None:
+        return np.flatnonzero(season_mask(FRAMES[frame](), seasons))
+    return np.concatenate([NO_ROWS] + [np.arange(start, stop) for start, stop in ranges])
+
+def _within_seasons(frame, selected, seasons):
+    # The given ascending row positions that fall in the selected seasons
+    ranges = season_ranges(frame, seasons)
+    if ranges is None:
+        return selected[season_mask(FRAMES[frame](), seasons)[selected]]
+    return np.concatenate([NO_ROWS] + [
+        selected[np.searchsorted(selected, start):np.searchsorted(selected, stop)] for start, stop in ranges
+    ])
+
+def season_rows(frame, seasons = ALL_SEASONS):
+    df = FRAMES[frame]()
+    if seasons == ALL_SEASONS:
+        return df.copy(deep = False)
+    ranges = season_ranges(frame, seasons)
+    if ranges is not None and len(ranges) == 1:
+        return df.iloc[ranges[0][0]:ranges[0][1]]
+    return df.iloc[season_positions(frame, seasons)]
+
+def season_mask(df, seasons):
+    series = df['season']
+    labels = list(_season_labels(seasons))
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Compared on the category codes, so the labels are matched once per category rather than once per row
+        codes = np.flatnonzero(series.cat.categories.astype(str).isin(labels))
+        return np.isin(series.cat.codes.to_numpy(), codes)
+    return series.astype(str).isin(labels).to_numpy()
+
+def select_seasons(df, seasons = ALL_SEASONS):
+    # Season selection on any frame, e.g. one already narrowed to a team or a match type
+    if seasons == ALL_SEASONS:
+        return df
+    return df[season_mask(df, seasons)]
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Typed selection on any frame
+# Predicates are built from the values themselves rather than formatted into query strings, so nothing is parsed
+# or compiled per call and every name, apostrophes included, selects correctly.
+#   filters.select(matches, winner = team_name, toss_decision = 'field')
+#   df[filters.mask(df, 'Rival Team', team) & ~filters.mask(df, 'dismissal_kind', 'run out')]
+
+def mask(df, columns, value):
+    # Boolean array of the rows matching the value in any of the columns
+    values = _values(value)
+    selected = np.zeros(len(df), dtype = bool)
+    for column in [columns] if isinstance(columns, str) else columns:
+        series = df[column]
+        selected |= (series == values[0]).to_numpy(dtype = bool, na_value = False) if len(values) == 1 else series.isin(values).to_numpy()
+    return selected
+
+def select(df, **conditions):
+    # Rows matching every condition
+    selected = np.ones(len(df), dtype = bool)
+    for column, value in conditions.items():
+        selected &= mask(df, column, value)
+    return df[selected]
+
+def select_any(df, columns, value):
+    # Rows matching the value in any of the columns, e.g. select_any(matches, ['team1', 'team2'], team_name)
+    return df[mask(df, columns, value)]
@@ -0,0 +1,262 @@
+import argparse
+import os
+import pandas as pd
+import pyarrow as pa
+from scripts import aggregates, datasets
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Raw-to-processed ingestion
+#   python -m scripts.ingest
+#   python -m scripts.ingest --matches data/raw/matches.csv --deliveries data/raw/deliveries.csv --chunksize 50000
+#   python -m scripts.ingest --append --matches new_matches.csv --deliveries new_deliveries.csv
+# Ball-by-ball data is streamed in chunks. A first pass collects the player and team dictionaries, a second pass
+# renames, encodes and appends every chunk to the Arrow files, so peak memory is bounded by the chunk size.
+# deliveries keeps the two regular innings of a match, deliveries_all also keeps the super-over innings.
+# --append adds only the matches that are not stored yet, as new parts of the Arrow datasets (see datasets.append_arrow),
+# and folds them into the stored aggregates.
+
+RAW_DIR = os.path.abspath('data/raw')
+
+CHUNKSIZE = 100000
+
+REGULAR_INNINGS = 2
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Franchise continuity: defunct or renamed teams are merged under their latest franchise identity, as listed in the
+# former_names of data/reference/franchises.csv (see datasets.franchise_renames)
+MATCH_TEAM_COLUMNS = ['team1', 'team2', 'toss_winner', 'winner']
+
+SEASON_RENAMES = {'2007/08': '2008', '2009/10': '2010', '2020/21': '2020'}
+
+CITY_RENAMES = {'Bangalore': 'Bengaluru', 'Navi Mumbai': 'Mumbai'}
+
+# Matches played in the UAE carry no city in the raw data
+VENUE_CITIES = {'Dubai International Cricket Stadium': 'Dubai', 'Sharjah Cricket Stadium': 'Sharjah'}
+
+VENUE_RENAMES = {
+    'Arun Jaitley Stadium': 'Arun Jaitley Stadium, Delhi',
+    'Feroz Shah Kotla': 'Arun Jaitley Stadium, Delhi',
+    'Barabati Stadium': 'Barabati Stadium, Cuttack',
+    'Brabourne Stadium': 'Brabourne Stadium, Mumbai',
+    'Buffalo Park': 'Buffalo Park, East London',
+    'De Beers Diamond Oval': 'De Beers Diamond Oval, Kimberley',
+    'Dr DY Patil Sports Academy': 'Dr DY Patil Sports Academy, Mumbai',
+    'Dr. Y.S. Rajasekhara Reddy ACA-VDCA Cricket Stadium': 'Dr. Y.S. Rajasekhara Reddy ACA-VDCA Cricket Stadium, Visakhapatnam',
+    'Eden Gardens': 'Eden Gardens, Kolkata',
+    'Green Park': 'Green Park, Kanpur',
+    'Himachal Pradesh Cricket Association Stadium': 'Himachal Pradesh Cricket Association Stadium, Dharamsala',
+    'Holkar Cricket Stadium': 'Holkar Cricket Stadium, Indore',
+    'JSCA International Stadium Complex': 'JSCA International Stadium Complex, Ranchi',
+    'Kingsmead': 'Kingsmead, Durban',
+    'M Chinnaswamy Stadium': 'M.Chinnaswamy Stadium, Bengaluru',
+    'M.Chinnaswamy Stadium': 'M.Chinnaswamy Stadium, Bengaluru',
+    'M Chinnaswamy Stadium, Bengaluru': 'M.Chinnaswamy Stadium, Bengaluru',
+    'MA Chidambaram Stadium': 'MA Chidambaram Stadium, Chepauk, Chennai',
+    'MA Chidambaram Stadium, Chepauk': 'MA Chidambaram Stadium, Chepauk, Chennai',
+    'Sardar Patel Stadium, Motera': 'Narendra Modi Stadium, Ahmedabad',
+    'Nehru Stadium': 'Nehru Stadium, Kochi',
+    'New Wanderers Stadium': 'New Wanderers Stadium, Johannesburg',
+    'Newlands': 'Newlands, Cape Town',
+    'OUTsurance Oval': 'OUTsurance Oval, Bloemfontein',
+    'Punjab Cricket Association Stadium, Mohali': 'Punjab Cricket Association I.S. Bindra Stadium, Chandigarh',
+    'Punjab Cricket Association IS Bindra Stadium': 'Punjab Cricket Association I.S. Bindra Stadium, Chandigarh',
+    'Punjab Cricket Association IS Bindra Stadium, Mohali': 'Punjab Cricket Association I.S. Bindra Stadium, Chandigarh',
+    'Punjab Cricket Association IS Bindra Stadium, Mohali, Chandigarh': 'Punjab Cricket Association I.S. Bindra Stadium, Chandigarh',
+    'Rajiv Gandhi International Stadium': 'Rajiv Gandhi International Stadium, Uppal, Hyderabad',
+    'Rajiv Gandhi International Stadium, Uppal': 'Rajiv Gandhi International Stadium, Uppal, Hyderabad',
+    'Saurashtra Cricket Association Stadium': 'Saurashtra Cricket Association Stadium, Rajkot',
+    'Sawai Mansingh Stadium': 'Sawai Mansingh Stadium, Jaipur',
+    'Shaheed Veer Narayan Singh International Stadium': 'Shaheed Veer Narayan Singh International Stadium, Raipur',
+    'Sheikh Zayed Stadium': 'Sheikh Zayed Cricket Stadium, Abu Dhabi',
+    'Zayed Cricket Stadium, Abu Dhabi': 'Sheikh Zayed Cricket Stadium, Abu Dhabi',
+    "St George's Park": "St George's Park, Port Elizabeth",
+    'Maharashtra Cricket Association Stadium': 'Subrata Roy Sahara Stadium, Pune',
+    'Maharashtra Cricket Association Stadium, Pune': 'Subrata Roy Sahara Stadium, Pune',
+    'Subrata Roy Sahara Stadium': 'Subrata Roy Sahara Stadium, Pune',
+    'SuperSport Park': 'SuperSport Park, Centurion',
+    'Wankhede Stadium': 'Wankhede Stadium, Mumbai'
+}
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Renames
+def process_matches(matches):
+    return (
+        matches
+        # A file holding only later seasons would otherwise read its seasons as integers
+        .astype({'season': str})
+        .replace({'season': SEASON_RENAMES, 'city': CITY_RENAMES, 'venue': VENUE_RENAMES,
+                  **{column: datasets.franchise_renames() for column in MATCH_TEAM_COLUMNS}})
+        .assign(
+            city = lambda df_: df_['city'].fillna(df_['venue'].map(VENUE_CITIES)),
+            method = lambda df_: df_['method'].fillna('No D/L')
+        )
+    )
+
+def process_deliveries(deliveries):
+    return deliveries.replace({column: datasets.franchise_renames() for column in datasets.TEAM_COLUMNS})
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Dictionaries
+# Every chunk is encoded against the same player and team categories, so the Arrow dictionaries
+# agree across record batches and the files load back as single categoricals.
+def collect_categories(filepath, chunksize = CHUNKSIZE):
+    players, teams = set(), set()
+    for chunk in pd.read_csv(filepath, usecols = datasets.PLAYER_COLUMNS + datasets.TEAM_COLUMNS, chunksize = chunksize):
+        chunk = process_deliveries(chunk)
+        for column in datasets.PLAYER_COLUMNS:
+            players.update(chunk[column].dropna().unique())
+        for column in datasets.TEAM_COLUMNS:
+            teams.update(chunk[column].dropna().unique())
+
+    player_dtype = datasets.shared_categories(list(players))
+    team_dtype = datasets.shared_categories(list(teams))
+    return {
+        **{column: player_dtype for column in datasets.PLAYER_COLUMNS},
+        **{column: team_dtype for column in datasets.TEAM_COLUMNS}
+    }
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Arrow writers
+# Files are written next to their target and moved into place once complete, so a running app never
+# memory-maps a half-written file.
+def _arrow_schema(df):
+    schema = pa.Schema.from_pandas(df, preserve_index = False)
+    for i, field in enumerate(schema):
+        # A column that is entirely missing in the first chunk would otherwise be typed as null
+        if pa.types.is_null(field.type):
+            schema = schema.set(i, field.with_type(pa.string()))
+    return schema
+
+def _append(writers, name, df):
+    if name not in writers:
+        schema = _arrow_schema(df)
+        writers[name] = (pa.ipc.new_file(datasets._filepath(name, 'arrow.tmp'), schema), schema)
+    writer, schema = writers[name]
+    writer.write_table(pa.Table.from_pandas(df, schema = schema, preserve_index = False))
+
+def _close(writers, keep = True):
+    for name, (writer, schema) in writers.items():
+        writer.close()
+        if keep:
+            os.replace(datasets._filepath(name, 'arrow.tmp'), datasets._filepath(name, 'arrow'))
+            datasets._clear_parts(name)
+        else:
+            os.remove(datasets._filepath(name, 'arrow.tmp'))
+
+def _replace(name, table):
+    # Compacts the file and its parts into one file; the IPC file format needs one dictionary per column
+    table = table.unify_dictionaries()
+    with pa.ipc.new_file(datasets._filepath(name, 'arrow.tmp'), table.schema) as writer:
+        writer.write_table(table)
+    os.replace(datasets._filepath(name, 'arrow.tmp'), datasets._filepath(name, 'arrow'))
+    datasets._clear_parts(name)
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Fact layout
+# Every chunk and every append is written in layout order (season, match, inning, over, ball). Only when the raw
+# files or the appended matches are out of season and match order is the stored fact table, with its parts,
+# rewritten in order as one file, reading just the sort columns and taking the rows straight from the memory map.
+def _order_fact():
+    keys = datasets.read_arrow('fact', datasets.FACT_ORDER).to_pandas()
+    if datasets.is_ordered(keys):
+        return False
+    _replace('fact', datasets.read_arrow('fact').take(datasets.fact_order(keys)))
+    return True
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+# Chunks are cut at match boundaries: the rows of the last match in a chunk are held back and prepended to
+# the next one, so every match is aggregated in exactly one chunk.
+def _match_chunks(reader):
+    held = None
+    for chunk in reader:
+        if held is not None:
+            chunk = pd.concat([held, chunk], ignore_index = True)
+        last = chunk['match_id'] == chunk['match_id'].iloc[-1]
+        held = chunk[last]
+        if not last.all():
+            yield chunk[~last]
+    if held is not None:
+        yield held
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+
+def ingest(matches_path, deliveries_path, chunksize = CHUNKSIZE):
+    matches = datasets.encode(process_matches(pd.read_csv(matches_path)))
+    datasets.write_arrow(matches, 'matches')
+    print(f"matches: {matches.shape[0]} rows")
+
+    fact_matches = datasets.clean_matches(matches)
+    categories = collect_categories(deliveries_path, chunksize)
+
+    writers = {}
+    rows = {'deliveries': 0, 'deliveries_all': 0, 'fact': 0}
+    parts = [aggregates.compute(matches = matches)]
+    try:
+        for chunk in _match_chunks(pd.read_csv(deliveries_path, chunksize = chunksize)):
+            deliveries_all = datasets.encode(process_deliveries(chunk), categories = categories)
+            deliveries = deliveries_all[deliveries_all['inning'] <= REGULAR_INNINGS]
+            fact = datasets.build_fact_table(fact_matches, deliveries)
+            parts.append(aggregates.compute(fact = fact))
+
+            for name, df in [('deliveries_all', deliveries_all), ('deliveries', deliveries), ('fact', fact)]:
+                _append(writers, name, df)
+                rows[name] += df.shape[0]
+    except BaseException:
+        _close(writers, keep = False)
+        raise
+    _close(writers)
+    if _order_fact():
+        print("fact: rewritten in season and match order")
+    aggregates.write(aggregates.combine(*parts))
+
+    for name, count in rows.items():
+        print(f"{name}: {count} rows")
+
+# A running app needs no restart: the new parts change datasets.version(), and scripts.cache then drops its
+# frames and reloads the analysis modules within cache.VERSION_CHECK_INTERVAL seconds.
+def append(matches_path, deliveries_path):
+    stored_matches = datasets._load('matches')
+    new_matches = process_matches(pd.read_csv(matches_path))
+    new_matches = new_matches[~new_matches['id'].isin(stored_matches['id'])]
+    if new_matches.empty:
+        print("matches: no new matches")
+        return
+
+    # The stored aggregates are read before any file is replaced
+    stored = {name: aggregates.table(name) for name in aggregates.AGGREGATES}
+
+    # Categoricals of differing categories concatenate to strings and are re-encoded together
+    matches = datasets.encode(pd.concat([stored_matches, new_matches], ignore_index = True))
+    new_matches = matches[matches['id'].isin(new_matches['id'])]
+
+    new_deliveries = pd.read_csv(deliveries_path)
+    new_deliveries = new_deliveries[new_deliveries['match_id'].isin(new_matches['id'])]
+    deliveries_all = datasets.encode(process_deliveries(new_deliveries))
+    deliveries = deliveries_all[deliveries_all['inning'] <= REGULAR_INNINGS]
+    fact = datasets.build_fact_table(datasets.clean_matches(new_matches), deliveries)
+
+    # Only the new rows are written, each dataset gaining one part
+    for name, df in [('matches', new_matches), ('deliveries_all', deliveries_all), ('deliveries', deliveries), ('fact', fact)]:
+        datasets.append_arrow(df, name)
+    if _order_fact():
+        print("fact: rewritten in season and match order")
+    aggregates.write(aggregates.combine(stored, aggregates.compute(fact = fact, matches = new_matches)))
+
+    print(f"matches: {new_matches.shape[0]} new, {matches.shape[0]} rows")
+    for name, df in [('deliveries_all', deliveries_all), ('deliveries', deliveries), ('fact', fact)]:
+        print(f"{name}: {df.shape[0]} new rows")
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Build the processed datasets from the raw IPL csv files.')
+    parser.add_argument('--matches', default = os.path.join(RAW_DIR, 'matches.csv'))
+    parser.add_argument('--deliveries', default = os.path.join(RAW_DIR, 'deliveries.csv'))
+    parser.add_argument('--chunksize', type = int, default = CHUNKSIZE)
+    parser.add_argument('--append', action = 'store_true', help = 'add only matches that are not stored yet')
+    args = parser.parse_args()
+    if args.append:
+        append(args.matches, args.deliveries)
+    else:
+        ingest(args.matches, args.deliveries, args.chunksize)
+
+if __name__ == '__main__':
+    main()
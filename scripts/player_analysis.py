@@ -4,54 +4,48 @@ import streamlit as st
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
-import joblib
-import os
+from scripts import aggregates, datasets, filters
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 # Load datasets
-filepath = os.path.abspath('data/processed/deliveries_all.joblib')
-deliveries_all = joblib.load(filepath)
+DATASETS = {
+    'matches': ['season', 'team1', 'winner'],
+    'deliveries': ['batter', 'non_striker', 'bowler']
+}
+matches, deliveries = datasets.load(DATASETS)
 
-filepath = os.path.abspath('data/processed/matches.joblib')
-matches = joblib.load(filepath)
-
-filepath = os.path.abspath('data/processed/deliveries.joblib')
-deliveries = joblib.load(filepath)
+# The fact table is read whole and shared with scripts.filters, so it is selected here rather than declared
+df_all1 = datasets.fact_table(['season', 'batting_team', 'batter', 'non_striker'])
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
+## Selection Lists
+# The pickers of the team and player pages, so those pages need not import scripts.analysis
+total_teams = pd.DataFrame(matches['team1'].unique(), columns = ['Team'])
+total_teams = total_teams.sort_values(by = 'Team')
+total_teams.index = range(1, len(total_teams)+1)
 
-matches = (
-    matches
-    .assign(
-        winner = lambda df_: df_['winner'].fillna('No Result')
-    )
-    .replace({'Elimination Final': 'Eliminator'})
-)
+total_batsman_list = sorted(set(deliveries['batter'].unique()) | set(deliveries['non_striker'].unique()))
 
-# ------------------------------------------------------------------------------------------------------------------------------------------
+total_bowlers_list = sorted(deliveries['bowler'].unique())
 
-df_all1 = (
-    matches
-    .merge(deliveries, left_on = 'id', right_on = 'match_id', how = 'inner') 
-)
+total_seasons_list = sorted(matches['season'].unique().tolist())
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ## Batsman Team(s) for Seasons
 def player_teams(player_name):
     if player_name not in non_striker_batter['batter'].values:
         df = (
-            df_all1
-            .groupby(by = ['batter', 'batting_team', 'season'], as_index = False)
+            filters.rows('fact', 'batter', player_name)
+            .groupby(by = ['batter', 'batting_team', 'season'], as_index = False, observed = True)
             .agg(count = ('batting_team', 'nunique'))
-            .query(f"batter == '{player_name}'")
-            .groupby(by = 'batting_team', as_index = False)
+            .groupby(by = 'batting_team', as_index = False, observed = True)
             .agg(seasons = ('season', lambda x: ", ".join(x.unique())), count = ('season', lambda x: len((x.unique()))))
             .rename(columns = {'batting_team': 'Team', 'seasons': 'Season', 'count': 'Count'})
         )
     else:
         df = (
             df_all1[df_all1['non_striker'].isin(non_striker_batter['batter'])][['non_striker', 'season', 'batting_team']]
-            .groupby(by = ['batting_team'], as_index = False)
+            .groupby(by = ['batting_team'], as_index = False, observed = True)
             .agg(seasons = ('season', lambda x: ", ".join(x.unique())), count = ('season', lambda x: len((x.unique()))))
             .rename(columns = {'batting_team': 'Team', 'seasons': 'Season', 'count': 'Count'})
         )
@@ -60,31 +54,29 @@ def player_teams(player_name):
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ## Batsman Overall Stats
+# Career totals are the season aggregates summed over seasons
+batter_seasons = aggregates.table('batter_seasons')
+dismissal_seasons = aggregates.table('dismissal_seasons')
+
 runs_df = (
-    deliveries
-    .groupby(by = ['batter'], as_index = False)
-    .agg(
-        Runs = ('batsman_runs', 'sum'),
-        Balls = ('batsman_runs', 'count'),
-        Sixes = ('batsman_runs', lambda x: (x == 6).sum()),
-        Fours = ('batsman_runs', lambda x: (x == 4).sum()),
-        Threes = ('batsman_runs', lambda x: (x == 3).sum()),
-        Twos = ('batsman_runs', lambda x: (x == 2).sum()),
-        Ones = ('batsman_runs', lambda x: (x == 1).sum()),
-        Dots = ('batsman_runs', lambda x: (x == 0).sum())
-    )
+    batter_seasons
+    .groupby(by = ['batter'], as_index = False, observed = True)
+    [['Runs', 'Balls', 'Sixes', 'Fours', 'Threes', 'Twos', 'Ones', 'Dots']]
+    .sum()
 )
 
 dismissals_df = (
-    deliveries
-    .groupby(by = ['player_dismissed'], as_index = False)
-    .agg(dismissals = ('is_wicket', 'sum'))
+    dismissal_seasons
+    .groupby(by = ['player_dismissed'], as_index = False, observed = True)
+    [['dismissals']]
+    .sum()
 )
 
 innings_df = (
-    deliveries
-    .groupby(by = ['batter'], as_index = False)
-    .agg(innings = ('match_id', 'nunique'))
+    batter_seasons
+    .groupby(by = ['batter'], as_index = False, observed = True)
+    [['innings']]
+    .sum()
 )
 
 batsman_striker_list = set(list(deliveries['batter'].unique()))
@@ -125,34 +117,31 @@ batsman_overall_df = (
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ## Match-wise Runs
-def match_runs(player_name):
+# Innings are looked up by row position per batter instead of filtering every delivery
+batter_innings = aggregates.table('batter_innings')
+batter_innings_rows = batter_innings.groupby(by = 'batter', observed = True).indices
+
+def player_innings(player_name):
     return (
-        df_all1.query(f"batter == '{player_name}'")
-        .groupby(by = ['batter', 'id', 'season', 'inning', 'batting_team', 'bowling_team'], as_index = False)
-        .agg(
-            Runs = ('batsman_runs', 'sum'),
-            Balls = ('batsman_runs', 'count'),
-            Sixes = ('batsman_runs', lambda x: (x == 6).sum()),
-            Fours = ('batsman_runs', lambda x: (x == 4).sum()),
-            Threes = ('batsman_runs', lambda x: (x == 3).sum()),
-            Twos = ('batsman_runs', lambda x: (x == 2).sum()),
-            Ones = ('batsman_runs', lambda x: (x == 1).sum()),
-            Dots = ('batsman_runs', lambda x: (x == 0).sum())
-        )
+        batter_innings.iloc[batter_innings_rows.get(player_name, [])]
         .assign(
             Century = lambda df_: (df_['Runs'] >= 100).astype('int'),
             Half_Century = lambda df_: ((df_['Runs'] >= 50) & (df_['Runs'] < 100)).astype('int')
         )
         .rename(columns = {'batter': 'Batsman', 'id': 'Match ID', 'inning': 'Inning',
-                           'batting_team': 'Team', 'bowling_team': 'Bowling Team', 'season': 'Season'})
+                           'batting_team': 'Team', 'bowling_team': 'Bowling Team', 'season': 'Season', 'winner': 'Winner'})
+        .reset_index(drop = True)
     )
 
+def match_runs(player_name):
+    return player_innings(player_name).drop(columns = ['Dismissals', 'Winner'])
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ## Player Inning Group
 def player_inning_group(player_name):
     return (
         match_runs(player_name)
-        .groupby(by = ['Batsman', 'Inning'], as_index = False)
+        .groupby(by = ['Batsman', 'Inning'], as_index = False, observed = True)
         .agg(
             Matches = ('Match ID', 'count'), Runs = ('Runs', 'sum'),
             Balls = ('Balls', 'sum'), Centuries = ('Century', 'sum'),
@@ -171,32 +160,11 @@ def player_inning_group(player_name):
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ## Season-wise Stats
-runs_df1 = (
-    df_all1
-    .groupby(by = ['season','batter'], as_index = False)
-    .agg(
-        Runs = ('batsman_runs', 'sum'),
-        Balls = ('batsman_runs', 'count'),
-        Sixes = ('batsman_runs', lambda x: (x == 6).sum()),
-        Fours = ('batsman_runs', lambda x: (x == 4).sum()),
-        Threes = ('batsman_runs', lambda x: (x == 3).sum()),
-        Twos = ('batsman_runs', lambda x: (x == 2).sum()),
-        Ones = ('batsman_runs', lambda x: (x == 1).sum()),
-        Dots = ('batsman_runs', lambda x: (x == 0).sum())
-    )
-)
+runs_df1 = batter_seasons.drop(columns = 'innings')
 
-dismissals_df1 = (
-    df_all1
-    .groupby(by = ['season', 'player_dismissed'], as_index = False)
-    .agg(dismissals = ('is_wicket', 'sum'))
-)
+dismissals_df1 = dismissal_seasons
 
-innings_df1 = (
-    df_all1
-    .groupby(by = ['season', 'batter'], as_index = False)
-    .agg(innings = ('match_id', 'nunique'))
-)
+innings_df1 = batter_seasons[['season', 'batter', 'innings']]
 
 batsman_striker_list = set(list(df_all1['batter'].unique()))
 batsman_non_striker_list = set(list(df_all1['non_striker'].unique()))
@@ -241,17 +209,17 @@ batsman_overall_df1 = (
 def player_dismissal_type(player_name, season = 'All'):
     if season == 'All':
         df_filtered = (
-            df_all1
-            .query(f"player_dismissed == '{player_name}'")
-            .groupby(by = ['dismissal_kind'], as_index = False)
+            filters.rows('fact', 'player_dismissed', player_name)
+            .groupby(by = ['dismissal_kind'], as_index = False, observed = True)
             .agg(Count = ('dismissal_kind', 'count'))
             .sort_values(by = 'Count', ascending = False, ignore_index = True)
             .rename(columns = {'dismissal_kind': 'Dismissal Kind'})
             )
     else:
         df_filtered = (
-            df_all1.query(f"player_dismissed == '{player_name}' & season == '{season}'")
-            .groupby(by = ['season','dismissal_kind'], as_index = False)
+            filters.rows('fact', 'player_dismissed', player_name)
+            .pipe(filters.select, season = str(season))
+            .groupby(by = ['season','dismissal_kind'], as_index = False, observed = True)
             .agg(Count = ('dismissal_kind', 'count'))
             .sort_values(by = 'Count', ascending = False, ignore_index = True)
             .rename(columns = {'dismissal_kind': 'Dismissal Kind'})
@@ -263,17 +231,19 @@ def player_dismissal_type(player_name, season = 'All'):
 def player_dismissal_bowler(player_name, season = 'All'):
     if season == 'All':
         df_filtered = (
-            df_all1
-            .query(f"player_dismissed == '{player_name}' & dismissal_kind != 'run out'")
-            .groupby(by = ['bowler', 'dismissal_kind'], as_index = False)
+            filters.rows('fact', 'player_dismissed', player_name)
+            .loc[lambda df_: ~filters.mask(df_, 'dismissal_kind', 'run out')]
+            .groupby(by = ['bowler', 'dismissal_kind'], as_index = False, observed = True)
             .agg(Count = ('dismissal_kind', 'count'))
             .sort_values(by = 'Count', ascending = False, ignore_index = True)
             .rename(columns = {'bowler': 'Bowler', 'dismissal_kind': 'Dismissal Kind'})
             )
     else:
         df_filtered = (
-            df_all1.query(f"player_dismissed == '{player_name}' & season == '{season}' & dismissal_kind != 'run out'")
-            .groupby(by = ['season','bowler', 'dismissal_kind'], as_index = False)
+            filters.rows('fact', 'player_dismissed', player_name)
+            .pipe(filters.select, season = str(season))
+            .loc[lambda df_: ~filters.mask(df_, 'dismissal_kind', 'run out')]
+            .groupby(by = ['season','bowler', 'dismissal_kind'], as_index = False, observed = True)
             .agg(Count = ('dismissal_kind', 'count'))
             .sort_values(by = 'Count', ascending = False, ignore_index = True)
             .rename(columns = {'season': 'Season', 'bowler': 'Bowler','dismissal_kind': 'Dismissal Kind'})
@@ -285,7 +255,7 @@ def player_dismissal_bowler(player_name, season = 'All'):
 def top_rival_bowler(player_name):
     return (
         player_dismissal_bowler(player_name = player_name, season = 'All')
-        .groupby(by = ['Bowler'], as_index = False)
+        .groupby(by = ['Bowler'], as_index = False, observed = True)
         .agg(Dismissals = ('Count', 'sum'))
         .sort_values(by = ['Dismissals'], ascending = False, ignore_index = True)  
     )
@@ -293,9 +263,9 @@ def top_rival_bowler(player_name):
 def run_type(player_name, type):
     top_rival_bowlers_list = top_rival_bowler(player_name)['Bowler'].head(10).values
     return (
-        df_all1
-        .query(f"batter == '{player_name}' & bowler in @top_rival_bowlers_list & batsman_runs == {type}")
-        .groupby(by = ['bowler'], as_index = False)
+        filters.rows('fact', 'batter', player_name)
+        .pipe(filters.select, bowler = top_rival_bowlers_list, batsman_runs = type)
+        .groupby(by = ['bowler'], as_index = False, observed = True)
         .agg(**{f"{type}'s": ('batsman_runs', 'count')})
         .rename(columns = {'bowler': 'Bowler'})
     )
@@ -304,8 +274,9 @@ def performance_rival_bowler(player_name):
     top_rival_bowlers_list = top_rival_bowler(player_name)['Bowler'].head(10).values
 
     df = (
-        df_all1.query(f"batter == '{player_name}' & bowler in @top_rival_bowlers_list")
-        .groupby(by = ['bowler'], as_index = False)
+        filters.rows('fact', 'batter', player_name)
+        .pipe(filters.select, bowler = top_rival_bowlers_list)
+        .groupby(by = ['bowler'], as_index = False, observed = True)
         .agg(
             Balls = ('ball', 'count'),
             Runs = ('batsman_runs', 'sum')
@@ -334,38 +305,28 @@ def performance_rival_bowler(player_name):
 ## Century
 def player_century(player_name):
     return (
-        df_all1.query(f"batter == '{player_name}'")
-        .groupby(by = ['id', 'season', 'bowling_team', 'batter'], as_index = False)
-        .agg(Runs = ('batsman_runs', 'sum'))
-        .query("Runs >= 100")
-        .rename(columns = {'id':'Match ID', 'season': 'Season', 'bowling_team':'Bowling Team', 'batter': 'Batsman'})
+        match_runs(player_name)
+        .loc[lambda df_: df_['Runs'] >= 100]
+        [['Match ID', 'Season', 'Bowling Team', 'Batsman', 'Runs']]
     )
 
 def player_half_century(player_name):
     return (
-        df_all1.query(f"batter == '{player_name}'")
-        .groupby(by = ['id', 'season', 'bowling_team', 'batter'], as_index = False)
-        .agg(Runs = ('batsman_runs', 'sum'))
-        .query("Runs >= 50 & Runs < 100")
-        .rename(columns = {'id':'Match ID', 'season': 'Season', 'bowling_team':'Bowling Team', 'batter': 'Batsman'})
+        match_runs(player_name)
+        .loc[lambda df_: df_['Runs'].between(50, 100, inclusive = 'left')]
+        [['Match ID', 'Season', 'Bowling Team', 'Batsman', 'Runs']]
     )
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ## Batsman Overall stats
 def batsman_stats_all(player_name):
     return (
-        df_all1.query(f"batter == '{player_name}'")
-        .groupby(by = ['batter', 'inning','season', 'batting_team', 'bowling_team'], as_index = False)
-        .agg(
-            Runs = ('batsman_runs', 'sum'),
-            Balls = ('batsman_runs', 'count'),
-            Sixes = ('batsman_runs', lambda x: (x == 6).sum()),
-            Fours = ('batsman_runs', lambda x: (x == 4).sum()),
-            Threes = ('batsman_runs', lambda x: (x == 3).sum()),
-            Twos = ('batsman_runs', lambda x: (x == 2).sum()),
-            Ones = ('batsman_runs', lambda x: (x == 1).sum()),
-            Dots = ('batsman_runs', lambda x: (x == 0).sum())
-        )
+        match_runs(player_name)
+        .groupby(by = ['Batsman', 'Inning', 'Season', 'Team', 'Bowling Team'], as_index = False, observed = True)
+        [['Runs', 'Balls', 'Sixes', 'Fours', 'Threes', 'Twos', 'Ones', 'Dots']]
+        .sum()
+        .rename(columns = {'Batsman': 'batter', 'Inning': 'inning', 'Season': 'season',
+                           'Team': 'batting_team', 'Bowling Team': 'bowling_team'})
     )
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
@@ -373,7 +334,7 @@ def batsman_stats_all(player_name):
 def batsman_stats_inning(player_name):
     return (
         batsman_stats_all(player_name)
-        .groupby(by = ['batter','inning', 'season'], as_index = False)
+        .groupby(by = ['batter','inning', 'season'], as_index = False, observed = True)
         .agg(
             Runs = ('Runs', 'sum'),
             Balls = ('Balls', 'sum'),
@@ -398,24 +359,25 @@ def player_top_scores(player_name):
 ## Century win Cause
 def century_win_cause(player_name, century = True):
     if century == True:
-        df = match_runs(player_name).query("Runs >= 100")
+        df = player_innings(player_name).loc[lambda df_: df_['Runs'] >= 100]
     else:
-        df = match_runs(player_name).query("Runs >= 50 & Runs < 100")
+        df = player_innings(player_name).loc[lambda df_: df_['Runs'].between(50, 100, inclusive = 'left')]
     return (
         df
-        .merge(matches[['id', 'winner']], left_on = 'Match ID', right_on = 'id')
-        .assign(Won = lambda df_: (df_['Team'] == df_['winner']).astype('int'))
-        .rename(columns = {'winner': 'Winner'})
-        .drop('id', axis = 1)
+        .drop(columns = ['Dismissals', 'Winner'])
+        .assign(
+            Winner = df['Winner'],
+            Won = lambda df_: (df_['Team'] == df_['Winner']).astype('int')
+        )
     )
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ## Performance of Batsman against Teams
 def batsman_against_team(player_name, rival_team):
     return (
-        match_runs(player_name)
-        .query(f"`Bowling Team` == '{rival_team}'")
-        .groupby(by = 'Bowling Team', as_index = False)
+        player_innings(player_name)
+        .loc[lambda df_: df_['Bowling Team'] == rival_team]
+        .groupby(by = 'Bowling Team', as_index = False, observed = True)
         .agg(
             Innings = ('Match ID', 'nunique'),
             Runs = ('Runs', 'sum'),
@@ -428,15 +390,10 @@ def batsman_against_team(player_name, rival_team):
             Twos = ('Twos', 'sum'),
             Ones = ('Ones', 'sum'),
             Dots = ('Dots', 'sum'),
+            Dismissals = ('Dismissals', 'sum')
         )
-        .merge(
-            (
-            df_all1.query(f"batter == '{player_name}' & bowling_team == '{rival_team}' & player_dismissed == '{player_name}'")
-            .groupby(by = 'bowling_team', as_index = False)
-            .agg(count = ('player_dismissed', 'count'))
-            .rename(columns = {'bowling_team': 'Bowling Team', 'count': 'Dismissals'})
-            ), on = 'Bowling Team', how = 'outer'
-        )
+        # A batsman never dismissed by the rival has no dismissal count rather than zero
+        .replace({'Dismissals': {0: np.nan}})
         .assign(
             Strike_Rate = lambda df_: round((df_['Runs']/df_['Balls'])*100,4),
             Boundary_Percent = lambda df_: round(((df_['Sixes']*6 + df_['Fours']*4)/df_['Runs'])*100,4),
@@ -457,13 +414,12 @@ def batsman_against_team(player_name, rival_team):
 ## Bowler Team(s) & Season(s)
 def bowler_teams(bowler_name):
     df = (
-        df_all1
-        .groupby(by = ['bowler', 'bowling_team'], as_index = False)
+        filters.rows('fact', 'bowler', bowler_name)
+        .groupby(by = ['bowler', 'bowling_team'], as_index = False, observed = True)
         .agg(
             Season = ('season', lambda x: ", ".join(x.unique())),
             Count = ('season', 'nunique')
         )
-        .query(f"bowler == '{bowler_name}'")
         .rename(columns = {'bowler': 'Bowler', 'bowling_team': 'Team'})
         .drop(columns = ['Bowler'])
     )
@@ -471,45 +427,14 @@ def bowler_teams(bowler_name):
     return df
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
-## Bowler Stats Overall
-bowler_dismissal_type = ['bowled', 'lbw', 'stumped', 'caught and bowled', 'caught', 'hit wicket']
-individual_wickets = (
-    df_all1.query("is_wicket == 1 & dismissal_kind in @bowler_dismissal_type")
-    .groupby(by = ['bowler', 'season', 'id', 'inning', 'bowling_team','batting_team'], as_index = False)
-    .agg(
-        matches = ('id', 'nunique'),
-        wickets = ('is_wicket', 'sum')
-    )
-)
-
-economy_rate = (
-    df_all1
-    .groupby(by = ['bowler', 'season', 'id', 'inning', 'bowling_team', 'batting_team'], as_index = False)
-    .agg(
-        balls = ('total_runs', 'count'),
-        runs_conceded = ('total_runs', 'sum')
-    )
-    .assign(
-        overs = lambda df_: round(df_['balls']/6, 2),
-        economy_rate = lambda df_: round(df_['runs_conceded']/df_['overs'],2)
-    )
-    .sort_values(by = 'economy_rate', ascending = True, ignore_index = True)
-)
-
-dot_balls = (
-    df_all1.query("total_runs == 0")
-    .groupby(by = ['bowler', 'season', 'id', 'inning', 'bowling_team', 'batting_team'], as_index = False)
-    .agg(
-        dot_balls = ('total_runs', 'count')
-    )
-    .sort_values(by = 'dot_balls', ascending = False, ignore_index = True)
-)
-
+## Runs Conceded by Type
+# The spells that conceded at least one run_type, read from the per-spell counts of the bowler_spells aggregate
 def runs_type_conceded(run_type, str_run_type):
+    column = f'count_{str_run_type}_conceded'
     return (
-        df_all1.query(f"batsman_runs == {run_type}")
-        .groupby(by = ['bowler', 'season', 'id', 'inning', 'bowling_team', 'batting_team'], as_index=False)
-        .agg(**{f'count_{str_run_type}_conceded': ('batsman_runs', 'count')}) 
+        aggregates.table('bowler_spells')
+        .loc[lambda df_: df_[column] > 0, aggregates.BOWLER_SPELL_KEYS + [column]]
+        .sort_values(by = aggregates.BOWLER_SPELL_KEYS, ignore_index = True)
     )
 
 sixes_conceded_df = runs_type_conceded(run_type = 6, str_run_type = 'six')
@@ -518,41 +443,24 @@ threes_conceded_df = runs_type_conceded(run_type = 3, str_run_type = 'three')
 twos_conceded_df = runs_type_conceded(run_type = 2, str_run_type = 'two')
 ones_conceded_df = runs_type_conceded(run_type = 1, str_run_type = 'one')
 
-bowler_extra_runs = (
-    df_all1.query("extra_runs > 0")
-    .groupby(by = ['bowler', 'season', 'id', 'inning', 'bowling_team', 'batting_team'], as_index = False)
-    .agg(
-        count_extra_runs = ('extra_runs', 'sum')
-    )
-)
-
+# ------------------------------------------------------------------------------------------------------------------------------------------
+## Bowler Stats Overall
+# One row per bowler spell, with the counts summed in a single pass at build time
 bowler_stats_overall = (
-    individual_wickets
-    .merge(economy_rate, on = ['bowler', 'season', 'inning', 'id', 'bowling_team', 'batting_team'], how = 'outer')
-    .merge(dot_balls, on = ['bowler', 'season', 'inning', 'id', 'bowling_team', 'batting_team'], how = 'outer')
-    .merge(sixes_conceded_df, on = ['bowler', 'season', 'id', 'inning', 'bowling_team', 'batting_team'], how = 'outer')
-    .merge(fours_conceded_df, on = ['bowler', 'season', 'id', 'inning', 'bowling_team', 'batting_team'], how = 'outer')
-    .merge(threes_conceded_df, on = ['bowler', 'season', 'id', 'inning', 'bowling_team', 'batting_team'], how = 'outer')
-    .merge(twos_conceded_df, on = ['bowler', 'season', 'id', 'inning', 'bowling_team', 'batting_team'], how = 'outer')
-    .merge(ones_conceded_df, on = ['bowler', 'season', 'id', 'inning', 'bowling_team', 'batting_team'], how = 'outer')
-    .merge(bowler_extra_runs, on = ['bowler', 'season', 'id', 'inning', 'bowling_team', 'batting_team'], how = 'outer')
-    .assign(
-        matches = lambda df_: df_['matches'].fillna(0).astype('int'),
-        wickets = lambda df_: df_['wickets'].fillna(0).astype('int'),
-        dot_balls = lambda df_: df_['dot_balls'].fillna(0).astype('int'),
-        count_six_conceded = lambda df_: df_['count_six_conceded'].fillna(0).astype('int'),
-        count_four_conceded = lambda df_: df_['count_four_conceded'].fillna(0).astype('int'),
-        count_three_conceded = lambda df_: df_['count_three_conceded'].fillna(0).astype('int'),
-        count_two_conceded = lambda df_: df_['count_two_conceded'].fillna(0).astype('int'),
-        count_one_conceded = lambda df_: df_['count_one_conceded'].fillna(0).astype('int'),
-        count_extra_runs = lambda df_: df_['count_extra_runs'].fillna(0).astype('int')
-    )
+    aggregates.table('bowler_spells')
     .assign(
+        matches = lambda df_: (df_['wickets'] > 0).astype('int'),
+        overs = lambda df_: round(df_['balls']/6, 2),
+        economy_rate = lambda df_: round(df_['runs_conceded']/df_['overs'],2),
         bowling_average = lambda df_: round(df_['runs_conceded']/df_['wickets'], 2),
         strike_rate = lambda df_: round(df_['balls']/df_['wickets'],2),
         boundary_rate = lambda df_: round((df_['count_six_conceded'] + df_['count_four_conceded'])/df_['balls'],2),
         dot_ball_percent = lambda df_: round((df_['dot_balls']/df_['balls'])*100, 4)
     )
+    [['bowler', 'season', 'id', 'inning', 'bowling_team', 'batting_team', 'matches', 'wickets', 'balls', 'runs_conceded',
+      'overs', 'economy_rate', 'dot_balls', 'count_six_conceded', 'count_four_conceded', 'count_three_conceded',
+      'count_two_conceded', 'count_one_conceded', 'count_extra_runs', 'bowling_average', 'strike_rate',
+      'boundary_rate', 'dot_ball_percent']]
 )
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
@@ -560,7 +468,7 @@ bowler_stats_overall = (
 def bowler_stats_innings(bowler_name):
     return (
         bowler_stats_overall
-        .groupby(by = ['bowler', 'inning'], as_index = False)
+        .groupby(by = ['bowler', 'inning'], as_index = False, observed = True)
         .agg(
             matches = ('id', 'nunique'),
             wickets = ('wickets', 'sum'),
@@ -593,7 +501,7 @@ def bowler_stats_innings(bowler_name):
         .loc[:, ['Bowler', 'Inning', 'Matches', 'Wickets', 'Balls', 'Overs', 'Runs Conceded', 'Dot Balls',
                  'Economy Rate', 'Bowling Average', 'Strike Rate', 'Boundary %', 'Dot Ball %', '6s Conceded', 
                  '4s Conceded', '3s Conceded', '2s Conceded', '1s Conceded', 'Extra Runs']]
-        .query(f"Bowler == '{bowler_name}'")
+        .pipe(filters.select, Bowler = bowler_name)
     )
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
@@ -601,7 +509,7 @@ def bowler_stats_innings(bowler_name):
 def bowler_stats_seasons(bowler_name):
     return (
         bowler_stats_overall
-        .groupby(by = ['bowler', 'season'], as_index = False)
+        .groupby(by = ['bowler', 'season'], as_index = False, observed = True)
         .agg(
             matches = ('id', 'nunique'),
             wickets = ('wickets', 'sum'),
@@ -634,7 +542,7 @@ def bowler_stats_seasons(bowler_name):
         .loc[:, ['Bowler', 'Season', 'Matches', 'Wickets', 'Balls', 'Overs', 'Runs Conceded', 'Dot Balls',
                  'Economy Rate', 'Bowling Average', 'Strike Rate', 'Boundary Rate', 'Dot Ball %', '6s Conceded', 
                  '4s Conceded', '3s Conceded', '2s Conceded', '1s Conceded', 'Extra Runs']]
-        .query(f"Bowler == '{bowler_name}'")
+        .pipe(filters.select, Bowler = bowler_name)
     )
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
@@ -642,7 +550,7 @@ def bowler_stats_seasons(bowler_name):
 def bowler_stats_seasons_inning(bowler_name):
     return (
         bowler_stats_overall
-        .groupby(by = ['bowler', 'season', 'inning'], as_index = False)
+        .groupby(by = ['bowler', 'season', 'inning'], as_index = False, observed = True)
         .agg(
             matches = ('id', 'nunique'),
             wickets = ('wickets', 'sum'),
@@ -675,13 +583,13 @@ def bowler_stats_seasons_inning(bowler_name):
         .loc[:, ['Bowler', 'Season', 'Inning', 'Matches', 'Wickets', 'Balls', 'Overs', 'Runs Conceded', 'Dot Balls',
                  'Economy Rate', 'Bowling Average', 'Strike Rate', 'Boundary Rate', 'Dot Ball %', '6s Conceded', 
                  '4s Conceded', '3s Conceded', '2s Conceded', '1s Conceded', 'Extra Runs']]
-        .query(f"Bowler == '{bowler_name}'")
+        .pipe(filters.select, Bowler = bowler_name)
     )
 
 def bowler_stats_teams(bowler_name):
     return (
         bowler_stats_overall
-        .groupby(by = ['bowler', 'batting_team'], as_index = False)
+        .groupby(by = ['bowler', 'batting_team'], as_index = False, observed = True)
         .agg(
             matches = ('id', 'nunique'),
             wickets = ('wickets', 'sum'),
@@ -714,7 +622,7 @@ def bowler_stats_teams(bowler_name):
         .loc[:, ['Bowler', 'Rival Team', 'Matches', 'Wickets', 'Balls', 'Overs', 'Runs Conceded', 'Dot Balls',
                  'Economy Rate', 'Bowling Average', 'Strike Rate', 'Boundary %', 'Dot Ball %', '6s Conceded', 
                  '4s Conceded', '3s Conceded', '2s Conceded', '1s Conceded', 'Extra Runs']]
-        .query(f"Bowler == '{bowler_name}'")
+        .pipe(filters.select, Bowler = bowler_name)
     )
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
@@ -722,7 +630,7 @@ def bowler_stats_teams(bowler_name):
 def bowler_stats_teams_season(bowler_name, team):
     return (
         bowler_stats_overall
-        .groupby(by = ['bowler', 'batting_team', 'season'], as_index = False)
+        .groupby(by = ['bowler', 'batting_team', 'season'], as_index = False, observed = True)
         .agg(
             matches = ('id', 'nunique'),
             wickets = ('wickets', 'sum'),
@@ -755,7 +663,7 @@ def bowler_stats_teams_season(bowler_name, team):
         .loc[:, ['Bowler', 'Rival Team', 'Season', 'Matches', 'Wickets', 'Balls', 'Overs', 'Runs Conceded', 'Dot Balls',
                  'Economy Rate', 'Bowling Average', 'Strike Rate', 'Boundary Rate', 'Dot Ball %', '6s Conceded', 
                  '4s Conceded', '3s Conceded', '2s Conceded', '1s Conceded', 'Extra Runs']]
-        .query(f"Bowler == '{bowler_name}' & `Rival Team` == '{team}'")
+        .pipe(filters.select, **{'Bowler': bowler_name, 'Rival Team': team})
     )
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
@@ -4,118 +4,73 @@ import streamlit as st
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
-import joblib
-import os
+from scripts import datasets, filters
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 # Load datasets
-filepath = os.path.abspath('data/processed/deliveries_all.joblib')
-deliveries_all = joblib.load(filepath)
-
-filepath = os.path.abspath('data/processed/matches.joblib')
-matches = joblib.load(filepath)
-
-filepath = os.path.abspath('data/processed/deliveries.joblib')
-deliveries = joblib.load(filepath)
-
-# ------------------------------------------------------------------------------------------------------------------------------------------
-
-matches = (
-    matches
-    .assign(
-        winner = lambda df_: df_['winner'].fillna('No Result')
-    )
-    .replace({'Elimination Final': 'Eliminator'})
-)
-
-# ------------------------------------------------------------------------------------------------------------------------------------------
-
-df_all1 = (
-    matches
-    .merge(deliveries, left_on = 'id', right_on = 'match_id', how = 'inner') 
-)
+# The ball-level rows are selected through scripts.filters, on first use
+DATASETS = {
+    'matches': ['id', 'season', 'city', 'match_type', 'player_of_match', 'venue', 'team1', 'team2',
+                'toss_winner', 'toss_decision', 'winner', 'result']
+}
+matches, = datasets.load(DATASETS)
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ## 1. Key-Highlights
 ### 1.1. Total Matches
-def season_total_matches(seasons = 'All'):
-    df_team = df_all1
+def _total_matches(df_filtered):
+    return df_filtered['id'].nunique()
 
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
-
-    total_matches = df_filtered['id'].nunique()
-
-    return total_matches
+def season_total_matches(seasons = 'All'):
+    return _total_matches(filters.season_rows('fact', seasons))
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 1.2. Total Matches by Match Type
-def season_match_type(seasons = 'All'):
-    df_team = df_all1
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
-
+def _match_type(df_filtered):
     return (
         df_filtered
-        .groupby(by = ['match_type'], as_index = False)
+        .groupby(by = ['match_type'], as_index = False, observed = True)
         .agg(Matches = ('id', 'nunique'))
         .sort_values(by = 'Matches', ascending = False, ignore_index = True)
-        .rename(columns = {'match_type': 'Match Type'})  
+        .rename(columns = {'match_type': 'Match Type'})
     )
 
+def season_match_type(seasons = 'All'):
+    return _match_type(filters.season_rows('fact', seasons))
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 1.3. Participating Teams
-def season_teams(seasons = 'All'):
-    df_team = df_all1
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
-
+def _teams(df_filtered):
     teams = list(set(list(df_filtered['team1'].unique()) + list(df_filtered['team2'].unique())))
     teams_df = pd.DataFrame(teams, columns = ['Team'])
     teams_df = teams_df.sort_values(by = 'Team')
     teams_df.index = range(1, len(teams_df)+1)
     return teams_df
 
+def season_teams(seasons = 'All'):
+    return _teams(filters.season_rows('fact', seasons))
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ## 1.4.1. Metrics I - SunBurst Chart
-def season_highlights_general(seasons = 'All'):
-    if seasons == 'All':  
-        df_filtered = df_all1
-    elif isinstance(seasons, list):
-        df_filtered = df_all1.query("season == @seasons")
-    else:
-        df_filtered = df_all1.query(f"season == '{seasons}'")
-
+def _highlights_general(df_filtered):
     total_matches1 =  df_filtered['id'].nunique()
     cities1 = df_filtered['city'].nunique()
     venues1 = df_filtered['venue'].nunique()
 
     return total_matches1, cities1, venues1
 
-def season_highlights_batsman(seasons='All'):
-    df_team = df_all1
+def season_highlights_general(seasons = 'All'):
+    return _highlights_general(filters.season_rows('fact', seasons))
 
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+# Runs of every batter in every match
+def _batter_match_runs(df_filtered):
+    return (
+        df_filtered
+        .groupby(by = ['id', 'batter'], as_index = False, observed = True)
+        .agg(Runs = ('batsman_runs', 'sum'))
+    )
 
+def _highlights_batsman(df_filtered, match_runs):
     batsman_runs = df_filtered['batsman_runs'].sum()
     extra_runs = df_filtered['extra_runs'].sum()
 
@@ -123,250 +78,169 @@ def season_highlights_batsman(seasons='All'):
     p2 = df_filtered['non_striker'].unique()
     batsman_count = len(set(list(p1) + list(p2)))
 
-    sixes = df_filtered.query("batsman_runs == 6")['batsman_runs'].count()
-    fours = df_filtered.query("batsman_runs == 4")['batsman_runs'].count()
-
-    centuries = (
-        df_filtered.groupby(['id', 'batter'])
-        .agg(runs=('batsman_runs', 'sum'))
-        .query("runs >= 100")
-        .runs.count()
-    )
+    sixes = (df_filtered['batsman_runs'] == 6).sum()
+    fours = (df_filtered['batsman_runs'] == 4).sum()
 
-    half_centuries = (
-        df_filtered.groupby(['id', 'batter'])
-        .agg(runs=('batsman_runs', 'sum'))
-        .query("50 <= runs < 100")
-        .runs.count()
-    )
+    centuries = (match_runs['Runs'] >= 100).sum()
+    half_centuries = match_runs['Runs'].between(50, 100, inclusive = 'left').sum()
 
     return batsman_runs, extra_runs, sixes, fours, centuries, half_centuries, batsman_count
 
-def season_highlights_bowler(seasons='All'):
-    df_team = df_all1
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+def season_highlights_batsman(seasons='All'):
+    df_filtered = filters.season_rows('fact', seasons)
+    return _highlights_batsman(df_filtered, _batter_match_runs(df_filtered))
 
+def _highlights_bowler(df_filtered):
     bowler_count = df_filtered['bowler'].nunique()
     balls = df_filtered.shape[0]
-    wickets = df_filtered.query("is_wicket == 1").shape[0]
+    wickets = (df_filtered['is_wicket'] == 1).sum()
 
     bowler_dismissal_type = ['caught', 'caught and bowled', 'bowled', 'lbw', 'stumped']
-    
-    four_wickets = (
-        df_filtered.query("is_wicket == 1 and dismissal_kind in @bowler_dismissal_type")
-        .groupby(['id', 'bowler'])
-        .agg(wickets=('is_wicket', 'sum'))
-        .query("wickets == 4")
-        .shape[0]
-    )
 
-    five_plus_wickets = (
-        df_filtered.query("is_wicket == 1 and dismissal_kind in @bowler_dismissal_type")
-        .groupby(['id', 'bowler'])
+    match_wickets = (
+        filters.select(df_filtered, is_wicket = 1, dismissal_kind = bowler_dismissal_type)
+        .groupby(['id', 'bowler'], observed = True)
         .agg(wickets=('is_wicket', 'sum'))
-        .query("wickets >= 5")
-        .shape[0]
     )
 
+    four_wickets = (match_wickets['wickets'] == 4).sum()
+    five_plus_wickets = (match_wickets['wickets'] >= 5).sum()
+
     return bowler_count, balls, wickets, four_wickets, five_plus_wickets
 
+def season_highlights_bowler(seasons='All'):
+    return _highlights_bowler(filters.season_rows('fact', seasons))
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ## 1.4.2. Metrics II - Metrics Display
 
 ### 1.4.2.1. Player of Match
-def pom(seasons = 'All'):
-    df_team = df_all1
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
-    
+def _pom(df_filtered):
     return (
         df_filtered
-        .groupby(by = 'player_of_match', as_index = False)
+        .groupby(by = 'player_of_match', as_index = False, observed = True)
         .agg(Count = ('id', 'nunique'))
         .sort_values(by = 'Count', ascending = False, ignore_index = True)
         .rename(columns = {'player_of_match': 'Player of Match'})
     )
 
+def pom(seasons = 'All'):
+    return _pom(filters.season_rows('fact', seasons))
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 1.4.2.2. Leading Run Scorer
-def leading_run_scorer(seasons='All'):
-    df_team = df_all1
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
-
+def _leading_run_scorer(df_cube):
     return (
-        df_filtered
-        .groupby(by = 'batter', as_index = False)
-        .agg(Runs = ('batsman_runs', 'sum'))
+        df_cube
+        .groupby(by = 'batter', as_index = False, observed = True)
+        .agg(Runs = ('runs', 'sum'))
         .sort_values(by = 'Runs', ascending = False, ignore_index = True)
         .rename(columns = {'batter': 'Batsman'})
     )
 
+def leading_run_scorer(seasons='All'):
+    return _leading_run_scorer(filters.season_rows('season_cube', seasons))
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 1.4.2.3. Leading Wicket Taker
 bowler_dismissal_type = ['caught', 'caught and bowled', 'bowled', 'lbw', 'stumped', 'hit wicket']
 
-def leading_wicket_taker(seasons='All'):
-    df_team = df_all1.query(f"dismissal_kind in @bowler_dismissal_type")
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+# Balls of every wicket credited to the bowler
+def _bowler_wickets(df_filtered):
+    return filters.select(df_filtered, dismissal_kind = bowler_dismissal_type)
 
+def _leading_wicket_taker(df_cube):
     return (
-        df_filtered
-        .groupby(by = 'bowler', as_index = False)
-        .agg(Wickets = ('is_wicket', 'sum'))
+        df_cube
+        .groupby(by = 'bowler', as_index = False, observed = True)
+        .agg(Wickets = ('wickets', 'sum'))
+        .loc[lambda df_: df_['Wickets'] > 0]
         .sort_values(by = 'Wickets', ascending = False, ignore_index = True)
         .rename(columns = {'bowler': 'Bowler'})
     )
 
+def leading_wicket_taker(seasons='All'):
+    return _leading_wicket_taker(filters.season_rows('season_cube', seasons))
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 1.4.2.4. Highest Team Score
-def individual_team_score(seasons='All'):
-    df_team = df_all1
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
-
+def _individual_team_score(df_filtered):
     return (
         df_filtered
-        .groupby(by = ['id','batting_team','season'], as_index = False)
+        .groupby(by = ['id','batting_team','season'], as_index = False, observed = True)
         .agg(Runs = ('total_runs', 'sum'))
         .sort_values(by = 'Runs', ascending = False, ignore_index = True)
         .rename(columns = {'id': 'Match', 'batting_team': 'Batting Team', 'season': 'Season'})
     )
 
+def individual_team_score(seasons='All'):
+    return _individual_team_score(filters.season_rows('fact', seasons))
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 1.4.2.5. Individual Highest Score
-def individual_score(seasons='All'):
-    df_team = df_all1
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
-
+def _individual_score(match_runs):
     return (
-        df_filtered
-        .groupby(by = ['id', 'batter'], as_index = False)
-        .agg(Runs = ('batsman_runs', 'sum'))
+        match_runs
         .sort_values(by = 'Runs', ascending = False, ignore_index = True)
         .rename(columns = {'batter': 'Batsman'})
         .drop(columns = ['id'])
     )
 
+def individual_score(seasons='All'):
+    return _individual_score(_batter_match_runs(filters.season_rows('fact', seasons)))
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 1.4.2.6. Best Bowling Figures
-bowler_dismissal_type = ['caught', 'caught and bowled', 'bowled', 'lbw', 'stumped', 'hit wicket']
-
-def best_bowling_figure(seasons = 'All'):
-    df_team1 = df_all1.query(f"dismissal_kind in @bowler_dismissal_type")
-    df_team2 = df_all1.query("is_wicket == 0")
-    
-    if seasons == 'All':
-        df_filtered1 = df_team1
-        df_filtered2 = df_team2
-    elif isinstance(seasons, list):
-        df_filtered1 = df_team1.query("season in @seasons")
-        df_filtered2 = df_team2.query("season in @seasons")
-    else:
-        df_filtered1 = df_team1.query(f"season == '{seasons}'")
-        df_filtered2 = df_team2.query(f"season == '{seasons}'")
-
+def _best_bowling_figure(df_filtered, df_wickets):
     return (
-        df_filtered1
-        .groupby(by = ['id', 'season', 'bowler'], as_index = False)
+        df_wickets
+        .groupby(by = ['id', 'season', 'bowler'], as_index = False, observed = True)
         .agg(Wickets = ('is_wicket', 'sum'))
         .merge(
             (
-                df_filtered2
-                .groupby(by = ['id', 'season', 'bowler'], as_index = False)
+                df_filtered[df_filtered['is_wicket'] == 0]
+                .groupby(by = ['id', 'season', 'bowler'], as_index = False, observed = True)
                 .agg(Runs = ('total_runs', 'sum'))
             ),
             on = ['id', 'season', 'bowler']
         )
         .sort_values(by = ['Wickets', 'Runs'], ascending = [False, True], ignore_index = True)
-        .rename(columns = {'id': 'Match ID', 'bowler': 'Bowler', 'season': 'Season'})    
+        .rename(columns = {'id': 'Match ID', 'bowler': 'Bowler', 'season': 'Season'})
     )
 
+def best_bowling_figure(seasons = 'All'):
+    df_filtered = filters.season_rows('fact', seasons)
+    return _best_bowling_figure(df_filtered, _bowler_wickets(df_filtered))
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 1.4.2.7. Most Boundaries, Sixes & Fours
-def boundaries(boundary = None, seasons = 'All'):
-    df_team = df_all1
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
-
+def _boundaries(df_cube, boundary = None):
     if (boundary == 4) | (boundary == 6):
-        return(
-            df_filtered
-            .query(f"batsman_runs == {boundary}")
-            .groupby(by = ['batter'], as_index = False)
-            .agg(Count = ('batsman_runs', 'count'))
-            .sort_values(by = 'Count', ascending = False, ignore_index = True)
-            .rename(columns = {'batter': 'Batsman'})
-        )
+        counts = df_cube.assign(Count = df_cube[{4: 'fours', 6: 'sixes'}[boundary]])
     else:
-        return(
-            df_filtered
-            .query(f"batsman_runs == 4 or batsman_runs == 6")
-            .groupby(by = ['batter'], as_index = False)
-            .agg(Count = ('batsman_runs', 'count'))
-            .sort_values(by = 'Count', ascending = False, ignore_index = True)
-            .rename(columns = {'batter': 'Batsman'})
-        )
+        counts = df_cube.assign(Count = df_cube['fours'] + df_cube['sixes'])
+
+    return(
+        counts
+        .groupby(by = ['batter'], as_index = False, observed = True)
+        .agg(Count = ('Count', 'sum'))
+        .loc[lambda df_: df_['Count'] > 0]
+        .sort_values(by = 'Count', ascending = False, ignore_index = True)
+        .rename(columns = {'batter': 'Batsman'})
+    )
+
+def boundaries(boundary = None, seasons = 'All'):
+    return _boundaries(filters.season_rows('season_cube', seasons), boundary)
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 1.4.2.8. Most Catches
 fielding = ['caught', 'caught and bowled']
-def catches(seasons = 'All'):
-    df_team1 = df_all1.query("dismissal_kind == 'caught'")
-    df_team2 = df_all1.query("dismissal_kind == 'caught and bowled'")
-    
-    if seasons == 'All':
-        df_filtered1 = df_team1
-        df_filtered2 = df_team2
-    elif isinstance(seasons, list):
-        df_filtered1 = df_team1.query("season in @seasons")
-        df_filtered2 = df_team2.query("season in @seasons")
-    else:
-        df_filtered1 = df_team1.query(f"season == '{seasons}'")
-        df_filtered2 = df_team2.query(f"season == '{seasons}'")
 
+def _catches(df_filtered):
     return(
-        df_filtered1['fielder'].value_counts().reset_index()
+        df_filtered[df_filtered['dismissal_kind'] == 'caught']['fielder'].value_counts().loc[lambda x: x > 0].reset_index()
         .merge(
-            (df_filtered2['bowler'].value_counts().reset_index()),
+            (df_filtered[df_filtered['dismissal_kind'] == 'caught and bowled']['bowler'].value_counts().loc[lambda x: x > 0].reset_index()),
              left_on = 'fielder', right_on = 'bowler', how = 'outer'
         )
         .assign(
@@ -381,43 +255,58 @@ def catches(seasons = 'All'):
         .rename(columns = {'fielder': 'Fielder', 'count': 'Count'})
     )
 
+def catches(seasons = 'All'):
+    return _catches(filters.season_rows('fact', seasons))
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 1.4.2.9. Most Stumpings
-def stumpings(seasons = 'All'):
-    df_team = df_all1.query("dismissal_kind == 'stumped'")
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
-
+def _fielder_dismissals(df_filtered, kind):
     return(
-        df_filtered['fielder']
+        df_filtered[df_filtered['dismissal_kind'] == kind]['fielder']
         .value_counts()
+        .loc[lambda x: x > 0]
         .reset_index()
         .rename(columns = {'fielder': 'Fielder', 'count': 'Count'})
     )
 
+def stumpings(seasons = 'All'):
+    return _fielder_dismissals(filters.season_rows('fact', seasons), 'stumped')
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 1.4.2.10. Most Run Outs
 def runouts(seasons = 'All'):
-    df_team = df_all1.query("dismissal_kind == 'run out'")
+    return _fielder_dismissals(filters.season_rows('fact', seasons), 'run out')
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+### 1.4.3. All Highlights
+# Every Key-Highlights value of the selected seasons from one season filter; the batters' match scores are
+# computed once and shared by the cards that read them, and the leaderboards are summed from the season cube.
+def season_highlights(seasons = 'All'):
+    df_filtered = filters.season_rows('fact', seasons)
+    df_cube = filters.season_rows('season_cube', seasons)
+    match_runs = _batter_match_runs(df_filtered)
+
+    return {
+        'total_matches': _total_matches(df_filtered),
+        'match_type': _match_type(df_filtered),
+        'teams': _teams(df_filtered),
+        'general': _highlights_general(df_filtered),
+        'batsman': _highlights_batsman(df_filtered, match_runs),
+        'bowler': _highlights_bowler(df_filtered),
+        'pom': _pom(df_filtered),
+        'leading_run_scorer': _leading_run_scorer(df_cube),
+        'leading_wicket_taker': _leading_wicket_taker(df_cube),
+        'individual_team_score': _individual_team_score(df_filtered),
+        'individual_score': _individual_score(match_runs),
+        'best_bowling_figure': _best_bowling_figure(df_filtered, _bowler_wickets(df_filtered)),
+        'boundaries': _boundaries(df_cube),
+        'sixes': _boundaries(df_cube, 6),
+        'fours': _boundaries(df_cube, 4),
+        'catches': _catches(df_filtered),
+        'stumpings': _fielder_dismissals(df_filtered, 'stumped'),
+        'runouts': _fielder_dismissals(df_filtered, 'run out')
+    }
 
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
-
-    return(
-        df_filtered['fielder']
-        .value_counts()
-        .reset_index()
-        .rename(columns = {'fielder': 'Fielder', 'count': 'Count'})
-    )
 # ------------------------------------------------------------------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ## 2. Visualizations
@@ -425,22 +314,14 @@ def runouts(seasons = 'All'):
 ### 2.1. General Analysis
 #### 2.1.1. Inning-wise Average Score
 def season_avg_score(seasons = 'All', inning = None):
-    df_team = df_all1
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+    df_filtered = filters.season_rows('fact', seasons)
 
     return(
-        df_filtered
-        .query("result != 'no result'")
-        .groupby(by = ['season', 'id', 'inning'], as_index = False)
-        .agg(score = ('total_runs', 'sum'))
-        .query(f"inning == {inning}")
-        .groupby(by = 'season', as_index = False)
+        datasets.run_totals(df_filtered, 'innings', 'total_runs', attributes = ['result'])
+        .loc[lambda df_: ~filters.mask(df_, 'result', 'no result')]
+        .rename(columns = {'total_runs': 'score'})
+        .pipe(filters.select, inning = inning)
+        .groupby(by = 'season', as_index = False, observed = True)
         .agg(avg_runs = ('score', 'mean'))
         .rename(columns = {'season': 'Season', 'avg_runs': 'Average Score'})   
     )
@@ -448,22 +329,14 @@ def season_avg_score(seasons = 'All', inning = None):
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 2.1.2. Inning-wise Distribution of Score
 def season_avg_score_boxplot(seasons = 'All', inning = None):
-    df_team = df_all1
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+    df_filtered = filters.season_rows('fact', seasons)
 
     return(
-        df_filtered
-        .query("result != 'no result'")
-        .groupby(by = ['season', 'id', 'inning'], as_index = False)
-        .agg(score = ('total_runs', 'sum'))
-        .query(f"inning == {inning}")
-        .groupby(by = ['season', 'id'], as_index = False)
+        datasets.run_totals(df_filtered, 'innings', 'total_runs', attributes = ['result'])
+        .loc[lambda df_: ~filters.mask(df_, 'result', 'no result')]
+        .rename(columns = {'total_runs': 'score'})
+        .pipe(filters.select, inning = inning)
+        .groupby(by = ['season', 'id'], as_index = False, observed = True)
         .agg(avg_runs = ('score', 'mean'))
         .assign(avg_runs = lambda df_: df_['avg_runs'].astype('int'))
         .rename(columns = {'season': 'Season', 'id': 'Match ID', 'avg_runs': 'Score'})  
@@ -475,17 +348,12 @@ def season_avg_score_boxplot(seasons = 'All', inning = None):
 #### 2.2.1. Distribution of Toss Decision
 def toss_decision(seasons = 'All'):
     df_team = (
-        matches.query("result != 'No Result'")
-        .groupby(by = ['season', 'toss_decision'], as_index = False)
+        matches[~filters.mask(matches, 'result', 'No Result')]
+        .groupby(by = ['season', 'toss_decision'], as_index = False, observed = True)
         .agg(Count = ('toss_decision', 'count'))
     )
 
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+    df_filtered = filters.select_seasons(df_team, seasons)
 
     return(
         df_filtered
@@ -495,29 +363,22 @@ def toss_decision(seasons = 'All'):
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 2.2.2. Impact of Toss Decision on Outcome
 def toss_decision_impact(seasons = 'All'):
-    df_team = matches.query("winner != 'No Result'")
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+    df_filtered = filters.select_seasons(matches[~filters.mask(matches, 'winner', 'No Result')], seasons)
 
     df_toss_decision_impact = (
         df_filtered
         .assign(toss_match=lambda df_: (df_['toss_winner'] == df_['winner']).astype('int'))
-        .groupby(by=['season', 'toss_decision'], as_index=False)
+        .groupby(by=['season', 'toss_decision'], as_index=False, observed=True)
         .agg(toss_won_match_won=('toss_match', 'sum'))
         .merge(
             df_filtered
             .assign(toss_match=lambda df_: (df_['toss_winner'] != df_['winner']).astype('int'))
-            .groupby(by=['season', 'toss_decision'], as_index=False)
+            .groupby(by=['season', 'toss_decision'], as_index=False, observed=True)
             .agg(toss_won_match_lost=('toss_match', 'sum')),
             on=['season', 'toss_decision']
         )
         .merge(
-            df_filtered[['season', 'toss_decision']].value_counts().reset_index().sort_values(by=['season', 'toss_decision']),
+            df_filtered[['season', 'toss_decision']].value_counts().loc[lambda x: x > 0].reset_index().sort_values(by=['season', 'toss_decision']),
             on=['season', 'toss_decision']
         )
     )
@@ -527,23 +388,16 @@ def toss_decision_impact(seasons = 'All'):
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 2.2.3. Venue-based Toss Impact on Outcome
 def venue_toss_impact(seasons = 'All'):
-    df_team = matches.query("winner != 'No Result'")
-    
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+    df_filtered = filters.select_seasons(matches[~filters.mask(matches, 'winner', 'No Result')], seasons)
 
     df = (
         df_filtered
         .assign(toss_match_won = lambda x: (x['toss_winner'] == x['winner']).astype('int'))
-        .groupby(by = ['city'], as_index = False)
+        .groupby(by = ['city'], as_index = False, observed = True)
         .agg(toss_match_won = ('toss_match_won', 'sum'))
         .merge(
             df_filtered
-            .groupby(by = ['city'], as_index = False)
+            .groupby(by = ['city'], as_index = False, observed = True)
             .agg(total_matches = ('id', 'nunique')), on = ['city']
         )
         .assign(win_percent = lambda x: round((x['toss_match_won']/x['total_matches'])*100,2))
@@ -555,23 +409,16 @@ def venue_toss_impact(seasons = 'All'):
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 2.2.4. Venue-based Toss Decision Impact
 def venue_toss_decision_impact(seasons = 'All'):
-    df_team = matches.query("winner != 'No Result'")
-    
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+    df_filtered = filters.select_seasons(matches[~filters.mask(matches, 'winner', 'No Result')], seasons)
 
     df = (
         df_filtered
         .assign(toss_match_won = lambda x: (x['toss_winner'] == x['winner']).astype('int'))
-        .groupby(by = ['city', 'toss_decision'], as_index = False)
+        .groupby(by = ['city', 'toss_decision'], as_index = False, observed = True)
         .agg(toss_match_won = ('toss_match_won', 'sum'))
         .merge(
             df_filtered
-            .groupby(by = ['city', 'toss_decision'], as_index = False)
+            .groupby(by = ['city', 'toss_decision'], as_index = False, observed = True)
             .agg(total_matches = ('id', 'nunique')), on = ['city','toss_decision']
         )
         .assign(win_percent = lambda x: round((x['toss_match_won']/x['total_matches'])*100,2))
@@ -586,21 +433,13 @@ def venue_toss_decision_impact(seasons = 'All'):
 ### 2.3. Top Stats
 #### 2.3.1. Team
 def top_team_scores(seasons = 'All'):
-    df_team = df_all1
-    
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+    df_filtered = filters.season_rows('fact', seasons)
 
     df = (
-        df_filtered
-        .groupby(by = ['season', 'id', 'batting_team'], as_index = False)
-        .agg(Score = ('total_runs', 'sum'))
-        .sort_values(by = 'Score', ascending = False, ignore_index = True)
-        .rename(columns = {'season': 'Season', 'id': ' Match ID', 'batting_team': 'Team'})
+        datasets.run_totals(df_filtered, 'innings', 'total_runs', attributes = ['batting_team'])
+        .drop(columns = 'inning')
+        .sort_values(by = 'total_runs', ascending = False, ignore_index = True)
+        .rename(columns = {'season': 'Season', 'id': ' Match ID', 'batting_team': 'Team', 'total_runs': 'Score'})
     )
 
     return df
@@ -608,23 +447,15 @@ def top_team_scores(seasons = 'All'):
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ##### 2.3.1.2. 200+ Scores
 def top_team_200_plus_scores(seasons = 'All'):
-    df_team = df_all1
-    
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+    df_filtered = filters.season_rows('fact', seasons)
 
     df = (
-        df_filtered
-        .groupby(by = ['season', 'id', 'batting_team'], as_index = False)
-        .agg(Score = ('total_runs', 'sum'))
-        .sort_values(by = 'Score', ascending = False, ignore_index = True)
-        .rename(columns = {'season': 'Season', 'id': ' Match ID', 'batting_team': 'Team'})
-        .query("Score >= 200")
-        .groupby(by = ['Season', 'Team'], as_index = False)
+        datasets.run_totals(df_filtered, 'innings', 'total_runs', attributes = ['batting_team'])
+        .drop(columns = 'inning')
+        .sort_values(by = 'total_runs', ascending = False, ignore_index = True)
+        .rename(columns = {'season': 'Season', 'id': ' Match ID', 'batting_team': 'Team', 'total_runs': 'Score'})
+        .loc[lambda df_: df_['Score'] >= 200]
+        .groupby(by = ['Season', 'Team'], as_index = False, observed = True)
         .agg(Count = ('Team', 'count'))
         .sort_values(by = 'Count', ascending = False, ignore_index = True)
     )
@@ -634,20 +465,13 @@ def top_team_200_plus_scores(seasons = 'All'):
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 2.3.1.3. Top Teams with Most Centuries
 def top_team_centuries(seasons = 'All'):
-    df_team = df_all1
-    
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+    df_filtered = filters.season_rows('fact', seasons)
     return (
         df_filtered
-        .groupby(by = ['season', 'id', 'batting_team', 'batter'], as_index = False)
+        .groupby(by = ['season', 'id', 'batting_team', 'batter'], as_index = False, observed = True)
         .agg(score = ('batsman_runs', 'sum'))
-        .query("score >= 100")
-        .groupby(by = ['season', 'batting_team'], as_index = False)
+        .loc[lambda df_: df_['score'] >= 100]
+        .groupby(by = ['season', 'batting_team'], as_index = False, observed = True)
         .agg(Count = ('batting_team', 'count'))
         .rename(columns = {'season': 'Season', 'batting_team': 'Team'})
         .sort_values(by = ['Season'], ignore_index = True)
@@ -656,20 +480,13 @@ def top_team_centuries(seasons = 'All'):
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 2.3.1.4. Top Teams with Most Half Centuries
 def top_team_half_centuries(seasons = 'All'):
-    df_team = df_all1
-    
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+    df_filtered = filters.season_rows('fact', seasons)
     return (
         df_filtered
-        .groupby(by = ['season', 'id', 'batting_team', 'batter'], as_index = False)
+        .groupby(by = ['season', 'id', 'batting_team', 'batter'], as_index = False, observed = True)
         .agg(score = ('batsman_runs', 'sum'))
-        .query("score >= 50 & score < 100")
-        .groupby(by = ['season', 'batting_team'], as_index = False)
+        .loc[lambda df_: df_['score'].between(50, 100, inclusive = 'left')]
+        .groupby(by = ['season', 'batting_team'], as_index = False, observed = True)
         .agg(Count = ('batting_team', 'count'))
         .rename(columns = {'season': 'Season', 'batting_team': 'Team'})
         .sort_values(by = ['Season'], ignore_index = True)
@@ -679,19 +496,10 @@ def top_team_half_centuries(seasons = 'All'):
 ### 2.3.2. Batsman
 #### 2.3.2.1. Leading Scorer
 def top_leading_run_scorer(seasons = 'All'):
-    df_team = df_all1
-    
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
-
     return(
-        df_filtered
-        .groupby(by = ['batter'], as_index = False)
-        .agg(Runs = ('batsman_runs', 'sum'))
+        filters.season_rows('season_cube', seasons)
+        .groupby(by = ['batter'], as_index = False, observed = True)
+        .agg(Runs = ('runs', 'sum'))
         .sort_values(by = ['Runs'], ascending = False, ignore_index = True)
         .rename(columns = {'batter': 'Batsman'})
     )
@@ -699,18 +507,11 @@ def top_leading_run_scorer(seasons = 'All'):
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 2.3.2.2. Highest Individual Score
 def top_individual_score(seasons = 'All'):
-    df_team = df_all1
-    
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+    df_filtered = filters.season_rows('fact', seasons)
 
     return(
         df_filtered
-        .groupby(by = ['id', 'batter'], as_index = False)
+        .groupby(by = ['id', 'batter'], as_index = False, observed = True)
         .agg(Runs = ('batsman_runs', 'sum'))
         .sort_values(by = 'Runs', ascending = False, ignore_index = True)
         .rename(columns = {'batter': 'Batsman'})
@@ -719,20 +520,13 @@ def top_individual_score(seasons = 'All'):
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 2.3.2.3. Top Centuries Count
 def top_batsman_centuries(seasons = 'All'):
-    df_team = df_all1
-    
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+    df_filtered = filters.season_rows('fact', seasons)
     return (
         df_filtered
-        .groupby(by = ['season', 'id', 'batting_team', 'batter'], as_index = False)
+        .groupby(by = ['season', 'id', 'batting_team', 'batter'], as_index = False, observed = True)
         .agg(score = ('batsman_runs', 'sum'))
-        .query("score >= 100")
-        .groupby(by = ['season', 'batter'], as_index = False)
+        .loc[lambda df_: df_['score'] >= 100]
+        .groupby(by = ['season', 'batter'], as_index = False, observed = True)
         .agg(Count = ('batter', 'count'))
         .rename(columns = {'season': 'Season', 'batter': 'Batsman'})
         .sort_values(by = ['Season'], ignore_index = True)
@@ -741,20 +535,13 @@ def top_batsman_centuries(seasons = 'All'):
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 2.3.2.4. Top Half Centuries Count
 def top_batsman_half_centuries(seasons = 'All'):
-    df_team = df_all1
-    
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+    df_filtered = filters.season_rows('fact', seasons)
     return (
         df_filtered
-        .groupby(by = ['season', 'id', 'batting_team', 'batter'], as_index = False)
+        .groupby(by = ['season', 'id', 'batting_team', 'batter'], as_index = False, observed = True)
         .agg(score = ('batsman_runs', 'sum'))
-        .query("score >= 50 & score < 100")
-        .groupby(by = ['batter'], as_index = False)
+        .loc[lambda df_: df_['score'].between(50, 100, inclusive = 'left')]
+        .groupby(by = ['batter'], as_index = False, observed = True)
         .agg(Count = ('batter', 'count'))
         .rename(columns = {'batter': 'Batsman'})
         .sort_values(by = ['Count'], ascending = False, ignore_index = True)
@@ -763,19 +550,12 @@ def top_batsman_half_centuries(seasons = 'All'):
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 2.3.2.5. Top Most Boundaries
 def top_batsman_sixes(seasons = 'All'):
-    df_team = df_all1
-    
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
     return (
-        df_filtered
-        .query("batsman_runs == 6 or batsman_runs == 4")
-        .groupby(by = ['season', 'batting_team', 'batter'], as_index = False)
-        .agg(Boundaries = ('batsman_runs', 'count'))
+        filters.season_rows('season_cube', seasons)
+        .assign(Boundaries = lambda df_: df_['fours'] + df_['sixes'])
+        .groupby(by = ['season', 'batting_team', 'batter'], as_index = False, observed = True)
+        .agg(Boundaries = ('Boundaries', 'sum'))
+        .loc[lambda df_: df_['Boundaries'] > 0]
         .rename(columns = {'season': 'Season', 'batter': 'Batsman',
                            'batting_team': 'Team'})
         .sort_values(by = ['Season'], ignore_index = True)
@@ -786,34 +566,27 @@ def top_batsman_sixes(seasons = 'All'):
 ### 2.3.3. Bowler
 #### 2.3.3.1. Leading Wicket Taker
 def season_highlights_bowler_new(seasons='All'):
-    df_team = df_all1
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+    df_filtered = filters.season_rows('fact', seasons)
 
     bowler_count = df_filtered['bowler'].nunique()
     balls = df_filtered.shape[0]
-    wickets = df_filtered.query("is_wicket == 1").shape[0]
+    wickets = (df_filtered['is_wicket'] == 1).sum()
 
     bowler_dismissal_type = ['caught', 'caught and bowled', 'bowled', 'lbw', 'stumped']
     
     four_wickets = (
-        df_filtered.query("is_wicket == 1 and dismissal_kind in @bowler_dismissal_type")
-        .groupby(['id', 'bowler'], as_index = False)
+        filters.select(df_filtered, is_wicket = 1, dismissal_kind = bowler_dismissal_type)
+        .groupby(['id', 'bowler'], as_index = False, observed = True)
         .agg(wickets=('is_wicket', 'sum'))
-        .query("wickets == 4")
+        .loc[lambda df_: df_['wickets'] == 4]
         .rename(columns = {'id': 'Match ID', 'bowler': 'Bowler', 'wickets': 'Wickets'})
     )
 
     five_plus_wickets = (
-        df_filtered.query("is_wicket == 1 and dismissal_kind in @bowler_dismissal_type")
-        .groupby(['id', 'bowler'], as_index = False)
+        filters.select(df_filtered, is_wicket = 1, dismissal_kind = bowler_dismissal_type)
+        .groupby(['id', 'bowler'], as_index = False, observed = True)
         .agg(wickets=('is_wicket', 'sum'))
-        .query("wickets >= 5")
+        .loc[lambda df_: df_['wickets'] >= 5]
         .rename(columns = {'id': 'Match ID', 'bowler': 'Bowler', 'wickets': 'Wickets'})
     )
 
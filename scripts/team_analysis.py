@@ -1,50 +1,37 @@
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 import streamlit as st
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
-import joblib
-from scripts import player_analysis
-import os
+from scripts import aggregates, datasets, filters
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 # Load datasets
-filepath = os.path.abspath('data/processed/deliveries_all.joblib')
-deliveries_all = joblib.load(filepath)
+# The ball-level rows are selected through scripts.filters, on first use
+DATASETS = {
+    'matches': ['id', 'season', 'city', 'match_type', 'player_of_match', 'venue', 'team1', 'team2', 'toss_winner',
+                'toss_decision', 'winner', 'result', 'result_margin', 'target_runs', 'super_over']
+}
+matches, = datasets.load(DATASETS)
 
-filepath = os.path.abspath('data/processed/matches.joblib')
-matches = joblib.load(filepath)
-
-filepath = os.path.abspath('data/processed/deliveries.joblib')
-deliveries = joblib.load(filepath)
-
-# ------------------------------------------------------------------------------------------------------------------------------------------
-
-matches = (
-    matches
-    .assign(
-        winner = lambda df_: df_['winner'].fillna('No Result')
-    )
-    .replace({'Elimination Final': 'Eliminator'})
-)
-
-# ------------------------------------------------------------------------------------------------------------------------------------------
-
-df_all = matches.merge(deliveries, left_on = 'id', right_on = 'match_id')
+total_teams = pd.DataFrame(matches['team1'].unique(), columns = ['Team'])
+total_teams = total_teams.sort_values(by = 'Team')
+total_teams.index = range(1, len(total_teams)+1)
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ## 1. Key-Highlights
 ### 1.1. Team, Seasons and Matches Played
 matches_played_teams = (
     matches
-    .groupby(by = ['team1'], as_index = False)
+    .groupby(by = ['team1'], as_index = False, observed = True)
     .agg(
         matches = ('id', 'nunique')
     )
     .merge(
         matches
-        .groupby(by = 'team2', as_index = False)
+        .groupby(by = 'team2', as_index = False, observed = True)
         .agg(
             matches = ('id', 'nunique')
         ),
@@ -62,33 +49,15 @@ matches_played_teams = (
 matches_played_teams.index = range(1, len(matches_played_teams)+1)
 
 matches_teams_seasons = (
-    matches
-    .groupby(by = ['team1', 'season'], as_index = False)
-    .agg(
-        matches = ('id', 'nunique')
-    )
-    .merge(
-        matches
-        .groupby(by = ['team2', 'season'], as_index = False)
-        .agg(
-            matches = ('id', 'count')
-        ),
-        left_on = ['team1', 'season'], right_on = ['team2', 'season'], how = 'outer'
-    )
-    .assign(
-        matches_x = lambda df_: df_['matches_x'].fillna(0),
-        matches_y = lambda df_: df_['matches_y'].fillna(0),
-        matches = lambda df_: (df_['matches_x'] + df_['matches_y']).astype('int')
-    )
-    .drop(['team2', 'matches_x', 'matches_y'], axis = 1)
-    .rename(columns = {'team1': 'Team', 'season': 'Season', 'matches': 'Matches'})
+    aggregates.table('team_seasons')
+    .rename(columns = {'team': 'Team', 'season': 'Season', 'matches': 'Matches'})
 )
 
 teams_season_count = matches_teams_seasons['Team'].value_counts().reset_index(name = 'Total Seasons')
 
 teams_seasons = (
     matches_teams_seasons
-    .groupby('Team', as_index=False)
+    .groupby('Team', as_index=False, observed=True)
     .agg(years=('Season', lambda x: ', '.join(map(str, sorted(set(x))))))
 )
 
@@ -105,291 +74,217 @@ teams_df.index = range(1, len(teams_df)+1)
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 1.2. Metrics I
 def extract_team(team_name):
-    return df_all.query(f"team1 == '{team_name}' or team2 == '{team_name}'")
+    return filters.rows('fact', ['team1', 'team2'], team_name)
 
-#### 1.2.1. General Highlights
-def team_highlights_general(team_name, seasons = 'All'):
-    df_team = extract_team(team_name)
+# The team's matches in the selected seasons, and the balls it batted and bowled in them
+def _team_frames(team_name, seasons = 'All'):
+    df_team = filters.rows('fact', ['team1', 'team2'], team_name, seasons = seasons)
+    df_batting = df_team[df_team['batting_team'] == team_name]
+    df_bowling = df_team[df_team['bowling_team'] == team_name]
+    return df_team, df_batting, df_bowling
 
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
-
-    total_matches = df_filtered['id'].nunique()
-    superovers = df_filtered[df_filtered['super_over'] == 'Y']['id'].nunique()
-    cities = df_filtered['city'].nunique()
-    venues = df_filtered['venue'].nunique()
+#### 1.2.1. General Highlights
+def _highlights_general(df_team):
+    total_matches = df_team['id'].nunique()
+    superovers = df_team[df_team['super_over'] == 'Y']['id'].nunique()
+    cities = df_team['city'].nunique()
+    venues = df_team['venue'].nunique()
 
     return total_matches, superovers, cities, venues
 
+def team_highlights_general(team_name, seasons = 'All'):
+    df_team, df_batting, df_bowling = _team_frames(team_name, seasons)
+    return _highlights_general(df_team)
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 1.2.2. Batsman Highlights
-def team_highlights_batsman(team_name, seasons='All'):
-    df_team = extract_team(team_name)
-
-    if seasons == 'All':
-        df_filtered = df_team.query(f"batting_team == '{team_name}'")
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query(f"batting_team == '{team_name}' and season in @seasons")
-    else:
-        df_filtered = df_team.query(f"batting_team == '{team_name}' and season == '{seasons}'")
+def _batter_match_runs(df_batting):
+    return (
+        df_batting
+        .groupby(by = ['id', 'batter'], as_index = False, observed = True)
+        .agg(Runs = ('batsman_runs', 'sum'))
+    )
 
-    batsman_runs = df_filtered['batsman_runs'].sum()
-    extra_runs = df_filtered['extra_runs'].sum()
+def _highlights_batsman(df_batting, match_runs):
+    batsman_runs = df_batting['batsman_runs'].sum()
+    extra_runs = df_batting['extra_runs'].sum()
 
-    p1 = df_filtered['batter'].unique()
-    p2 = df_filtered['non_striker'].unique()
+    p1 = df_batting['batter'].unique()
+    p2 = df_batting['non_striker'].unique()
     batsman_count = len(set(list(p1) + list(p2)))
 
-    sixes = df_filtered.query("batsman_runs == 6")['batsman_runs'].count()
-    fours = df_filtered.query("batsman_runs == 4")['batsman_runs'].count()
+    sixes = (df_batting['batsman_runs'] == 6).sum()
+    fours = (df_batting['batsman_runs'] == 4).sum()
 
-    centuries = (
-        df_filtered.groupby(['id', 'batter'])
-        .agg(runs=('batsman_runs', 'sum'))
-        .query("runs >= 100")
-        .runs.count()
-    )
-
-    half_centuries = (
-        df_filtered.groupby(['id', 'batter'])
-        .agg(runs=('batsman_runs', 'sum'))
-        .query("50 <= runs < 100")
-        .runs.count()
-    )
+    centuries = (match_runs['Runs'] >= 100).sum()
+    half_centuries = match_runs['Runs'].between(50, 100, inclusive = 'left').sum()
 
     return batsman_runs, extra_runs, sixes, fours, centuries, half_centuries, batsman_count
 
+def team_highlights_batsman(team_name, seasons='All'):
+    df_team, df_batting, df_bowling = _team_frames(team_name, seasons)
+    return _highlights_batsman(df_batting, _batter_match_runs(df_batting))
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 1.2.3. Bowler Highlights
-def team_highlights_bowler(team_name, seasons='All'):
-    df_team = extract_team(team_name)
-
-    if seasons == 'All':
-        df_filtered = df_team.query(f"bowling_team == '{team_name}'")
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("bowling_team == @team_name and season in @seasons")
-    else:
-        df_filtered = df_team.query(f"bowling_team == '{team_name}' and season == '{seasons}'")
-
-    bowler_count = df_filtered['bowler'].nunique()
-    balls = df_filtered.shape[0]
-    wickets = df_filtered.query("is_wicket == 1").shape[0]
+def _highlights_bowler(df_bowling):
+    bowler_count = df_bowling['bowler'].nunique()
+    balls = df_bowling.shape[0]
+    wickets = (df_bowling['is_wicket'] == 1).sum()
 
     bowler_dismissal_type = ['caught', 'caught and bowled', 'bowled', 'lbw', 'stumped']
-    
-    four_wickets = (
-        df_filtered.query("is_wicket == 1 and dismissal_kind in @bowler_dismissal_type")
-        .groupby(['id', 'bowler'])
-        .agg(wickets=('is_wicket', 'sum'))
-        .query("wickets == 4")
-        .shape[0]
-    )
 
-    five_plus_wickets = (
-        df_filtered.query("is_wicket == 1 and dismissal_kind in @bowler_dismissal_type")
-        .groupby(['id', 'bowler'])
+    match_wickets = (
+        filters.select(df_bowling, is_wicket = 1, dismissal_kind = bowler_dismissal_type)
+        .groupby(['id', 'bowler'], observed = True)
         .agg(wickets=('is_wicket', 'sum'))
-        .query("wickets >= 5")
-        .shape[0]
     )
 
+    four_wickets = (match_wickets['wickets'] == 4).sum()
+    five_plus_wickets = (match_wickets['wickets'] >= 5).sum()
+
     return bowler_count, balls, wickets, four_wickets, five_plus_wickets
 
+def team_highlights_bowler(team_name, seasons='All'):
+    df_team, df_batting, df_bowling = _team_frames(team_name, seasons)
+    return _highlights_bowler(df_bowling)
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 1.3. Metrics II
 #### 1.3.1. Most Player of the Match Awards
-def pom(team_name, seasons = 'All'):
-    df_team = extract_team(team_name)
-
-    if seasons == 'All':
-        df_filtered = df_team.query(f"winner == '{team_name}'")
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("winner == @team_name and season in @seasons")
-    else:
-        df_filtered = df_team.query(f"winner == '{team_name}' and season == '{seasons}'")
-    
+def _pom(df_team, team_name):
     return (
-        df_filtered
-        .groupby(by = ['player_of_match'], as_index = False)
+        df_team[df_team['winner'] == team_name]
+        .groupby(by = ['player_of_match'], as_index = False, observed = True)
         .agg(Count = ('id', 'nunique'))
         .sort_values(by = 'Count', ascending = False, ignore_index = True)
         .rename(columns = {'player_of_match': 'Player of Match'})
     )
 
+def pom(team_name, seasons = 'All'):
+    df_team, df_batting, df_bowling = _team_frames(team_name, seasons)
+    return _pom(df_team, team_name)
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 1.3.2. Leading Run Scorer
-def leading_run_scorer(team_name, seasons='All'):
-    df_team = extract_team(team_name)
-
-    if seasons == 'All':
-        df_filtered = df_team.query(f"batting_team == '{team_name}'")
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("batting_team == @team_name and season in @seasons")
-    else:
-        df_filtered = df_team.query(f"batting_team == '{team_name}' and season == '{seasons}'")
-
+def _leading_run_scorer(df_cube, team_name):
     return (
-        df_filtered
-        .groupby(by = 'batter', as_index = False)
-        .agg(Runs = ('batsman_runs', 'sum'))
+        df_cube[df_cube['batting_team'] == team_name]
+        .groupby(by = 'batter', as_index = False, observed = True)
+        .agg(Runs = ('runs', 'sum'))
         .sort_values(by = 'Runs', ascending = False, ignore_index = True)
         .rename(columns = {'batter': 'Batsman'})
     )
 
+def leading_run_scorer(team_name, seasons='All'):
+    return _leading_run_scorer(filters.season_rows('season_cube', seasons), team_name)
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 1.3.3. Leading Wicket Taker
 bowler_dismissal_type = ['caught', 'caught and bowled', 'bowled', 'lbw', 'stumped', 'hit wicket']
 
-def leading_wicket_taker(team_name, seasons='All'):
-    df_team = extract_team(team_name).query(f"(bowling_team == '{team_name}' & is_wicket == 1) & (dismissal_kind in @bowler_dismissal_type)")
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+def _bowler_wickets(df_bowling):
+    return filters.select(df_bowling, is_wicket = 1, dismissal_kind = bowler_dismissal_type)
 
+def _leading_wicket_taker(df_cube, team_name):
     return (
-        df_filtered
-        .groupby(by = 'bowler', as_index = False)
-        .agg(Wickets = ('is_wicket', 'sum'))
+        df_cube[df_cube['bowling_team'] == team_name]
+        .groupby(by = 'bowler', as_index = False, observed = True)
+        .agg(Wickets = ('wickets', 'sum'))
+        .loc[lambda df_: df_['Wickets'] > 0]
         .sort_values(by = 'Wickets', ascending = False, ignore_index = True)
         .rename(columns = {'bowler': 'Bowler'})
     )
 
+def leading_wicket_taker(team_name, seasons='All'):
+    return _leading_wicket_taker(filters.season_rows('season_cube', seasons), team_name)
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 1.3.4. Highest Team Score
-def individual_team_score(team_name, seasons='All'):
-    df_team = extract_team(team_name)
-
-    if seasons == 'All':
-        df_filtered = df_team.query(f"batting_team == '{team_name}'")
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("batting_team == @team_name and season in @seasons")
-    else:
-        df_filtered = df_team.query(f"batting_team == '{team_name}' and season == '{seasons}'")
-
+def _individual_team_score(df_batting):
     return (
-        df_filtered
-        .groupby(by = ['id','season'], as_index = False)
+        df_batting
+        .groupby(by = ['id','season'], as_index = False, observed = True)
         .agg(Runs = ('total_runs', 'sum'))
         .sort_values(by = 'Runs', ascending = False, ignore_index = True)
         .rename(columns = {'id': 'Match', 'season': 'Season'})
         .drop(columns = 'Match')
     )
 
+def individual_team_score(team_name, seasons='All'):
+    df_team, df_batting, df_bowling = _team_frames(team_name, seasons)
+    return _individual_team_score(df_batting)
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 1.3.5. Highest Individual Score
-def individual_score(team_name, seasons='All'):
-    df_team = extract_team(team_name)
-
-    if seasons == 'All':
-        df_filtered = df_team.query(f"batting_team == '{team_name}'")
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("batting_team == @team_name and season in @seasons")
-    else:
-        df_filtered = df_team.query(f"batting_team == '{team_name}' and season == '{seasons}'")
-
+def _individual_score(match_runs):
     return (
-        df_filtered
-        .groupby(by = ['id', 'batter'], as_index = False)
-        .agg(Runs = ('batsman_runs', 'sum'))
+        match_runs
         .sort_values(by = 'Runs', ascending = False, ignore_index = True)
         .rename(columns = {'batter': 'Batsman'})
         .drop(columns = ['id'])
     )
 
+def individual_score(team_name, seasons='All'):
+    df_team, df_batting, df_bowling = _team_frames(team_name, seasons)
+    return _individual_score(_batter_match_runs(df_batting))
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 1.3.6. Best Bowling Figure
-bowler_dismissal_type = ['caught', 'caught and bowled', 'bowled', 'lbw', 'stumped', 'hit wicket']
-
-def best_bowling_figure(team_name, seasons = 'All'):
-    df_team1 = extract_team(team_name).query(f"(bowling_team == '{team_name}' & is_wicket == 1) & (dismissal_kind in @bowler_dismissal_type)")
-    df_team2 = extract_team(team_name).query(f"(bowling_team == '{team_name}' & is_wicket == 0)")
-    
-    if seasons == 'All':
-        df_filtered1 = df_team1
-        df_filtered2 = df_team2
-    elif isinstance(seasons, list):
-        df_filtered1 = df_team1.query("season in @seasons")
-        df_filtered2 = df_team2.query("season in @seasons")
-    else:
-        df_filtered1 = df_team1.query(f"season == '{seasons}'")
-        df_filtered2 = df_team2.query(f"season == '{seasons}'")
-
+def _best_bowling_figure(df_bowling, df_wickets):
     return (
-        df_filtered1
-        .groupby(by = ['id', 'bowler'], as_index = False)
+        df_wickets
+        .groupby(by = ['id', 'bowler'], as_index = False, observed = True)
         .agg(Wickets = ('is_wicket', 'sum'))
         .merge(
             (
-                df_filtered2
-                .groupby(by = ['id', 'bowler'], as_index = False)
+                df_bowling[df_bowling['is_wicket'] == 0]
+                .groupby(by = ['id', 'bowler'], as_index = False, observed = True)
                 .agg(Runs = ('total_runs', 'sum'))
             ),
             on = ['id', 'bowler']
         )
         .sort_values(by = ['Wickets', 'Runs'], ascending = [False, True], ignore_index = True)
-        .rename(columns = {'id': 'Match ID', 'bowler': 'Bowler'})    
+        .rename(columns = {'id': 'Match ID', 'bowler': 'Bowler'})
     )
 
+def best_bowling_figure(team_name, seasons = 'All'):
+    df_team, df_batting, df_bowling = _team_frames(team_name, seasons)
+    return _best_bowling_figure(df_bowling, _bowler_wickets(df_bowling))
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 1.3.7. Most Boundaries (Sixes and Fours)
-def boundaries(team_name, boundary = None, seasons = 'All'):
-    df_team = extract_team(team_name)
-
-    if seasons == 'All':
-        df_filtered = df_team.query(f"batting_team == '{team_name}'")
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("batting_team == @team_name and season in @seasons")
-    else:
-        df_filtered = df_team.query(f"batting_team == '{team_name}' and season == '{seasons}'")
-
+def _boundaries(df_cube, team_name, boundary = None):
+    df_batting = df_cube[df_cube['batting_team'] == team_name]
     if (boundary == 4) | (boundary == 6):
-        return(
-            df_filtered
-            .query(f"batsman_runs == {boundary}")
-            .groupby(by = ['batter'], as_index = False)
-            .agg(Count = ('batsman_runs', 'count'))
-            .sort_values(by = 'Count', ascending = False, ignore_index = True)
-            .rename(columns = {'batter': 'Batsman'})
-        )
+        counts = df_batting.assign(Count = df_batting[{4: 'fours', 6: 'sixes'}[boundary]])
     else:
-        return(
-            df_filtered
-            .query(f"batsman_runs == 4 or batsman_runs == 6")
-            .groupby(by = ['batter'], as_index = False)
-            .agg(Count = ('batsman_runs', 'count'))
-            .sort_values(by = 'Count', ascending = False, ignore_index = True)
-            .rename(columns = {'batter': 'Batsman'})
-        )
+        counts = df_batting.assign(Count = df_batting['fours'] + df_batting['sixes'])
+
+    return(
+        counts
+        .groupby(by = ['batter'], as_index = False, observed = True)
+        .agg(Count = ('Count', 'sum'))
+        .loc[lambda df_: df_['Count'] > 0]
+        .sort_values(by = 'Count', ascending = False, ignore_index = True)
+        .rename(columns = {'batter': 'Batsman'})
+    )
+
+def boundaries(team_name, boundary = None, seasons = 'All'):
+    return _boundaries(filters.season_rows('season_cube', seasons), team_name, boundary)
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 1.3.8. Most Catches
 fielding = ['caught', 'caught and bowled']
-def catches(team_name, seasons = 'All'):
-    df_team1 = extract_team(team_name).query(f"(bowling_team == '{team_name}' & is_wicket == 1) & (dismissal_kind == 'caught')")
-    df_team2 = extract_team(team_name).query(f"(bowling_team == '{team_name}' & is_wicket == 1) & (dismissal_kind == 'caught and bowled')")
-    
-    if seasons == 'All':
-        df_filtered1 = df_team1
-        df_filtered2 = df_team2
-    elif isinstance(seasons, list):
-        df_filtered1 = df_team1.query("season in @seasons")
-        df_filtered2 = df_team2.query("season in @seasons")
-    else:
-        df_filtered1 = df_team1.query(f"season == '{seasons}'")
-        df_filtered2 = df_team2.query(f"season == '{seasons}'")
 
+def _dismissals(df_bowling, kind):
+    return df_bowling[(df_bowling['is_wicket'] == 1) & (df_bowling['dismissal_kind'] == kind)]
+
+def _catches(df_bowling):
     return(
-        df_filtered1['fielder'].value_counts().reset_index()
+        _dismissals(df_bowling, 'caught')['fielder'].value_counts().loc[lambda x: x > 0].reset_index()
         .merge(
-            (df_filtered2['bowler'].value_counts().reset_index()),
+            (_dismissals(df_bowling, 'caught and bowled')['bowler'].value_counts().loc[lambda x: x > 0].reset_index()),
              left_on = 'fielder', right_on = 'bowler', how = 'outer'
         )
         .assign(
@@ -404,43 +299,58 @@ def catches(team_name, seasons = 'All'):
         .rename(columns = {'fielder': 'Fielder', 'count': 'Count'})
     )
 
+def catches(team_name, seasons = 'All'):
+    df_team, df_batting, df_bowling = _team_frames(team_name, seasons)
+    return _catches(df_bowling)
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 1.3.9. Most Stumpings
-def stumpings(team_name, seasons = 'All'):
-    df_team = extract_team(team_name).query(f"(bowling_team == '{team_name}' & is_wicket == 1) & (dismissal_kind == 'stumped')")
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
-
+def _fielder_dismissals(df_bowling, kind):
     return(
-        df_filtered['fielder']
+        _dismissals(df_bowling, kind)['fielder']
         .value_counts()
+        .loc[lambda x: x > 0]
         .reset_index()
         .rename(columns = {'fielder': 'Fielder', 'count': 'Count'})
     )
 
+def stumpings(team_name, seasons = 'All'):
+    df_team, df_batting, df_bowling = _team_frames(team_name, seasons)
+    return _fielder_dismissals(df_bowling, 'stumped')
+
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 1.3.10. Most Run Outs
 def runouts(team_name, seasons = 'All'):
-    df_team = extract_team(team_name).query(f"(bowling_team == '{team_name}' & is_wicket == 1) & (dismissal_kind == 'run out')")
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
-
-    return(
-        df_filtered['fielder']
-        .value_counts()
-        .reset_index()
-        .rename(columns = {'fielder': 'Fielder', 'count': 'Count'})
-    )
+    df_team, df_batting, df_bowling = _team_frames(team_name, seasons)
+    return _fielder_dismissals(df_bowling, 'run out')
+
+# ------------------------------------------------------------------------------------------------------------------------------------------
+### 1.4. All Highlights
+# Every Key-Highlights metric of a team from one season filter; the batting and bowling balls and the batters'
+# match scores are each selected once and shared by the metrics that read them, and the leaderboards are
+# summed from the season cube.
+def team_highlights(team_name, seasons = 'All'):
+    df_team, df_batting, df_bowling = _team_frames(team_name, seasons)
+    df_cube = filters.season_rows('season_cube', seasons)
+    match_runs = _batter_match_runs(df_batting)
+
+    return {
+        'general': _highlights_general(df_team),
+        'batsman': _highlights_batsman(df_batting, match_runs),
+        'bowler': _highlights_bowler(df_bowling),
+        'pom': _pom(df_team, team_name),
+        'leading_run_scorer': _leading_run_scorer(df_cube, team_name),
+        'leading_wicket_taker': _leading_wicket_taker(df_cube, team_name),
+        'individual_team_score': _individual_team_score(df_batting),
+        'individual_score': _individual_score(match_runs),
+        'best_bowling_figure': _best_bowling_figure(df_bowling, _bowler_wickets(df_bowling)),
+        'boundaries': _boundaries(df_cube, team_name),
+        'sixes': _boundaries(df_cube, team_name, 6),
+        'fours': _boundaries(df_cube, team_name, 4),
+        'catches': _catches(df_bowling),
+        'stumpings': _fielder_dismissals(df_bowling, 'stumped'),
+        'runouts': _fielder_dismissals(df_bowling, 'run out')
+    }
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 # ------------------------------------------------------------------------------------------------------------------------------------------
@@ -449,9 +359,8 @@ def runouts(team_name, seasons = 'All'):
 ### 2.1.1. Season-wise Match Count 
 def season_match_count(team):
     return (
-        matches
-        .query(f"team1 == '{team}' or team2 == '{team}'")
-        .groupby(by = 'season', as_index = False)
+        filters.rows('matches', ['team1', 'team2'], team)
+        .groupby(by = 'season', as_index = False, observed = True)
         .agg(Count = ('id', 'nunique'))
         .rename(columns = {'season': 'Season'})
     )
@@ -459,7 +368,7 @@ def season_match_count(team):
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 2.1.2. Win-Loss % (Season Cumulative)
 def team_stats(team_name):
-    df = matches.query(f"team1 == '{team_name}' or team2 == '{team_name}'")
+    df = filters.rows('matches', ['team1', 'team2'], team_name)
     num_matches = df.shape[0]
     matches_won = df[df['winner'] == team_name].shape[0]
     win_percent = round(matches_won*100/num_matches, 2)
@@ -468,172 +377,145 @@ def team_stats(team_name):
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 2.1.3. Match-Type Success Rate
-def team_swap(row, team_name):
-    if row['team2'] == team_name:
-        row['team2'] = row['team1']
-    return row
-
-def team_record(team_name):
-    return (
-        matches
-        .query(f"team1 == '{team_name}' or team2 == '{team_name}'")
-        .groupby(by = ['team1', 'team2', 'match_type', 'winner'], as_index = False)
-        .agg(count = ('id', 'nunique'))
-        .apply(lambda row: team_swap(row, team_name), axis=1)
-        .assign(team1 = team_name)
-    )
-
 def team_matchtype(team_name):
     return (
-        team_record(team_name)
-        .groupby(by = ['match_type'], as_index = False)
-        .agg(num_matches = ('count', 'sum'))
-        .rename(columns = {'match_type': 'Match Type', 'num_matches': 'Total Matches'})
-        .merge(
-            team_record(team_name)
-            .groupby(by = ['match_type', 'winner'], as_index = False)
-            .agg(matches_won = ('count', 'sum'))
-            .query(f"winner == '{team_name}'")
-            .rename(columns = {'match_type': 'Match Type', 'matches_won': 'MatchesWon'})
-            .drop(columns = 'winner'),
-            on = 'Match Type', how = 'outer'
-        )
-        .fillna(0)
-        .assign(win_percent = lambda df_: round((df_['MatchesWon']/df_['Total Matches'])*100,2),
-                MatchesWon = lambda df_: df_['MatchesWon'].astype('int'))
-        .rename(columns = {'win_percent': 'Win %', 'MatchesWon': 'Matches Won'})
+        filters.rows('team_matches', 'team', team_name)
+        .groupby(by = ['match_type'], as_index = False, observed = True)
+        .agg(num_matches = ('id', 'count'), matches_won = ('won', 'sum'))
+        .assign(win_percent = lambda df_: round((df_['matches_won']/df_['num_matches'])*100,2))
+        .rename(columns = {'match_type': 'Match Type', 'num_matches': 'Total Matches',
+                           'matches_won': 'Matches Won', 'win_percent': 'Win %'})
     )
-team_matchtype('Rising Pune Supergiants')
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 2.1.4. Toss Impact
 def team(team_name, seasons = 'All'):
-    if seasons == 'All':
-        return matches.query(f"team1 == '{team_name}' or team2 == '{team_name}'")
-    elif isinstance(seasons, list):
-        return matches.query("(team1 == @team_name or team2 == @team_name) and season in @seasons")
-    else: 
-        return matches.query(f"(team1 == '{team_name}' or team2 == '{team_name}') and season == '{seasons}'")
+    return filters.rows('matches', ['team1', 'team2'], team_name, seasons = seasons)
 
 def toss_distribution(team_name, seasons = 'All'):
-    toss_won = team(team_name, seasons = seasons).query(f"toss_winner == '{team_name}'").shape[0]
-    toss_lost = team(team_name, seasons = seasons).query(f"toss_winner != '{team_name}'").shape[0]
-    return toss_won, toss_lost
+    df_team = team(team_name, seasons = seasons)
+    toss_won = filters.mask(df_team, 'toss_winner', team_name)
+    return int(toss_won.sum()), int((~toss_won).sum())
 
 def toss_winning_cause(team_name, seasons = 'All'):
-    toss_won_match_won = team(team_name, seasons = seasons).query(f"toss_winner == '{team_name}' and winner == '{team_name}'").shape[0]
-    toss_lost_match_won = team(team_name, seasons = seasons).query(f"toss_winner != '{team_name}' and winner == '{team_name}'").shape[0]
-    return toss_won_match_won, toss_lost_match_won
+    df_team = team(team_name, seasons = seasons)
+    toss_won = filters.mask(df_team, 'toss_winner', team_name)
+    match_won = filters.mask(df_team, 'winner', team_name)
+    return int((toss_won & match_won).sum()), int((~toss_won & match_won).sum())
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 2.1.5. Home & Away Win %
-def home_away_wins(team_name, seasons = 'all'):
-    if team_name == 'Chennai Super Kings':
-        home_city = 'Chennai'
-    if team_name == 'Delhi Capitals':
-        home_city = 'Delhi'
-    if team_name == 'Gujarat Titans':
-        home_city = 'Ahmedabad'
-    if team_name == 'Kings XI Punjab':
-        home_city = 'Chandigarh'
-    if team_name == 'Kolkata Knight Riders':
-        home_city = 'Kolkata'
-    if team_name == 'Lucknow Super Giants':
-        home_city = 'Lucknow'
-    if team_name == 'Mumbai Indians':
-        home_city = 'Mumbai'
-    if team_name == 'Rajasthan Royals':
-        home_city = 'Jaipur'
-    if team_name == 'Rising Pune Supergiants':
-        home_city = 'Pune'
-    if team_name == 'Royal Challengers Bengaluru':
-        home_city = 'Bengaluru'
-    if team_name == 'Sunrisers Hyderabad':
-        home_city = 'Hyderabad'
-    if team_name == 'Kochi Tuskers Kerala':
-        home_city = 'Kochi'
-    df =  (
-        team(team_name, seasons = seasons)
-        .assign(Game = lambda df_: df_['city'].apply(lambda city: 'Home' if  city == home_city else 'Away'))
-        .groupby(by = 'Game', as_index = False)
-        .agg(matches_played = ('id', 'nunique'))
-        .merge(
-            team(team_name, seasons = seasons)
-            .assign(Game = lambda df_: df_['city'].apply(lambda city: 'Home' if  city == home_city else 'Away'))
-            .query(f"winner == '{team_name}'")
-            .groupby(by = 'Game', as_index = False)
-            .agg(matches_won = ('id', 'nunique')), on = 'Game', how = 'outer'
-        )
-        .fillna(0)
+# A match is at home when it is played in the home city of the team's franchise (data/reference/franchises.csv)
+def _home_away(df_team_matches, by):
+    return (
+        df_team_matches
+        .assign(Game = lambda df_: np.where(df_['home'], 'Home', 'Away'))
+        .groupby(by = by + ['Game'], as_index = False, observed = True)
+        .agg(matches_played = ('id', 'count'), matches_won = ('won', 'sum'))
         .assign(
             matches_lost = lambda df_: df_['matches_played'] - df_['matches_won'],
             win_percent = lambda df_: round((df_['matches_won']/df_['matches_played'])*100,2)
         )
-        .rename(columns = {'matches_played': 'Total Matches', 'matches_won': 'Matches Won', 
+        .rename(columns = {'team': 'Team', 'matches_played': 'Total Matches', 'matches_won': 'Matches Won',
                            'matches_lost': 'Matches Lost', 'win_percent': 'Win %'})
     )
+
+def home_away_wins(team_name, seasons = 'All'):
+    df = _home_away(filters.rows('team_matches', 'team', team_name, seasons = seasons), by = [])
     df.index = range(1, len(df)+1)
+    return df
 
+def home_away_record(seasons = 'All'):
+    df = _home_away(filters.season_rows('team_matches', seasons), by = ['team'])
+    df.index = range(1, len(df)+1)
     return df
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 2.1.6. Level Hierarchy
+# The playoff progression of every team in every season is derived once from the team-perspective matches:
+# each playoff match maps to the level it belongs to and the level it leads to, and the levels of one team and
+# season are joined side by side. A team's level hierarchy is its rows of that table.
 map_data = {'League': 'League', 'Qualifier 1': 'Playoff',
             'Qualifier 2': 'Qualifier 2', 'Eliminator': 'Playoff',
             '3rd Place Play-Off': 'Playoff', 'Semi Final': 'Playoff',
             'Final': 'Final'}
 
-def next_level_status(row, team_name):
-    progression_map = {
-        "Qualifier 1": "Final",
-        "Qualifier 2": "Final",
-        "Eliminator": "Qualifier 2",
-        "Semi Final": "Final",
-        "Final": "Champion"
-    }
+progression_map = {'Qualifier 1': 'Final', 'Qualifier 2': 'Final', 'Eliminator': 'Qualifier 2',
+                   'Semi Final': 'Final', 'Final': 'Champion'}
 
-    if row["winner"] == team_name:
-        return progression_map.get(row["match_type"], "Eliminated")
-    elif (row['match_type'] == 'Qualifier 1') & (row["winner"] != team_name):
-        return "Qualifier 2"
-    elif (row['match_type'] == 'Final') & (row["winner"] != team_name):
-        return 'Runner Up'
-    else:
-        return "Eliminated"
+# Where the loser of a match goes; every other loser is eliminated
+defeat_map = {'Qualifier 1': 'Qualifier 2', 'Final': 'Runner Up'}
+
+@datasets.reloadable
+@lru_cache(maxsize = None)
+def _playoff_matches():
+    df = datasets.team_matches(['season', 'id', 'team', 'match_type', 'winner', 'won'])
+    df = df[df['match_type'] != 'League']
+    return (
+        df
+        .assign(
+            match_category = lambda df_: df_['match_type'].map(map_data),
+            next_level = lambda df_: (
+                df_['match_type'].map(progression_map).where(df_['won'], df_['match_type'].map(defeat_map))
+                .fillna('Eliminated')
+            )
+        )
+        [['team', 'season', 'match_category', 'match_type', 'winner', 'next_level']]
+        .rename(columns = {'match_category': 'Match Category', 'match_type': 'Match Type',
+                           'winner': 'Winner', 'next_level': 'Next Level'})
+        .reset_index(drop = True)
+    )
 
 def seasonwise_matchtype(team_name, match_level):
     return (
-        matches
-        .assign(match_category = lambda df_: df_['match_type'].map(map_data))
-        .query(f"team1 == '{team_name}' or team2 == '{team_name}'")
-        .groupby(by = ['season', 'match_category', 'match_type', 'winner'], as_index = False)
-        .agg(count = ('id', 'nunique'))
-        .query(f"match_category == '{match_level}'")
+        _playoff_matches()
+        .pipe(filters.select, team = team_name, **{'Match Category': match_level})
+        .drop(columns = 'team')
+        .rename(columns = {'season': 'Season'})
         .reset_index(drop = True)
-        .drop(columns = 'count')
-        .assign(next_level = lambda df_: df_.apply(lambda row: next_level_status(row, team_name), axis=1))
-        .rename(columns = {'season': 'Season', 'match_category': 'Match Category',
-                           'match_type': 'Match Type', 'winner': 'Winner', 'next_level': 'Next Level'})
     )
 
-def level_hierarchy(team_name):
-    df =  (
-        seasonwise_matchtype(team_name, 'Playoff')
-        .merge(
-            seasonwise_matchtype(team_name, 'Qualifier 2'),
-            on='Season', how='outer'
-        )
-        .merge(
-            seasonwise_matchtype(team_name, 'Final'),
-            on='Season', how='outer'
-        )
+@datasets.reloadable
+@lru_cache(maxsize = None)
+def _playoff_progression():
+    def level(match_level):
+        return filters.select(_playoff_matches(), **{'Match Category': match_level})
+
+    return (
+        level('Playoff')
+        .merge(level('Qualifier 2'), on = ['team', 'season'], how = 'outer')
+        .merge(level('Final'), on = ['team', 'season'], how = 'outer')
         .drop(columns = ['Match Category_y', 'Match Type_y', 'Match Category'])
         .fillna('-')
-        .rename(columns = {'Match Category_x': 'Level I', 'Match Type_x': 'Type I', 
-                           'Winner_x': 'Playoff - Winner', 'Next Level_x': 'Level II', 
-                           'Winner_y': 'Qualifier2 - Winner', 'Next Level_y': 'Level III', 
+        .rename(columns = {'Match Category_x': 'Level I', 'Match Type_x': 'Type I',
+                           'Winner_x': 'Playoff - Winner', 'Next Level_x': 'Level II',
+                           'Winner_y': 'Qualifier2 - Winner', 'Next Level_y': 'Level III',
                            'Next Level': 'Result'})
-        .assign(Result = lambda df_: df_['Result'].replace('-', 'Eliminated'))
+        .assign(
+            Result = lambda df_: df_['Result'].replace('-', 'Eliminated'),
+            Stage = lambda df_: np.select(
+                [df_['Match Type'] == 'Final', df_['Qualifier2 - Winner'] != '-'],
+                ['Final', 'Qualifier 2'],
+                default = df_['Type I']
+            )
+        )
+        .sort_values(by = ['season', 'team'], ignore_index = True)
+    )
+
+def playoff_progression(seasons = 'All'):
+    df = (
+        filters.select_seasons(_playoff_progression(), seasons)
+        .rename(columns = {'season': 'Season', 'team': 'Team'})
+    )
+    df.index = range(1, len(df)+1)
+    return df
+
+def level_hierarchy(team_name):
+    df =  (
+        _playoff_progression()
+        .pipe(filters.select, team = team_name)
+        .drop(columns = ['team', 'Stage'])
+        .rename(columns = {'season': 'Season'})
     )
     df.index = range(1, len(df)+1)
     return df
@@ -644,36 +526,32 @@ def level_hierarchy(team_name):
 #### 2.2.1. List of Teams Batsman
 def team_batsman_list(team):
     return (
-    deliveries
-    .query(f"batting_team == '{team}'")
-    .batter.unique()
+    filters.rows('deliveries', 'batting_team', team)
+    .batter.drop_duplicates().to_numpy()
 )
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 2.2.2. Teams Bowler List
 def team_bowler_list(team):
     return (
-    deliveries
-    .query(f"bowling_team == '{team}'")
-    .bowler.unique()
+    filters.rows('deliveries', 'bowling_team', team)
+    .bowler.drop_duplicates().to_numpy()
 )
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 2.2.3. Batsman Performance
 def team_batsman_performance(team):
     return (
-        deliveries
-        .query(f"batting_team == '{team}'")
-        .groupby(by = 'batter', as_index = False)
+        filters.rows('deliveries', 'batting_team', team)
+        .groupby(by = 'batter', as_index = False, observed = True)
         .agg(
             Matches = ('match_id', 'nunique'),
             Runs = ('batsman_runs', 'sum'),
             Balls = ('batsman_runs', 'count')
         )
         .merge(
-            deliveries
-            .query(f"batting_team == '{team}'")
-            .groupby(by = 'player_dismissed', as_index = False)
+            filters.rows('deliveries', 'batting_team', team)
+            .groupby(by = 'player_dismissed', as_index = False, observed = True)
             .agg(
                 Dismissals = ('is_wicket', 'sum')
             ), left_on = 'batter', right_on = 'player_dismissed', how = 'outer'
@@ -698,9 +576,9 @@ def team_batsman_performance(team):
 #### 2.2.3. Bowler Performance
 def team_bowler_performance(team):
     return (
-        player_analysis.bowler_stats_overall
-        .query(f"bowling_team == '{team}'")
-        .groupby(by = 'bowler', as_index = False)
+        aggregates.table('bowler_spells')
+        .pipe(filters.select, bowling_team = team)
+        .groupby(by = 'bowler', as_index = False, observed = True)
         .agg(
             matches = ('id', 'nunique'),
             wickets = ('wickets', 'sum'),
@@ -735,18 +613,14 @@ def team_bowler_performance(team):
 bowler_dismissal_type = ['caught', 'caught and bowled', 'bowled', 'lbw', 'stumped', 'hit wicket']
 
 def leading_wicket_taker(team_name, seasons='All'):
-    df_team = extract_team(team_name).query(f"(bowling_team == '{team_name}' & is_wicket == 1) & (dismissal_kind in @bowler_dismissal_type)")
-
-    if seasons == 'All':
-        df_filtered = df_team
-    elif isinstance(seasons, list):
-        df_filtered = df_team.query("season in @seasons")
-    else:
-        df_filtered = df_team.query(f"season == '{seasons}'")
+    df_filtered = filters.select(
+        filters.rows('fact', ['team1', 'team2'], team_name, seasons = seasons),
+        bowling_team = team_name, is_wicket = 1, dismissal_kind = bowler_dismissal_type
+    )
 
     return (
         df_filtered
-        .groupby(by = 'bowler', as_index = False)
+        .groupby(by = 'bowler', as_index = False, observed = True)
         .agg(Wickets = ('is_wicket', 'sum'))
         .sort_values(by = 'Wickets', ascending = False, ignore_index = True)
         .rename(columns = {'bowler': 'Bowler'})
@@ -756,50 +630,23 @@ def leading_wicket_taker(team_name, seasons='All'):
 # ------------------------------------------------------------------------------------------------------------------------------------------
 ### 2.3. Rival Teams
 #### 2.3.1. Matches by Rivals & Win %
-def team_swap(row, team_name):
-    if row['team2'] == team_name:
-        row['team2'] = row['team1']
-    return row
-
+# Records against rivals read the team-perspective matches (see scripts/datasets.py): one row per match and side
 def team_record(team_name, seasons = 'All'):
-        if seasons == 'All':
-            df = matches.query(f"team1 == '{team_name}' or team2 == '{team_name}'")
-        elif isinstance(seasons, list):
-            df = matches.query("(team1 == @team_name or team2 == @team_name) and season in @seasons")
-        else:
-            df = matches.query(f"(team1 == '{team_name}' or team2 == '{team_name}') and season == '{seasons}'")
-    
-        return (
-            df
-            .query(f"team1 == '{team_name}' or team2 == '{team_name}'")
-            .groupby(by = ['team1', 'team2', 'match_type', 'winner'], as_index = False)
-            .agg(count = ('id', 'nunique'))
-            .apply(lambda row: team_swap(row, team_name), axis=1)
-            .assign(team1 = team_name)
-        )
+    return (
+        filters.rows('team_matches', 'team', team_name, seasons = seasons)
+        .groupby(by = ['team', 'opponent', 'match_type', 'winner'], as_index = False, observed = True)
+        .agg(count = ('id', 'nunique'))
+        .rename(columns = {'team': 'team1', 'opponent': 'team2'})
+    )
 
 def team_rival_matches(team_name, seasons = 'All'):
     df = (
-        team_record(team_name, seasons = seasons)
-        .groupby(by = ['team1', 'team2'], as_index = False)
-        .agg(num_matches = ('count', 'sum'))
-        .sort_values(by = 'team2', ignore_index = True)
-        .merge(
-            (team_record(team_name, seasons = seasons)
-             .groupby(by = ['team1', 'team2', 'winner'], as_index = False)
-             .agg(matches_won = ('count', 'sum'))
-             .sort_values(by = 'team2')
-             .query(f"winner == '{team_name}'")),
-            on = ['team1', 'team2'], how = 'outer'
-        )
-        .fillna(0)
-        .assign(
-            matches_won = lambda df_: df_['matches_won'].fillna(0).astype('int'),
-            win_percent = lambda df_: round((df_['matches_won']/df_['num_matches'])*100,2)
-            )
-        .drop(columns = ['winner'])
+        filters.rows('team_matches', 'team', team_name, seasons = seasons)
+        .groupby(by = ['team', 'opponent'], as_index = False, observed = True)
+        .agg(num_matches = ('id', 'count'), matches_won = ('won', 'sum'))
+        .assign(win_percent = lambda df_: round((df_['matches_won']/df_['num_matches'])*100,2))
         .sort_values(by = 'win_percent', ascending = False, ignore_index = True)
-        .rename(columns = {'team1': 'Team', 'team2': 'Rival', 'num_matches': 'Total Matches',
+        .rename(columns = {'team': 'Team', 'opponent': 'Rival', 'num_matches': 'Total Matches',
                            'matches_won': 'Matches Won', 'win_percent': 'Win %'})
     )
     df.index = range(1, len(df)+1)
@@ -809,23 +656,12 @@ def team_rival_matches(team_name, seasons = 'All'):
 #### 2.3.2. Matches by Match Type for Rivals & Win %
 def team_rival_matchtype(team_name, rival, seasons = 'All'):
     df = (
-        team_record(team_name, seasons = seasons)
-        .groupby(by = ['team1', 'team2', 'match_type'], as_index = False)
-        .agg(matches_played = ('count', 'sum'))
-        .merge(
-            team_record(team_name, seasons = seasons)
-            .query(f"winner == '{team_name}'")
-            .groupby(by = ['team1', 'team2', 'match_type'], as_index = False)
-            .agg(matches_won = ('count', 'sum')),
-            on = ['team1', 'team2', 'match_type'], how = 'outer'
-        )
-        .assign(
-            matches_won = lambda df_: df_['matches_won'].fillna(0).astype('int'),
-            win_percent = lambda df_: round((df_['matches_won']/df_['matches_played'])*100,2)
-            )
-        .query(f"team2 == '{rival}'")
-        .fillna(0)
-        .rename(columns = {'team1': 'Team', 'team2': 'Rival', 'match_type': ' Match Type',
+        filters.rows('team_matches', 'team', team_name, seasons = seasons)
+        .pipe(filters.select, opponent = rival)
+        .groupby(by = ['team', 'opponent', 'match_type'], as_index = False, observed = True)
+        .agg(matches_played = ('id', 'count'), matches_won = ('won', 'sum'))
+        .assign(win_percent = lambda df_: round((df_['matches_won']/df_['matches_played'])*100,2))
+        .rename(columns = {'team': 'Team', 'opponent': 'Rival', 'match_type': ' Match Type',
                            'matches_played': 'Matches Played', 'matches_won': 'Matches Won', 'win_percent': 'Win %'})
     )
     df.index = range(1, len(df)+1)
@@ -833,12 +669,12 @@ def team_rival_matchtype(team_name, rival, seasons = 'All'):
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
 #### 2.3.3. Performance against Rivals - Summary
-def team_rival_performance(team_name, rival, seasons = 'all'):
+def team_rival_performance(team_name, rival, seasons = 'All'):
     df = (
         team(team_name, seasons = seasons)
-        .query(f"team1 == '{rival}' or team2 == '{rival}'")
+        .pipe(filters.select_any, ['team1', 'team2'], rival)
         .groupby(by = ['season', 'match_type', 'toss_winner', 'toss_decision',
-                       'target_runs', 'winner', 'result_margin', 'result'], as_index = False)
+                       'target_runs', 'winner', 'result_margin', 'result'], as_index = False, observed = True)
         .agg(Matches = ('id', 'nunique'))
         .assign(
             target_runs = lambda df_: df_['target_runs'].astype('int'),